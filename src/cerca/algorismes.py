@@ -0,0 +1,639 @@
+""" Algorismes de cerca sobre un ``cerca.problema.Problema``.
+
+Tots els algorismes guarden nodes amb un punter al pare en lloc de copiar el camí a cada fill,
+de manera que generar un node costa el mateix sigui quina sigui la seva profunditat, i el camí
+només es reconstrueix un cop trobada la meta.
+
+    - ``amplada``: frontera FIFO amb ``collections.deque``. Els estats es marquen com a vists en
+      generar-los, i la meta també es comprova en generar-la.
+    - ``profunditat``: frontera LIFO, amb la mateixa detecció de repetits.
+    - ``bidireccional``: cerca en amplada des de l'inici i des de la meta alhora, un nivell
+      sencer de la frontera més petita cada vegada, fins que es troben.
+    - ``cost_uniforme``, ``primer_millor`` (voraç) i ``a_estrella``: frontera amb ``heapq``
+      ordenada per prioritat i, en cas d'empat, per ordre d'inserció. Un diccionari guarda el
+      millor cost conegut de cada estat, i un fill només s'insereix si millora aquest cost; les
+      entrades del ``heap`` que han quedat obsoletes es descarten en treure-les.
+    - ``costos_meta``: cost uniforme enrere des de la meta sobre tot l'espai d'estats, per
+      construir taules amb la millor acció de cada estat.
+    - ``profunditat_iterativa`` i ``ida_estrella``: aprofundiment iteratiu amb límit de
+      profunditat o de ``f = g + h``, amb una pila explícita i detecció de cicles només sobre
+      el camí actual (memòria lineal en la profunditat, a canvi de tornar a generar nodes).
+    - ``rbfs``: cerca recursiva del primer millor amb una pila explícita, també en memòria
+      lineal; cada nivell recorda la ``f`` revisada dels germans per tornar-hi sense repetir
+      les iteracions senceres de l'IDA*.
+    - ``sma_estrella``: A* amb un màxim de nodes a memòria. Quan s'omple, oblida la fulla
+      pitjor i en guarda la ``f`` al pare, per tornar a generar la branca només si cal.
+"""
+import collections
+import dataclasses
+import functools
+import heapq
+import itertools
+import math
+import time
+
+from cerca.problema import Problema
+
+
+class Node:
+    __slots__ = ("estat", "pare", "accio", "cost", "profunditat")
+
+    def __init__(self, estat, pare=None, accio=None, cost=0):
+        self.estat = estat
+        self.pare = pare
+        self.accio = accio
+        self.cost = cost
+        self.profunditat = 0 if pare is None else pare.profunditat + 1
+
+    def fill(self, problema: Problema, accio, estat):
+        return Node(estat, self, accio, self.cost + problema.cost(self.estat, accio, estat))
+
+    def cami(self) -> list:
+        """ Accions des de l'arrel fins a aquest node. """
+        accions = []
+        node = self
+        while node.pare is not None:
+            accions.append(node.accio)
+            node = node.pare
+        accions.reverse()
+
+        return accions
+
+
+@dataclasses.dataclass
+class Resultat:
+    """ Resultat d'una cerca.
+
+    ``cami`` és la llista d'accions fins a la meta, o None si no s'ha trobat cap solució.
+    ``expandits`` compta els nodes dels quals s'han generat els fills, ``generats`` els nodes
+    creats, ``memoria`` el màxim d'estats guardats alhora i ``temps`` els segons de la cerca.
+    """
+
+    cami: list = None
+    cost: float = None
+    expandits: int = 0
+    generats: int = 0
+    memoria: int = 0
+    temps: float = 0.0
+
+    @property
+    def trobat(self) -> bool:
+        return self.cami is not None
+
+    def solucio(self, node: Node):
+        self.cami = node.cami()
+        self.cost = node.cost
+
+        return self
+
+
+def _cronometra(cerca):
+    """ Desa a ``Resultat.temps`` el temps de la cerca. """
+
+    @functools.wraps(cerca)
+    def cerca_cronometrada(*args, **kwargs):
+        inici = time.perf_counter()
+        resultat = cerca(*args, **kwargs)
+        resultat.temps = time.perf_counter() - inici
+
+        return resultat
+
+    return cerca_cronometrada
+
+
+def _no_informada(problema: Problema, fifo: bool) -> Resultat:
+    resultat = Resultat()
+    arrel = Node(problema.estat_inicial())
+    if problema.es_meta(arrel.estat):
+        return resultat.solucio(arrel)
+
+    frontera = collections.deque([arrel])
+    vists = {arrel.estat}
+    treu = frontera.popleft if fifo else frontera.pop
+    while frontera:
+        node = treu()
+        resultat.expandits += 1
+
+        for accio, estat in problema.successors(node.estat):
+            if estat in vists:
+                continue
+            vists.add(estat)
+
+            fill = node.fill(problema, accio, estat)
+            resultat.generats += 1
+            resultat.memoria = len(vists)
+            if problema.es_meta(estat):
+                return resultat.solucio(fill)
+            frontera.append(fill)
+
+    return resultat
+
+
+@_cronometra
+def amplada(problema: Problema) -> Resultat:
+    """ Cerca en amplada. Troba el camí amb menys accions. """
+    return _no_informada(problema, fifo=True)
+
+
+@_cronometra
+def profunditat(problema: Problema) -> Resultat:
+    """ Cerca en profunditat sobre el graf d'estats. No garanteix el camí més curt. """
+    return _no_informada(problema, fifo=False)
+
+
+@_cronometra
+def bidireccional(problema: Problema) -> Resultat:
+    """ Cerca en amplada bidireccional. Troba el camí amb menys accions.
+
+    El problema ha de definir ``estat_meta`` i ``predecessors``. Cada node de la cerca enrere té
+    com a pare el següent estat cap a la meta, i ``accio`` és l'acció que hi porta. El cost del
+    resultat es calcula amb ``problema.cost``; com a la cerca en amplada, només és el mínim si
+    totes les accions costen el mateix.
+    """
+    resultat = Resultat()
+    inici = Node(problema.estat_inicial())
+    meta = Node(problema.estat_meta())
+    if problema.es_meta(inici.estat):
+        return resultat.solucio(inici)
+
+    davant, darrere = {inici.estat: inici}, {meta.estat: meta}
+    fronteres = {True: [inici], False: [meta]}
+    while fronteres[True] and fronteres[False]:
+        endavant = len(fronteres[True]) <= len(fronteres[False])
+        vists, altres = (davant, darrere) if endavant else (darrere, davant)
+        veinats = problema.successors if endavant else problema.predecessors
+
+        # S'expandeix el nivell sencer i es tria la trobada amb menys accions i, entre aquestes,
+        # la de menor cost.
+        seguent = []
+        trobada = None
+        for node in fronteres[endavant]:
+            resultat.expandits += 1
+            for accio, estat in veinats(node.estat):
+                if estat in vists:
+                    continue
+
+                if endavant:
+                    fill = node.fill(problema, accio, estat)
+                else:
+                    cost = node.cost + problema.cost(estat, accio, node.estat)
+                    fill = Node(estat, node, accio, cost)
+                vists[estat] = fill
+                seguent.append(fill)
+                resultat.generats += 1
+                resultat.memoria = len(davant) + len(darrere)
+
+                if estat in altres:
+                    parella = (fill, altres[estat]) if endavant else (altres[estat], fill)
+                    if trobada is None or _mida_trobada(parella) < _mida_trobada(trobada):
+                        trobada = parella
+
+        if trobada is not None:
+            node_davant, node_darrere = trobada
+            resultat.cami = node_davant.cami()
+            while node_darrere.pare is not None:
+                resultat.cami.append(node_darrere.accio)
+                node_darrere = node_darrere.pare
+            resultat.cost = trobada[0].cost + trobada[1].cost
+
+            return resultat
+
+        fronteres[endavant] = seguent
+
+    return resultat
+
+
+def _mida_trobada(trobada) -> tuple:
+    """ (Accions, cost) del camí que passa per una trobada (node endavant, node enrere). """
+    return (
+        trobada[0].profunditat + trobada[1].profunditat, trobada[0].cost + trobada[1].cost
+    )
+
+
+def _millor_primer(problema: Problema, prioritat) -> Resultat:
+    """ Cerca de millor primer.
+
+    Args:
+        problema: Problema a resoldre.
+        prioritat: Funció (cost del camí, estat) -> prioritat. Es treu primer la menor.
+    """
+    resultat = Resultat()
+    arrel = Node(problema.estat_inicial())
+    ordre = itertools.count()
+
+    frontera = [(prioritat(0, arrel.estat), next(ordre), arrel)]
+    millor_cost = {arrel.estat: 0}
+    while frontera:
+        _, _, node = heapq.heappop(frontera)
+        if node.cost > millor_cost[node.estat]:
+            # S'ha inserit un camí millor cap a aquest estat després d'aquesta entrada.
+            continue
+
+        if problema.es_meta(node.estat):
+            resultat.memoria = len(millor_cost)
+            return resultat.solucio(node)
+        resultat.expandits += 1
+
+        for accio, estat in problema.successors(node.estat):
+            cost = node.cost + problema.cost(node.estat, accio, estat)
+            if cost >= millor_cost.get(estat, math.inf):
+                continue
+            millor_cost[estat] = cost
+
+            fill = Node(estat, node, accio, cost)
+            resultat.generats += 1
+            heapq.heappush(frontera, (prioritat(cost, estat), next(ordre), fill))
+
+    resultat.memoria = len(millor_cost)
+
+    return resultat
+
+
+@_cronometra
+def cost_uniforme(problema: Problema) -> Resultat:
+    """ Cerca de cost uniforme. Troba el camí de cost mínim. """
+    return _millor_primer(problema, lambda cost, estat: cost)
+
+
+@_cronometra
+def primer_millor(problema: Problema) -> Resultat:
+    """ Cerca voraça: ordena la frontera només per l'heurística. No garanteix l'òptim. """
+    return _millor_primer(problema, lambda cost, estat: problema.heuristica(estat))
+
+
+@_cronometra
+def a_estrella(problema: Problema) -> Resultat:
+    """ Cerca A*. Troba el camí de cost mínim si l'heurística és admissible i consistent. """
+    return _millor_primer(problema, lambda cost, estat: cost + problema.heuristica(estat))
+
+
+def costos_meta(problema: Problema) -> dict:
+    """ Cost mínim fins a la meta de tots els estats que hi poden arribar.
+
+    Fa una cerca de cost uniforme enrere des de ``problema.estat_meta()`` amb
+    ``problema.predecessors``, fins a esgotar l'espai d'estats.
+
+    Returns:
+        Diccionari estat -> (cost fins a la meta, primera acció del camí òptim). L'acció de la
+        meta és None.
+    """
+    meta = problema.estat_meta()
+    costos = {meta: (0, None)}
+    ordre = itertools.count()
+    frontera = [(0, next(ordre), meta)]
+    while frontera:
+        cost, _, estat = heapq.heappop(frontera)
+        if cost > costos[estat][0]:
+            continue
+
+        for accio, pare in problema.predecessors(estat):
+            cost_pare = cost + problema.cost(pare, accio, estat)
+            if cost_pare < costos.get(pare, (math.inf,))[0]:
+                costos[pare] = (cost_pare, accio)
+                heapq.heappush(frontera, (cost_pare, next(ordre), pare))
+
+    return costos
+
+
+def _aprofundiment(problema: Problema, valor, limit_maxim=math.inf) -> Resultat:
+    """ Cerques en profunditat successives amb un límit creixent.
+
+    Args:
+        problema: Problema a resoldre.
+        valor: Funció node -> valor. Es tallen els nodes amb un valor més gran que el límit, i el
+            límit següent és el menor valor tallat.
+        limit_maxim: Límit a partir del qual s'abandona la cerca.
+
+    Returns:
+        Resultat sense camí si no hi ha cap meta dins ``limit_maxim`` o si una iteració recorre
+        tots els camins sense ciclar sense tallar-ne cap.
+    """
+    resultat = Resultat()
+    arrel = Node(problema.estat_inicial())
+    if problema.es_meta(arrel.estat):
+        return resultat.solucio(arrel)
+
+    limit = valor(arrel)
+    while limit <= limit_maxim:
+        seguent = math.inf
+
+        # Cada nivell de la pila té el node i l'iterador dels seus successors pendents.
+        pila = [(arrel, iter(problema.successors(arrel.estat)))]
+        en_cami = {arrel.estat}
+        resultat.expandits += 1
+        while pila:
+            node, successors = pila[-1]
+            accio_estat = next(successors, None)
+            if accio_estat is None:
+                pila.pop()
+                en_cami.discard(node.estat)
+                continue
+
+            accio, estat = accio_estat
+            if estat in en_cami:
+                continue
+
+            fill = node.fill(problema, accio, estat)
+            resultat.generats += 1
+            f = valor(fill)
+            if f > limit:
+                seguent = min(seguent, f)
+                continue
+            if problema.es_meta(estat):
+                return resultat.solucio(fill)
+
+            pila.append((fill, iter(problema.successors(estat))))
+            en_cami.add(estat)
+            resultat.expandits += 1
+            resultat.memoria = max(resultat.memoria, len(pila))
+
+        if seguent == math.inf:
+            # No s'ha tallat cap node: tots els camins s'han recorregut sense trobar la meta.
+            break
+        limit = seguent
+
+    return resultat
+
+
+@_cronometra
+def profunditat_iterativa(problema: Problema, profunditat_maxima=math.inf) -> Resultat:
+    """ Cerca en profunditat iterativa. Troba el camí amb menys accions.
+
+    Args:
+        problema: Problema a resoldre.
+        profunditat_maxima: Nombre màxim d'accions del camí.
+    """
+    return _aprofundiment(problema, lambda node: node.profunditat, profunditat_maxima)
+
+
+@_cronometra
+def ida_estrella(problema: Problema) -> Resultat:
+    """ Cerca IDA*. Troba el camí de cost mínim si l'heurística és admissible.
+
+    Cada iteració és una cerca en profunditat que talla els nodes amb ``f`` més gran que el
+    límit; el límit següent és la menor ``f`` tallada.
+    """
+    return _aprofundiment(problema, lambda node: node.cost + problema.heuristica(node.estat))
+
+
+@_cronometra
+def rbfs(problema: Problema) -> Resultat:
+    """ Cerca recursiva de millor primer (RBFS). Troba el camí de cost mínim si l'heurística és
+    admissible.
+
+    Només guarda els germans dels nodes del camí actual. Cada nivell recorda la ``f`` de cada
+    fill (la més gran entre la pròpia i la del pare); quan el millor fill supera el límit, el
+    nivell es descarta i el pare guarda aquesta ``f`` com a valor del fill. La recursió es fa amb
+    una pila explícita.
+    """
+    resultat = Resultat()
+    arrel = Node(problema.estat_inicial())
+    if problema.es_meta(arrel.estat):
+        return resultat.solucio(arrel)
+
+    def expandeix(node, f_node):
+        resultat.expandits += 1
+        fills = []
+        for accio, estat in problema.successors(node.estat):
+            if estat in en_cami:
+                continue
+            fill = node.fill(problema, accio, estat)
+            resultat.generats += 1
+            fills.append([max(fill.cost + problema.heuristica(estat), f_node), fill])
+
+        return fills
+
+    # Cada nivell de la pila té el node, els seus fills amb la seva f i el límit.
+    en_cami = {arrel.estat}
+    pila = [(arrel, expandeix(arrel, problema.heuristica(arrel.estat)), math.inf)]
+    guardats = len(pila[0][1])
+    while pila:
+        node, fills, limit = pila[-1]
+        fills.sort(key=lambda f_fill: f_fill[0])
+        if not fills or fills[0][0] > limit or fills[0][0] == math.inf:
+            # Torna al pare amb la millor f d'aquest nivell. Si és infinita, cap fill no porta a
+            # la meta, i a l'arrel la cerca falla.
+            pila.pop()
+            en_cami.discard(node.estat)
+            guardats -= len(fills)
+            if pila:
+                pila[-1][1][0][0] = fills[0][0] if fills else math.inf
+            continue
+
+        f_millor, millor = fills[0]
+        if problema.es_meta(millor.estat):
+            resultat.memoria = max(resultat.memoria, guardats)
+            return resultat.solucio(millor)
+
+        alternativa = fills[1][0] if len(fills) > 1 else math.inf
+        en_cami.add(millor.estat)
+        pila.append((millor, expandeix(millor, f_millor), min(limit, alternativa)))
+        guardats += len(pila[-1][1])
+        resultat.memoria = max(resultat.memoria, guardats)
+
+    return resultat
+
+
+class _NodeSMA(Node):
+    __slots__ = (
+        "f", "index", "successors", "f_fills", "fills", "versio", "viu", "a_frontera", "a_fulles"
+    )
+
+    def __init__(self, estat, pare=None, accio=None, cost=0, f=0, index=None):
+        super(_NodeSMA, self).__init__(estat, pare, accio, cost)
+        self.f = f
+        self.index = index
+        self.successors = None
+        self.f_fills = None
+        self.fills = {}
+        self.versio = 0
+        self.viu = True
+        # Si hi ha una entrada de la versió actual a ``frontera`` i a ``fulles``.
+        self.a_frontera = False
+        self.a_fulles = False
+
+
+@_cronometra
+def sma_estrella(problema: Problema, max_nodes: int = 10_000) -> Resultat:
+    """ Cerca A* simplificada amb memòria limitada (SMA*).
+
+    Com A*, però amb com a molt ``max_nodes`` nodes a memòria. Un node expandit guarda la ``f``
+    de cada successor, i els fills es creen d'un en un: el node de la frontera amb el millor
+    successor que no és a memòria crea aquest successor. Quan es supera el límit, s'oblida la
+    fulla amb més ``f`` (la menys profunda, en cas d'empat), i el pare en guarda la ``f``, de
+    manera que la branca es pot tornar a generar més endavant amb el valor après. Les ``f`` es
+    propaguen cap amunt com el mínim de les dels fills. Un successor es descarta si el seu estat
+    ja és a memòria amb un cost igual o menor; com que els avantpassats d'un node sempre hi són i
+    els costos no són negatius, això també descarta els cicles.
+
+    Les cues de prioritat no s'actualitzen: cada canvi d'un node hi afegeix una entrada nova i
+    deixa obsoleta l'anterior. Es compten les entrades obsoletes i, quan superen les vàlides, la
+    cua es reconstrueix només amb les vàlides, de manera que cada cua té com a molt el doble
+    d'entrades que nodes a memòria. ``memoria`` compta els nodes i les entrades de les cues.
+
+    Troba el camí de cost mínim si l'heurística és admissible i el camí òptim cap dins el límit.
+    """
+    resultat = Resultat()
+    ordre = itertools.count()
+    arrel = _NodeSMA(problema.estat_inicial())
+    arrel.f = problema.heuristica(arrel.estat)
+
+    # Entrades (prioritat, -profunditat, ordre, versió, node) i (-f, profunditat, ordre, versió,
+    # node); una entrada és obsoleta si el node ha canviat de versió o s'ha oblidat.
+    frontera = []
+    fulles = []
+    # Entrades obsoletes de ``frontera`` i de ``fulles``.
+    obsoletes = [0, 0]
+    en_memoria = 1
+    # Nodes a memòria de cada estat.
+    vius = {arrel.estat: [arrel]}
+
+    def compacta(cua, i):
+        """ Reconstrueix ``cua`` sense les entrades obsoletes si n'hi ha més que de vàlides. """
+        if 2 * obsoletes[i] <= len(cua):
+            return
+        cua[:] = [
+            entrada for entrada in cua if entrada[-1].viu and entrada[3] == entrada[-1].versio
+        ]
+        heapq.heapify(cua)
+        obsoletes[i] = 0
+
+    def invalida(node):
+        """ Marca com a obsoletes les entrades de la versió actual de ``node``. """
+        obsoletes[0] += node.a_frontera
+        obsoletes[1] += node.a_fulles
+        node.a_frontera = node.a_fulles = False
+
+    def allibera(node):
+        node.viu = False
+        invalida(node)
+        nodes = vius[node.estat]
+        nodes.remove(node)
+        if not nodes:
+            del vius[node.estat]
+
+    def actualitza(node):
+        invalida(node)
+        node.versio += 1
+        if node.successors is None:
+            prioritat = node.f
+        else:
+            prioritat = min(
+                (f for i, f in enumerate(node.f_fills) if i not in node.fills), default=math.inf
+            )
+        if prioritat < math.inf:
+            entrada = (prioritat, -node.profunditat, next(ordre), node.versio, node)
+            heapq.heappush(frontera, entrada)
+            node.a_frontera = True
+        if not node.fills:
+            heapq.heappush(fulles, (-node.f, node.profunditat, next(ordre), node.versio, node))
+            node.a_fulles = True
+        compacta(frontera, 0)
+        compacta(fulles, 1)
+
+    def propaga(node):
+        """ Actualitza la ``f`` de ``node`` amb la dels fills, i la dels avantpassats. """
+        while node is not None:
+            nova = max(node.f, min(node.f_fills, default=math.inf))
+            canvia = nova != node.f
+            node.f = nova
+            actualitza(node)
+            if not canvia or node.pare is None:
+                break
+            node.pare.f_fills[node.index] = node.f
+            node = node.pare
+
+    def oblida(protegida):
+        """ Oblida la pitjor fulla, sense comptar l'arrel ni ``protegida``. Retorna False si no
+        n'hi ha cap.
+        """
+        protegides = []
+        oblidada = False
+        while fulles:
+            entrada = heapq.heappop(fulles)
+            fulla = entrada[-1]
+            if not fulla.viu or entrada[3] != fulla.versio:
+                obsoletes[1] -= 1
+                continue
+            fulla.a_fulles = False
+            if fulla.fills:
+                continue
+            if fulla.pare is None or fulla is protegida:
+                protegides.append(entrada)
+                continue
+
+            pare = fulla.pare
+            del pare.fills[fulla.index]
+            pare.f_fills[fulla.index] = fulla.f
+            allibera(fulla)
+            actualitza(pare)
+            oblidada = True
+            break
+
+        for entrada in protegides:
+            heapq.heappush(fulles, entrada)
+            entrada[-1].a_fulles = True
+
+        return oblidada
+
+    actualitza(arrel)
+    while frontera:
+        _, _, _, versio, node = heapq.heappop(frontera)
+        if not node.viu or versio != node.versio:
+            obsoletes[0] -= 1
+            continue
+        node.a_frontera = False
+
+        if node.successors is None:
+            if problema.es_meta(node.estat):
+                return resultat.solucio(node)
+
+            resultat.expandits += 1
+            node.successors = list(problema.successors(node.estat))
+            node.f_fills = []
+            for accio, estat in node.successors:
+                cost = node.cost + problema.cost(node.estat, accio, estat)
+                if any(altre.cost <= cost for altre in vius.get(estat, ())):
+                    node.f_fills.append(math.inf)
+                    continue
+                node.f_fills.append(max(node.f, cost + problema.heuristica(estat)))
+            propaga(node)
+            continue
+
+        # Crea el millor successor que no és a memòria.
+        index = min(
+            (i for i in range(len(node.successors)) if i not in node.fills),
+            key=lambda i: node.f_fills[i],
+        )
+        accio, estat = node.successors[index]
+        fill = _NodeSMA(
+            estat,
+            node,
+            accio,
+            node.cost + problema.cost(node.estat, accio, estat),
+            node.f_fills[index],
+            index,
+        )
+        node.fills[index] = fill
+        en_memoria += 1
+        resultat.generats += 1
+        vius.setdefault(estat, []).append(fill)
+
+        if en_memoria > max_nodes:
+            # Els avantpassats del fill no són fulles: només cal protegir el fill.
+            if oblida(fill):
+                en_memoria -= 1
+            else:
+                # El camí sencer ocupa tota la memòria: aquest fill no hi cap.
+                del node.fills[index]
+                node.f_fills[index] = math.inf
+                allibera(fill)
+                en_memoria -= 1
+                propaga(node)
+                continue
+
+        actualitza(node)
+        actualitza(fill)
+        resultat.memoria = max(resultat.memoria, en_memoria + len(frontera) + len(fulles))
+
+    return resultat
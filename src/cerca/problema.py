@@ -0,0 +1,51 @@
+""" Interfície dels problemes de cerca de ``cerca.algorismes``.
+
+Un problema defineix l'estat inicial, els successors de cada estat, la meta, el cost de cada
+acció i, per a les cerques informades, una heurística. Els estats han de ser hashables i
+comparables amb ``==``, perquè els algorismes detecten els estats repetits amb diccionaris i
+conjunts.
+"""
+import abc
+
+
+class Problema(abc.ABC):
+    @abc.abstractmethod
+    def estat_inicial(self):
+        pass
+
+    @abc.abstractmethod
+    def successors(self, estat):
+        """ Successors d'un estat.
+
+        Args:
+            estat: Estat del problema.
+
+        Returns:
+            Iterable de tuples (acció, estat fill) amb els fills legals.
+        """
+        pass
+
+    @abc.abstractmethod
+    def es_meta(self, estat) -> bool:
+        pass
+
+    def cost(self, estat, accio, fill) -> float:
+        """ Cost d'aplicar ``accio`` a ``estat``. Per defecte, totes les accions costen 1. """
+        return 1
+
+    def heuristica(self, estat) -> float:
+        """ Estimació del cost fins a la meta. Per defecte, 0 (cerca no informada). """
+        return 0
+
+    def estat_meta(self):
+        """ Estat meta, per a les cerques que també avancen des de la meta. """
+        raise NotImplementedError
+
+    def predecessors(self, estat):
+        """ Predecessors d'un estat, per a les cerques que també avancen des de la meta.
+
+        Returns:
+            Iterable de tuples (acció, estat pare) tals que ``successors(pare)`` conté
+            ``(acció, estat)``.
+        """
+        raise NotImplementedError
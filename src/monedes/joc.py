@@ -7,10 +7,10 @@ from iaLib import agent, joc
 
 
 class Moneda(joc.Joc):
-    def __init__(self, agents: list[agent.Agent], random_order: bool = False):
-        super(Moneda, self).__init__(agents, (800, 512), title="Casa")
-
-        monedes = "CXCX "
+    def __init__(
+            self, agents: list[agent.Agent], random_order: bool = False, monedes: str = "CXCX "
+    ):
+        super(Moneda, self).__init__(agents, (len(monedes) * 150 + 50, 512), title="Casa")
 
         if random_order:
             monedes = ''.join(random.sample(monedes, len(monedes)))
@@ -1,5 +1,6 @@
-from queue import PriorityQueue
-from monedes.solucio.estat import Estat
+from cerca import algorismes
+from monedes.solucio import pdb, taula
+from monedes.solucio.problema import ProblemaMonedes
 
 from iaLib import agent
 
@@ -7,45 +8,64 @@ SOLUCIO = " XXXC"
 
 
 class AgentMoneda(agent.Agent):
-    def __init__(self):
+    def __init__(
+            self,
+            algorisme=None,
+            solucio: str = SOLUCIO,
+            usa_taula: bool = False,
+            mida_patro: int = None,
+    ):
+        """ Agent que juga la seqüència d'accions de menys cost.
+
+        Args:
+            algorisme: Funció de ``cerca.algorismes`` que resol el problema. Per defecte, A*.
+            solucio: Filera meta.
+            usa_taula: Booleà indicant si cada acció es consulta a ``monedes.solucio.taula`` en
+                lloc de cercar. La taula es carrega (o es genera) a la primera acció.
+            mida_patro: Si no és None, la cerca empra una base de patrons amb patrons d'aquesta
+                mida (``monedes.solucio.pdb``).
+
+        Raises:
+            ValueError: Si ``usa_taula`` es combina amb ``algorisme`` o ``mida_patro``, que només
+                afecten la cerca.
+        """
+        if usa_taula and (algorisme is not None or mida_patro is not None):
+            raise ValueError("La taula no cerca: no admet ni algorisme ni mida_patro")
+        if algorisme is None:
+            algorisme = algorismes.a_estrella
+
         super().__init__(long_memoria=0)
-        self.__frontera = None
-        self.__tancats = None
         self.__accions = None
+        self.__algorisme = algorisme
+        self.__solucio = solucio
+        self.__usa_taula = usa_taula
+        self.__taula = None
+        self.__patrons = None
+        if mida_patro is not None:
+            self.__patrons = pdb.base_patrons(solucio, mida_patro)
+        self.resultat = None
 
     def pinta(self, display):
         print(self._posicio_pintar)
 
-    def cerca(self, estat_inicial):
-        self.__frontera = PriorityQueue()
-        self.__tancats = set()
-
-        self.__frontera.put((estat_inicial.calc_heuristica(), estat_inicial))
-
-        actual = None
-        while not self.__frontera.empty():
-            _, actual = self.__frontera.get()
-            if actual in self.__tancats:
-                continue
-
-            if actual.es_meta():
-                break
-
-            estats_fills = actual.genera_fills()
-
-            for estat_f in estats_fills:
-                self.__frontera.put((estat_f.calc_heuristica(), estat_f))
-
-            self.__tancats.add(actual)
-
-        if actual.es_meta():
-            self.__accions = actual.accions_previes
+    def cerca(self, monedes: str):
+        """ Resol el problema des de ``monedes``. Les mesures de la cerca queden a ``resultat``. """
+        self.resultat = self.__algorisme(ProblemaMonedes(monedes, self.__solucio, self.__patrons))
+        if self.resultat.trobat:
+            self.__accions = self.resultat.cami
 
     def actua(self, percepcio):
-        estat_inicial = Estat(list(percepcio["Monedes"]), 0)
+        if self.__usa_taula:
+            if self.__taula is None:
+                self.__taula = taula.carrega(self.__solucio)
+            consulta = self.__taula.consulta(percepcio["Monedes"])
+            if consulta is None or consulta[0] is None:
+                return "R"
+
+            return consulta[0]
 
         if self.__accions is None:
-            self.cerca(estat_inicial)
+            self.cerca(percepcio["Monedes"])
 
         if self.__accions:
             acc = self.__accions.pop(0)
@@ -0,0 +1,70 @@
+""" Comparació de les cerques de ``AgentMoneda`` sobre el problema de les monedes.
+
+Per a cada instància (filera inicial, solució) mostra el cost de la solució, els nodes expandits
+i generats, el màxim d'estats guardats alhora i el temps de cada cerca, amb l'heurística de
+``ProblemaMonedes`` i, a l'A*, també amb la base de patrons de ``monedes.solucio.pdb``.
+
+Ús:
+    PYTHONPATH=src python -m monedes.solucio.comparacio
+"""
+from cerca import algorismes
+from monedes.solucio import pdb
+from monedes.solucio.estat import SOLUCIO
+from monedes.solucio.problema import ProblemaMonedes
+
+INSTANCIES = (("CXCX ", SOLUCIO), ("XXC C", SOLUCIO), ("CXC XCX", "XCX CXC"))
+MIDA_PATRO = 4
+
+CERQUES = (
+    ("cost uniforme", algorismes.cost_uniforme, False),
+    ("A*", algorismes.a_estrella, False),
+    ("A* amb patrons", algorismes.a_estrella, True),
+    ("IDA*", algorismes.ida_estrella, False),
+    ("RBFS", algorismes.rbfs, False),
+    ("SMA*", algorismes.sma_estrella, False),
+)
+
+
+def compara(instancies=INSTANCIES):
+    """ Executa totes les cerques sobre cada instància.
+
+    Returns:
+        Llista de diccionaris amb la instància, la cerca i les mesures.
+    """
+    files = []
+    for monedes, solucio in instancies:
+        for nom, cerca, patrons in CERQUES:
+            base = pdb.base_patrons(solucio, MIDA_PATRO) if patrons else None
+            resultat = cerca(ProblemaMonedes(monedes, solucio, base))
+
+            files.append(
+                {
+                    "monedes": monedes,
+                    "solucio": solucio,
+                    "cerca": nom,
+                    "cost": resultat.cost,
+                    "expandits": resultat.expandits,
+                    "generats": resultat.generats,
+                    "memoria": resultat.memoria,
+                    "temps": resultat.temps,
+                }
+            )
+
+    return files
+
+
+def main():
+    print(
+        f"{'inici':<10}{'solució':<10}{'cerca':<16}{'cost':>6}{'expandits':>12}{'generats':>12}"
+        f"{'memòria':>10}{'temps (ms)':>12}"
+    )
+    for fila in compara():
+        print(
+            f"{repr(fila['monedes']):<10}{repr(fila['solucio']):<10}{fila['cerca']:<16}"
+            f"{str(fila['cost']):>6}{fila['expandits']:>12}{fila['generats']:>12}"
+            f"{fila['memoria']:>10}{fila['temps'] * 1000:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
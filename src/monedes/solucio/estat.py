@@ -1,15 +1,14 @@
-import copy
-
 SOLUCIO = " XXXC"
 
 class Estat:
 
-    def __init__(self, info, pes: int, accions_previes: list = None):
+    def __init__(self, info, pes: int, accions_previes: list = None, solucio: str = SOLUCIO):
         if accions_previes is None:
             accions_previes = []
 
         self.pes = pes
         self.accions_previes = accions_previes
+        self.solucio = solucio
 
         self.__info = info
 
@@ -19,18 +18,18 @@ class Estat:
         pos_blanc = self.__pos_lliure()
 
         # Girar
-        for pos in range(0, 5):
+        for pos in range(0, len(self.__info)):
             if pos != pos_blanc:
                 acc_possibles.append(("G", pos))
 
         # Desplaçar
         for desp in (1, -1):
-            if 0 <= (pos_blanc + desp) < 5:
+            if 0 <= (pos_blanc + desp) < len(self.__info):
                 acc_possibles.append(("D", (pos_blanc + desp)))
 
         # Botar
         for desp in (2, -2):
-            if 0 <= (pos_blanc + desp) < 5:
+            if 0 <= (pos_blanc + desp) < len(self.__info):
                 acc_possibles.append(("B", (pos_blanc + desp)))
 
         return acc_possibles
@@ -62,13 +61,13 @@ class Estat:
             Boolean: True si l'estat és meta, False en cas contrari.
         """
         es_meta = True
-        for moneda, sol in zip(self.__info, SOLUCIO):
+        for moneda, sol in zip(self.__info, self.solucio):
             es_meta = es_meta and (moneda == sol)
 
         return es_meta
 
     def transicio(self, acc):
-        nou_estat = copy.deepcopy(self)
+        nou_estat = Estat(list(self.__info), self.pes, list(self.accions_previes), self.solucio)
         acc, pos = acc
         pes = 0
 
@@ -99,16 +98,30 @@ class Estat:
 
         return fills
 
-    def calc_heuristica(self):
-        pos = self.__pos_lliure()
-        heuristica = 0
-        for lletra_es, lletra_sol in zip(self.__info, SOLUCIO):
-            if lletra_sol != " ":
-                heuristica += int(lletra_es != lletra_sol)
+    def heuristica(self):
+        """ Estimació admissible i consistent del cost fins a la meta.
 
-        heuristica += pos
+        És el màxim de dues cotes. Cada desplaçament o bot costa 2 i mou el blanc com a molt dues
+        posicions, de manera que dur el blanc a la posició de la solució costa almenys
+        ``2 * ceil(distància / 2)``. Cada acció (girar costa 1) arregla com a molt una de les
+        posicions que no coincideixen amb la solució. Cap acció no redueix cap de les dues cotes
+        més que el seu cost, i per tant el màxim és consistent.
 
-        return heuristica + self.pes
+        Returns:
+            Enter amb el cost mínim estimat.
+        """
+        distancia = abs(self.__pos_lliure() - self.solucio.index(" "))
+        diferents = sum(
+            int(lletra_es != lletra_sol)
+            for lletra_es, lletra_sol in zip(self.__info, self.solucio)
+            if lletra_sol != " "
+        )
+
+        return max(2 * ((distancia + 1) // 2), diferents)
+
+    def calc_heuristica(self):
+        """ Valor ``f`` de l'estat: el pes acumulat més l'heurística. """
+        return self.pes + self.heuristica()
 
     def __str__(self):
         return str(self.__info)
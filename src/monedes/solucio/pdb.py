@@ -0,0 +1,148 @@
+""" Bases de dades de patrons additives per a ``ProblemaMonedes``.
+
+Les posicions de la filera es reparteixen en patrons disjunts. L'abstracció d'un patró només
+recorda la posició del blanc i la cara de les monedes que ocupen les posicions del patró; les
+altres monedes s'obliden, i una moneda que entra al patró des de fora pot tenir qualsevol cara.
+
+El cost de cada acció es reparteix entre els patrons: girar una moneda costa 1 al patró de la
+seva posició, i desplaçar-la o botar-la costa 1 al patró de la posició d'origen i 1 al de la
+posició del blanc. Així la suma dels costos repartits d'un camí és el seu cost real, i la suma
+dels costos mínims de cada abstracció és una heurística admissible i consistent.
+
+Cada abstracció es resol sencera amb una cerca de cost uniforme des de la meta (les accions
+abstractes són reversibles i costen el mateix en tots dos sentits), i el resultat es guarda en
+un array de NumPy indexat per ``blanc * 2 ** mida_patro + cares``, on el bit ``i`` de ``cares``
+és 1 si la moneda de la ``i``-èsima posició del patró és creu.
+"""
+import functools
+import heapq
+
+import numpy as np
+
+from monedes.solucio.problema import CODIS, ProblemaMonedes
+
+SENSE_COST = np.iinfo(np.uint16).max
+
+
+class BasePatrons:
+    def __init__(self, solucio: str, patrons):
+        """ Construeix i resol les abstraccions.
+
+        Args:
+            solucio: Filera meta.
+            patrons: Seqüència de tuples de posicions, disjuntes entre elles.
+        """
+        posicions = [pos for patro in patrons for pos in patro]
+        if len(posicions) != len(set(posicions)):
+            raise ValueError("Els patrons han de ser disjunts")
+
+        self.solucio = solucio
+        self.mida = len(solucio)
+        self.patrons = [tuple(patro) for patro in patrons]
+        self.__bits_blanc = ProblemaMonedes(solucio, solucio).bits_blanc
+
+        self.taules = [self.__resol(patro) for patro in self.patrons]
+        self.__valors = [taula.tolist() for taula in self.taules]
+        self.__octets = [self.__taules_octets(patro) for patro in self.patrons]
+
+    def __cares_meta(self, patro):
+        return sum(
+            1 << i for i, pos in enumerate(patro) if self.solucio[pos] == "X"
+        )
+
+    def __successors(self, patro, indexs, blanc, cares):
+        """ Successors abstractes, amb el cost que correspon al patró. """
+        for pos in patro:
+            if pos != blanc:
+                yield blanc, cares ^ (1 << indexs[pos]), 1
+
+        for salt in (1, -1, 2, -2):
+            pos = blanc + salt
+            if not 0 <= pos < self.mida:
+                continue
+
+            gira = int(abs(salt) == 2)
+            noves = cares
+            cara = None
+            if pos in indexs:
+                cara = ((noves >> indexs[pos]) & 1) ^ gira
+                noves &= ~(1 << indexs[pos])
+            cost = int(pos in indexs) + int(blanc in indexs)
+
+            if blanc not in indexs:
+                yield pos, noves, cost
+            elif cara is not None:
+                yield pos, noves | (cara << indexs[blanc]), cost
+            else:
+                # La moneda ve de fora del patró: pot tenir qualsevol cara.
+                yield pos, noves, cost
+                yield pos, noves | (1 << indexs[blanc]), cost
+
+    def __resol(self, patro):
+        k = len(patro)
+        indexs = {pos: i for i, pos in enumerate(patro)}
+        costos = [SENSE_COST] * (self.mida << k)
+
+        meta = (self.solucio.index(" ") << k) | self.__cares_meta(patro)
+        costos[meta] = 0
+        frontera = [(0, meta)]
+        while frontera:
+            cost, index = heapq.heappop(frontera)
+            if cost > costos[index]:
+                continue
+
+            blanc, cares = index >> k, index & ((1 << k) - 1)
+            for blanc_fill, cares_fill, cost_accio in self.__successors(
+                    patro, indexs, blanc, cares
+            ):
+                fill = (blanc_fill << k) | cares_fill
+                if cost + cost_accio < costos[fill]:
+                    costos[fill] = cost + cost_accio
+                    heapq.heappush(frontera, (cost + cost_accio, fill))
+
+        return np.array(costos, dtype=np.uint16)
+
+    def __taules_octets(self, patro):
+        """ Contribució a ``cares`` de cada octet de les caselles d'un estat.
+
+        Cada octet conté 4 caselles de 2 bits; una casella és creu si té actiu el bit alt.
+        """
+        octets = []
+        for inici in range(0, self.mida, 4):
+            taula = []
+            for octet in range(256):
+                cares = 0
+                for i, pos in enumerate(patro):
+                    if not inici <= pos < inici + 4:
+                        continue
+                    if (octet >> (2 * (pos - inici))) & 3 == CODIS["X"]:
+                        cares |= 1 << i
+                taula.append(cares)
+            octets.append(taula)
+
+        return octets
+
+    def valor(self, estat: int) -> int:
+        """ Suma dels costos de totes les abstraccions d'un estat de ``ProblemaMonedes``. """
+        blanc = estat & ((1 << self.__bits_blanc) - 1)
+        caselles = estat >> self.__bits_blanc
+
+        total = 0
+        for patro, valors, octets in zip(self.patrons, self.__valors, self.__octets):
+            cares = 0
+            for j, taula in enumerate(octets):
+                cares |= taula[(caselles >> (8 * j)) & 255]
+            total += valors[(blanc << len(patro)) | cares]
+
+        return total
+
+
+@functools.cache
+def base_patrons(solucio: str, mida_patro: int = 8) -> BasePatrons:
+    """ Base de patrons de posicions consecutives de ``mida_patro`` caselles. """
+    patrons = [
+        tuple(range(inici, min(inici + mida_patro, len(solucio))))
+        for inici in range(0, len(solucio), mida_patro)
+    ]
+
+    return BasePatrons(solucio, patrons)
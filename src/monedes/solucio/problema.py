@@ -0,0 +1,115 @@
+""" Problema de les monedes per als algorismes de ``cerca``.
+
+Versió general per a una filera de qualsevol longitud i qualsevol solució. Cada estat és un
+enter: la posició del blanc ocupa els ``bits_blanc`` bits baixos i, a sobre, cada casella ocupa
+2 bits (0 blanc, 1 cara "C", 2 creu "X"). Girar una moneda és fer un XOR amb 3 a la seva
+casella, i desplaçar-la o botar-la és moure els seus 2 bits a la casella del blanc.
+
+Les accions són les mateixes tuples que ``Estat.accions_possibles`` i en el mateix ordre:
+("G", posició), ("D", posició) i ("B", posició), on la posició és la de la moneda que es mou.
+"""
+from cerca.problema import Problema
+from monedes.solucio.estat import SOLUCIO
+
+CODIS = {" ": 0, "C": 1, "X": 2}
+LLETRES = " CX"
+
+GIRAR, DESPLACAR, BOTAR = "G", "D", "B"
+COSTOS = {GIRAR: 1, DESPLACAR: 2, BOTAR: 2}
+
+
+class ProblemaMonedes(Problema):
+    def __init__(self, monedes: str, solucio: str = SOLUCIO, patrons=None):
+        """ Problema de les monedes.
+
+        Args:
+            monedes: Filera inicial, amb un sol blanc.
+            solucio: Filera meta, de la mateixa longitud.
+            patrons: ``pdb.BasePatrons`` de la mateixa solució per reforçar l'heurística, o None.
+        """
+        if len(monedes) != len(solucio) or monedes.count(" ") != 1 or solucio.count(" ") != 1:
+            raise ValueError("Les fileres han de tenir la mateixa longitud i un sol blanc")
+
+        self.mida = len(solucio)
+        self.solucio = solucio
+        self.bits_blanc = max(1, (self.mida - 1).bit_length())
+        self.mascara_blanc = (1 << self.bits_blanc) - 1
+
+        self.__meta = self.codifica(solucio)
+        self.__blanc_meta = solucio.index(" ")
+        self.__caselles_meta = self.__meta >> self.bits_blanc
+        # Bit baix de cada casella, excepte la del blanc de la solució.
+        self.__bits_baixos = sum(
+            1 << (2 * pos) for pos in range(self.mida) if pos != self.__blanc_meta
+        )
+        self.__estat_inicial = self.codifica(monedes)
+        self.patrons = patrons
+
+    def codifica(self, monedes: str) -> int:
+        caselles = 0
+        for pos, lletra in enumerate(monedes):
+            caselles |= CODIS[lletra] << (2 * pos)
+
+        return (caselles << self.bits_blanc) | monedes.index(" ")
+
+    def descodifica(self, estat: int) -> str:
+        caselles = estat >> self.bits_blanc
+
+        return "".join(LLETRES[(caselles >> (2 * pos)) & 3] for pos in range(self.mida))
+
+    def estat_inicial(self):
+        return self.__estat_inicial
+
+    def estat_meta(self):
+        return self.__meta
+
+    def es_meta(self, estat: int) -> bool:
+        return estat == self.__meta
+
+    def cost(self, estat, accio, fill) -> float:
+        return COSTOS[accio[0]]
+
+    def successors(self, estat: int):
+        blanc = estat & self.mascara_blanc
+        caselles = estat >> self.bits_blanc
+        bits_blanc = self.bits_blanc
+
+        for pos in range(self.mida):
+            if pos != blanc:
+                yield (GIRAR, pos), estat ^ (3 << (2 * pos + bits_blanc))
+
+        for accio, salts in ((DESPLACAR, (1, -1)), (BOTAR, (2, -2))):
+            for salt in salts:
+                pos = blanc + salt
+                if not 0 <= pos < self.mida:
+                    continue
+
+                moneda = (caselles >> (2 * pos)) & 3
+                if accio == BOTAR:
+                    moneda ^= 3
+                noves = (caselles & ~(3 << (2 * pos))) | (moneda << (2 * blanc))
+                yield (accio, pos), (noves << bits_blanc) | pos
+
+    def predecessors(self, estat: int):
+        # Girar es desfà girant la mateixa moneda. Desplaçar o botar la moneda de ``pos`` al blanc
+        # es desfà movent-la (i girant-la, si bota) de nou al blanc, que ara és a ``pos``: al pare
+        # l'acció és la de la moneda que ocupa el blanc actual.
+        blanc = estat & self.mascara_blanc
+        for (accio, pos), pare in self.successors(estat):
+            yield (accio, pos if accio == GIRAR else blanc), pare
+
+    def heuristica(self, estat: int) -> float:
+        """ La mateixa cota admissible i consistent que ``Estat.heuristica``.
+
+        Amb una base de patrons, el màxim d'aquesta cota i la suma dels patrons, que també és
+        consistent.
+        """
+        distancia = abs((estat & self.mascara_blanc) - self.__blanc_meta)
+        diferencia = (estat >> self.bits_blanc) ^ self.__caselles_meta
+        diferents = ((diferencia | (diferencia >> 1)) & self.__bits_baixos).bit_count()
+        heuristica = max(2 * ((distancia + 1) // 2), diferents)
+
+        if self.patrons is not None:
+            heuristica = max(heuristica, self.patrons.valor(estat))
+
+        return heuristica
@@ -0,0 +1,109 @@
+""" Taula amb la millor acció de cada configuració de les monedes.
+
+Una sola cerca de cost uniforme enrere des de la solució (``cerca.algorismes.costos_meta``)
+dona el cost mínim i la primera acció òptima de totes les configuracions. La taula les guarda
+en un array de ``uint16`` de forma (configuracions, 2), amb una fila per configuració:
+
+    - Rang de la configuració: ``blanc * 2 ** (mida - 1) + monedes``, on el bit ``i`` de
+      ``monedes`` és 1 si la ``i``-èsima moneda (d'esquerra a dreta, sense el blanc) és creu.
+    - Columna 0: acció, codificada com ``tipus * mida + posició`` amb els tipus "G", "D", "B"
+      (``SENSE_ACCIO`` a la solució i a les configuracions que no hi poden arribar).
+    - Columna 1: cost fins a la solució (``SENSE_ACCIO`` si no hi pot arribar).
+
+Amb cinc monedes són 80 configuracions (320 bytes). El fitxer no es guarda al repositori: es
+genera la primera vegada que es carrega, o amb:
+
+    PYTHONPATH=src python -m monedes.solucio.taula
+"""
+import functools
+from pathlib import Path
+
+import numpy as np
+
+from cerca import algorismes
+from monedes.solucio.estat import SOLUCIO
+from monedes.solucio.problema import BOTAR, DESPLACAR, GIRAR, ProblemaMonedes
+
+TIPUS = (GIRAR, DESPLACAR, BOTAR)
+SENSE_ACCIO = np.iinfo(np.uint16).max
+
+
+def cami(solucio: str = SOLUCIO) -> Path:
+    nom = solucio.replace(" ", "_")
+
+    return Path(__file__).resolve().parent / f"taula_{nom}.npy"
+
+
+class TaulaSolucions:
+    def __init__(self, solucio: str, taula):
+        self.problema = ProblemaMonedes(solucio, solucio)
+        self.taula = taula
+
+    def rang(self, estat: int) -> int:
+        problema = self.problema
+        blanc = estat & problema.mascara_blanc
+        caselles = estat >> problema.bits_blanc
+
+        monedes = 0
+        bit = 0
+        for pos in range(problema.mida):
+            if pos == blanc:
+                continue
+            if (caselles >> (2 * pos)) & 3 == 2:
+                monedes |= 1 << bit
+            bit += 1
+
+        return (blanc << (problema.mida - 1)) | monedes
+
+    def consulta(self, monedes: str):
+        """ Millor acció d'una configuració.
+
+        Args:
+            monedes: Filera de monedes, de la mateixa longitud que la solució.
+
+        Returns:
+            Tupla (acció, cost fins a la solució). L'acció és None a la solució, i tota la tupla
+            és None si la configuració no pot arribar a la solució.
+        """
+        codi, cost = (int(valor) for valor in self.taula[self.rang(self.problema.codifica(monedes))])
+        if cost == SENSE_ACCIO:
+            return None
+        if codi == SENSE_ACCIO:
+            return None, cost
+
+        tipus, pos = divmod(codi, self.problema.mida)
+
+        return (TIPUS[tipus], pos), cost
+
+
+def genera(solucio: str = SOLUCIO, cami_taula: Path = None):
+    """ Resol totes les configuracions i escriu la taula a disc. """
+    if cami_taula is None:
+        cami_taula = cami(solucio)
+
+    buida = TaulaSolucions(solucio, None)
+    problema = buida.problema
+    taula = np.full((problema.mida << (problema.mida - 1), 2), SENSE_ACCIO, dtype=np.uint16)
+    for estat, (cost, accio) in algorismes.costos_meta(problema).items():
+        rang = buida.rang(estat)
+        taula[rang, 1] = cost
+        if accio is not None:
+            tipus, pos = accio
+            taula[rang, 0] = TIPUS.index(tipus) * problema.mida + pos
+
+    np.save(cami_taula, taula)
+
+
+@functools.cache
+def carrega(solucio: str = SOLUCIO) -> TaulaSolucions:
+    """ Carrega la taula d'una solució, generant-la primer si el fitxer no existeix. """
+    cami_taula = cami(solucio)
+    if not cami_taula.exists():
+        genera(solucio, cami_taula)
+
+    return TaulaSolucions(solucio, np.load(cami_taula, mmap_mode="r"))
+
+
+if __name__ == "__main__":
+    genera()
+    print(f"Taula generada a {cami()}")
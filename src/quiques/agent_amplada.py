@@ -3,52 +3,45 @@
 Author: Miquel Miró Nicolau (UIB), 2024
 """
 
+from cerca import algorismes
 from quiques.agent import Barca
-from quiques.estat import Estat
+from quiques.problema import ProblemaQuiques
 
 
 class BarcaAmplada(Barca):
-    def __init__(self):
+    def __init__(self, animals: int = 3, capacitat: int = 2, bidireccional: bool = False):
+        """ Agent que cerca en amplada.
+
+        Args:
+            animals: Nombre de quiques (i de llops) del joc.
+            capacitat: Nombre màxim d'animals a la barca.
+            bidireccional: Booleà indicant si la cerca avança també des de la meta.
+        """
         super(BarcaAmplada, self).__init__()
-        self.__frontera = None
-        self.__tancats = None
         self.__cami_exit = None
+        self.__problema = ProblemaQuiques(animals, capacitat)
+        self.__bidireccional = bidireccional
+        self.resultat = None
+
+    def cerca(self, estat_inicial: int) -> bool:
+        problema = ProblemaQuiques(
+            self.__problema.animals, self.__problema.capacitat, estat_inicial
+        )
+        if not problema.es_segur(estat_inicial):
+            return False
+
+        if self.__bidireccional:
+            self.resultat = algorismes.bidireccional(problema)
+        else:
+            self.resultat = algorismes.amplada(problema)
+        if self.resultat.trobat:
+            self.__cami_exit = self.resultat.cami
 
-    def cerca(self, estat_inicial: Estat) -> bool:
-        self.__frontera = []
-        self.__tancats = set()
-        exit = False
-
-        self.__frontera.append(estat_inicial)
-        while self.__frontera:
-            estat_actual = self.__frontera.pop(0)
-
-            if estat_actual in self.__tancats or not estat_actual.es_segur():
-                continue
-
-            if estat_actual.es_meta():
-                break
-
-            for f in estat_actual.genera_fill():
-                self.__frontera.append(f)
-
-            self.__tancats.add(estat_actual)
-
-        if estat_actual.es_meta():
-            self.__cami_exit = estat_actual.cami
-            exit = True
-
-        return exit
+        return self.resultat.trobat
 
     def actua(self, percepcio: dict) -> tuple[str, (int, int)]:
         if self.__cami_exit is None:
-            estat_inicial = Estat(
-                local_barca=percepcio["Lloc"],
-                llops_esq=percepcio["Llop Esq"],
-                polls_esq=percepcio["Poll Esq"],
-            )
-
-            self.cerca(estat_inicial)
+            self.cerca(self.__problema.des_de_percepcio(percepcio))
 
         if self.__cami_exit:
             quiques, llops = self.__cami_exit.pop(0)
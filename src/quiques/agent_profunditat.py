@@ -1,15 +1,42 @@
 """ Fitxer que conté l'agent barca en profunditat.
 
-S'ha d'implementar el mètode:
-    actua()
+Cerca en profunditat iterativa (``cerca.algorismes.profunditat_iterativa``): cada iteració és una
+cerca en profunditat amb una pila explícita i un límit de profunditat, i només descarta els
+estats repetits dins el camí actual. La memòria és lineal en la profunditat de la solució, a
+canvi de tornar a generar els nodes a cada iteració.
 """
+from cerca import algorismes
 from quiques.agent import Barca
-from quiques.estat import Estat
+from quiques.problema import ProblemaQuiques
 
 
 class BarcaProfunditat(Barca):
-    def __init__(self):
+    def __init__(self, animals: int = 3, capacitat: int = 2):
         super(BarcaProfunditat, self).__init__()
+        self.__cami_exit = None
+        self.__problema = ProblemaQuiques(animals, capacitat)
+        self.resultat = None
+
+    def cerca(self, estat_inicial: int) -> bool:
+        problema = ProblemaQuiques(
+            self.__problema.animals, self.__problema.capacitat, estat_inicial
+        )
+        if not problema.es_segur(estat_inicial):
+            return False
+
+        self.resultat = algorismes.profunditat_iterativa(problema)
+        if self.resultat.trobat:
+            self.__cami_exit = self.resultat.cami
+
+        return self.resultat.trobat
 
     def actua(self, percepcio: dict) -> str | tuple[str, (int, int)]:
-        pass
+        if self.__cami_exit is None:
+            self.cerca(self.__problema.des_de_percepcio(percepcio))
+
+        if self.__cami_exit:
+            quiques, llops = self.__cami_exit.pop(0)
+
+            return "M", (quiques, llops)
+        else:
+            return "A", None
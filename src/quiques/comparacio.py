@@ -0,0 +1,72 @@
+""" Comparació de les cerques no informades i informades sobre les quiques.
+
+Per a cada instància (animals, capacitat) mostra els nodes expandits i generats, el màxim
+d'estats guardats alhora i el temps de la cerca en amplada, l'amplada bidireccional i la
+profunditat iterativa. La profunditat iterativa guarda molts menys estats, però torna a generar
+els nodes a cada iteració i, sense conjunt de tancats, el seu temps creix exponencialment amb
+la mida de la instància. L'A* i l'RBFS, amb l'heurística de ``ProblemaQuiques``, i l'SMA*, amb
+un màxim de ``MAX_NODES`` nodes a memòria, també troben la solució òptima.
+
+Ús:
+    PYTHONPATH=src python -m quiques.comparacio
+"""
+import functools
+
+from cerca import algorismes
+from quiques.problema import ProblemaQuiques
+
+INSTANCIES = ((3, 2), (5, 3), (6, 4), (8, 4))
+MAX_NODES = 100
+
+CERQUES = (
+    ("amplada", algorismes.amplada),
+    ("bidireccional", algorismes.bidireccional),
+    ("profunditat iterativa", algorismes.profunditat_iterativa),
+    ("A*", algorismes.a_estrella),
+    ("RBFS", algorismes.rbfs),
+    ("SMA*", functools.partial(algorismes.sma_estrella, max_nodes=MAX_NODES)),
+)
+
+
+def compara(instancies=INSTANCIES):
+    """ Executa totes les cerques sobre cada instància.
+
+    Returns:
+        Llista de diccionaris amb la instància, la cerca i les mesures.
+    """
+    files = []
+    for animals, capacitat in instancies:
+        for nom, cerca in CERQUES:
+            resultat = cerca(ProblemaQuiques(animals, capacitat))
+
+            files.append(
+                {
+                    "animals": animals,
+                    "capacitat": capacitat,
+                    "cerca": nom,
+                    "accions": resultat.cost,
+                    "expandits": resultat.expandits,
+                    "generats": resultat.generats,
+                    "memoria": resultat.memoria,
+                    "temps": resultat.temps,
+                }
+            )
+
+    return files
+
+
+def main():
+    print(
+        f"{'N':>4}{'K':>4}  {'cerca':<24}{'accions':>8}{'expandits':>12}{'generats':>12}"
+        f"{'memòria':>10}{'temps (ms)':>12}"
+    )
+    for fila in compara():
+        print(
+            f"{fila['animals']:>4}{fila['capacitat']:>4}  {fila['cerca']:<24}"
+            f"{str(fila['accions']):>8}{fila['expandits']:>12}{fila['generats']:>12}"
+            f"{fila['memoria']:>10}{fila['temps'] * 1000:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,13 +8,14 @@ from iaLib import agent, joc
 
 
 class Joc(joc.Joc):
-    def __init__(self, agents: list[agent.Agent]):
+    def __init__(self, agents: list[agent.Agent], animals: int = 3, capacitat: int = 2):
         super(Joc, self).__init__(agents, (1024, 512), title="Casa")
 
         self.__illes = {
-            "ESQ": {"LLOP": 3, "POLL": 3},
+            "ESQ": {"LLOP": animals, "POLL": animals},
             "DRET": {"LLOP": 0, "POLL": 0},
         }
+        self.__capacitat = capacitat
 
         self.__lloc = "ESQ"
 
@@ -37,7 +38,7 @@ class Joc(joc.Joc):
 
             moviment_polls, moviment_llop = params
 
-            if moviment_llop + moviment_polls > 2:
+            if moviment_llop + moviment_polls > self.__capacitat:
                 raise agent.Trampes()
 
             lloc_dif = Joc.altre_lloc(self.__lloc)
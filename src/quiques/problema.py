@@ -0,0 +1,107 @@
+""" Problema de les quiques i els llops per als algorismes de ``cerca``.
+
+Versió general amb ``animals`` quiques i ``animals`` llops i una barca on caben ``capacitat``
+animals. Cada estat és un enter, ``((quiques_esq * (animals + 1)) + llops_esq) * 2 + barca``, on
+``barca`` és 0 si la barca és a l'esquerra i 1 si és a la dreta. Les accions són tuples
+(quiques, llops) que es mouen amb la barca, les mateixes que l'acció "M" de ``quiques.joc``.
+
+Un estat és segur si a cap riba no hi ha més llops que quiques (o no hi ha quiques), és a dir,
+si hi ha tantes quiques com llops a l'esquerra o totes les quiques són a la mateixa riba. Els
+successors només generen estats segurs: per a cada nombre de quiques que es mouen, o bé
+queden totes a una riba i es pot moure qualsevol nombre de llops, o bé només hi ha un nombre de
+llops que iguala les dues espècies.
+"""
+from cerca.problema import Problema
+
+ESQ, DRET = 0, 1
+LLOCS = ("ESQ", "DRET")
+
+
+class ProblemaQuiques(Problema):
+    def __init__(self, animals: int = 3, capacitat: int = 2, estat_inicial: int = None):
+        self.animals = animals
+        self.capacitat = capacitat
+        if estat_inicial is None:
+            estat_inicial = self.codifica(animals, animals, ESQ)
+        self.__estat_inicial = estat_inicial
+
+    def codifica(self, quiques_esq: int, llops_esq: int, barca: int) -> int:
+        return (quiques_esq * (self.animals + 1) + llops_esq) * 2 + barca
+
+    def descodifica(self, estat: int):
+        """ Tupla (quiques a l'esquerra, llops a l'esquerra, barca) d'un estat. """
+        barca = estat & 1
+        quiques_esq, llops_esq = divmod(estat >> 1, self.animals + 1)
+
+        return quiques_esq, llops_esq, barca
+
+    def des_de_percepcio(self, percepcio: dict) -> int:
+        return self.codifica(
+            percepcio["Poll Esq"], percepcio["Llop Esq"], LLOCS.index(percepcio["Lloc"])
+        )
+
+    def es_segur(self, estat: int) -> bool:
+        quiques_esq, llops_esq, _ = self.descodifica(estat)
+
+        return quiques_esq == llops_esq or quiques_esq in (0, self.animals)
+
+    def estat_inicial(self):
+        return self.__estat_inicial
+
+    def estat_meta(self):
+        return self.codifica(0, 0, DRET)
+
+    def es_meta(self, estat: int) -> bool:
+        return estat >> 1 == 0
+
+    def successors(self, estat: int):
+        n, k = self.animals, self.capacitat
+        quiques, llops, barca = self.descodifica(estat)
+
+        # Animals que hi ha a la riba de la barca, i signe del canvi a la riba esquerra.
+        if barca == ESQ:
+            quiques_riba, llops_riba, signe = quiques, llops, -1
+        else:
+            quiques_riba, llops_riba, signe = n - quiques, n - llops, 1
+
+        for mov_quiques in range(min(k, quiques_riba) + 1):
+            noves_quiques = quiques + signe * mov_quiques
+            minim = 1 if mov_quiques == 0 else 0
+            maxim = min(k - mov_quiques, llops_riba)
+
+            if noves_quiques in (0, n):
+                moviments_llops = range(minim, maxim + 1)
+            else:
+                # Només és segur si a l'esquerra queden tants llops com quiques.
+                mov_llops = signe * (noves_quiques - llops)
+                moviments_llops = (mov_llops,) if minim <= mov_llops <= maxim else ()
+
+            for mov_llops in moviments_llops:
+                fill = self.codifica(noves_quiques, llops + signe * mov_llops, barca ^ 1)
+                yield (mov_quiques, mov_llops), fill
+
+    def heuristica(self, estat: int) -> float:
+        """ Viatges necessaris sense tenir en compte la seguretat de les ribes.
+
+        Amb ``m`` animals a l'esquerra, cada anada hi en duu com a molt ``capacitat`` i cada
+        tornada n'ha de dur almenys un. Amb la barca a l'esquerra calen ``2 * t - 1`` viatges,
+        amb ``t = max(1, ceil((m - 1) / (capacitat - 1)))`` anades, i amb la barca a la dreta un
+        viatge de tornada més. És el cost exacte del problema relaxat, i per tant admissible i
+        consistent.
+        """
+        quiques, llops, barca = self.descodifica(estat)
+        animals = quiques + llops
+        if animals == 0:
+            return 0
+        if self.capacitat < 2:
+            return 1
+
+        if barca == DRET:
+            animals += 1
+        viatges = max(1, -(-(animals - 1) // (self.capacitat - 1)))
+
+        return 2 * viatges - 1 + barca
+
+    def predecessors(self, estat: int):
+        # Tornar a fer el mateix moviment des de l'altra riba desfà l'acció.
+        return self.successors(estat)
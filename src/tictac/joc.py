@@ -33,11 +33,6 @@ class Casella:
                 window, (0, 0, 255), ((x * 100) + 50, (y * 100) + 50), 40, width=5
             )
 
-    def posa(self, tipus):
-        if self.tipus != " ":
-            raise Exception("Has fet trampes: aquesta casella ja està ocupada")
-        self.tipus = tipus
-
     def __str__(self):
         return self.tipus
 
@@ -63,16 +58,9 @@ class Taulell(joc.Joc):
             agents, (mida_taulell[0] * 100, mida_taulell[1] * 100), title="Minimax"
         )
 
-        self.__caselles = []
+        # El taulell només es guarda com a bits; les caselles es creen per dibuixar-les.
         self.__mida_taulell = mida_taulell
 
-        for x in range(mida_taulell[0]):
-            caselles_col = []
-            for y in range(mida_taulell[1]):
-                tipus = " "
-                caselles_col.append(Casella(tipus))
-            self.__caselles.append(caselles_col)
-
         self.agents_fitxes = {a.nom: f for a, f in zip(agents, ["0", "X"])}
 
         if not isinstance(agents, list):
@@ -82,6 +70,8 @@ class Taulell(joc.Joc):
         self.torn = 0
         self.acabat = False
         self.dificultat = dificultat
+        self.__bits = [0, 0]
+        self.__linies = victoria.linies(mida_taulell, dificultat)
 
     def _aplica(
         self, accio, params=None, agent_actual = None
@@ -96,13 +86,19 @@ class Taulell(joc.Joc):
             if accio == "P":
                 pos_x, pos_y = params
                 if not (
-                    0 <= pos_x < len(self.__caselles)
-                    and 0 <= pos_y < len(self.__caselles[0])
+                    0 <= pos_x < self.__mida_taulell[0]
+                    and 0 <= pos_y < self.__mida_taulell[1]
                 ):
                     raise ValueError(f"Posició {params} fora dels límits")
 
-                self.__caselles[pos_x][pos_y].posa(self.agents_fitxes[agent_actual])
-                self.acabat = victoria.victoria(self.__taulell_str(), (pos_x, pos_y))
+                idx = pos_x * self.__mida_taulell[1] + pos_y
+                if ((self.__bits[0] | self.__bits[1]) >> idx) & 1:
+                    raise Exception("Has fet trampes: aquesta casella ja està ocupada")
+
+                fitxa = self.agents_fitxes[agent_actual]
+                jugador = victoria.FITXES.index(fitxa)
+                self.__bits[jugador] |= 1 << idx
+                self.acabat = self.__linies.guanya(self.__bits[jugador], idx)
 
             if self.acabat:
                 print(f"Agent {agent_actual} ha guanyat")
@@ -113,16 +109,23 @@ class Taulell(joc.Joc):
         window = self._game_window
         window.fill(pygame.Color(255, 255, 255))
 
-        for x in range(len(self.__caselles)):
-            for y in range(len(self.__caselles[0])):
-                self.__caselles[x][y].draw(window, x, y)
-
-    def __taulell_str(self):
-        return [[c.tipus for c in row] for row in self.__caselles]
+        vista = victoria.VistaTaulell(self.__mida_taulell, self.__bits)
+        for x in range(self.__mida_taulell[0]):
+            for y in range(self.__mida_taulell[1]):
+                Casella(vista.casella(x, y)).draw(window, x, y)
 
     def percepcio(self) -> dict:
+        """ Percepció del taulell sense copiar-lo.
+
+        ``"taulell"`` és una ``victoria.VistaTaulell`` només de lectura (s'indexa com una llista de
+        llistes) i ``"bits"`` la tupla d'enters (bits de "0", bits de "X") en què es basa.
+        """
+        bits = tuple(self.__bits)
+
         return {
-            "taulell": self.__taulell_str(),
+            "taulell": victoria.VistaTaulell(self.__mida_taulell, bits),
+            "bits": bits,
             "mida": self.__mida_taulell,
             "torn": ("0" if self.torn % 2 == 0 else "X"),
+            "dificultat": self.dificultat,
         }
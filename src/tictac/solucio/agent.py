@@ -3,15 +3,27 @@
 Mòdul en el qual es desenvolupa un agent Minimax (sense poda alfa-beta) per resoldre el problema del
 Tic-Tac-Toe.
 
+Amb ``bitboard=True`` la cerca la fa ``tictac.solucio.nucli.Nucli``, que fa i desfà els moviments
+sobre un únic estat i només retorna la puntuació i el millor moviment.
+
 Creat per: Miquel Miró Nicolau (UIB), 2025
 """
 from iaLib import agent
+from tictac.solucio import nucli
 from tictac.solucio.estat import Estat
+from tictac.solucio.estat_bits import EstatBits
 
 
 class Agent(agent.Agent):
-    def __init__(self):
+    def __init__(self, bitboard=False):
         super(Agent, self).__init__(long_memoria=1)
+        self.__bitboard = bitboard
+        self.__nucli = nucli.Nucli(poda=False) if bitboard else None
+
+    @property
+    def nucli(self):
+        """ Nucli de cerca que s'empra amb ``bitboard=True``, o None. """
+        return self.__nucli
 
     def cerca(self, estat, torn_max=True, iter=0):
         if estat.es_meta():
@@ -60,7 +72,14 @@ class Agent(agent.Agent):
         return major_idx
 
     def actua(self, percepcio):
-        estat_inicial = Estat(percepcio["taulell"], percepcio["torn"])
+        if self.__bitboard:
+            _, accio = self.__nucli.resol(EstatBits.des_de_percepcio(percepcio))
+
+            return "E" if accio is None else ("P", accio)
+
+        estat_inicial = Estat(
+            percepcio["taulell"], percepcio["torn"], dificultat=percepcio.get("dificultat", 3)
+        )
         res = self.cerca(estat_inicial)
 
         if isinstance(res, tuple) and res[0].accions_previes is not None and len(res[0].accions_previes) > 0:
@@ -3,19 +3,49 @@
 Mòdul en el qual es desenvolupa un agent Minimax amb poda alfa-beta per resoldre el problema del
 Tic Tac Toe.
 
+L'ordre en què s'exploren els fills es pot configurar amb els esquemes de
+``tictac.solucio.ordenacio`` i, amb ``instrumentacio=True``, l'agent informa de la taxa de talls,
+dels fills explorats per node i del factor de ramificació efectiu de cada cerca. Amb
+``bitboard=True`` i sense ordenació ni instrumentació, la cerca la fa
+``tictac.solucio.nucli.Nucli``, que no copia camins. Amb ``amenaces=True``, abans de cercar es
+prova de trobar una victòria forçada amb ``tictac.solucio.amenaces``.
+
 Creat per: Miquel Miró Nicolau (UIB), 2025
 """
 from iaLib import agent
+from tictac.solucio import amenaces, nucli, ordenacio
 from tictac.solucio.estat import Estat
+from tictac.solucio.estat_bits import EstatBits
 
 class Agent(agent.Agent):
-    def __init__(self, poda = False):
+    def __init__(
+            self, poda = False, bitboard = False, ordenacio = (), instrumentacio = False, amenaces = False
+    ):
         super(Agent, self).__init__(long_memoria=1)
+        self.__bitboard = bitboard
         self.__cami_exit = None
         self.__poda = poda
 
+        self.__esquemes = tuple(ordenacio)
+        self.__ordenacio = None
+        self.__mida = None
+        self.__instrumentacio = instrumentacio
+        self.__amenaces = amenaces
+        self.estadistiques = None
+
+        self.__nucli = None
+        if bitboard and not self.__esquemes and not instrumentacio:
+            self.__nucli = nucli.Nucli(poda=True)
+
+    @property
+    def nucli(self):
+        """ Nucli de cerca que s'empra amb ``bitboard=True`` sense ordenació, o None. """
+        return self.__nucli
+
     def cerca(self, estat: Estat, alpha, beta, torn_max=True, iter = 0):
         if estat.es_meta():
+            if self.estadistiques is not None:
+                self.estadistiques.fulla(iter)
             res = 0
             if estat.guanyador():
                 res = (1 if not torn_max else -1)
@@ -23,6 +53,10 @@ class Agent(agent.Agent):
 
         puntuacio_fills = []
         fills = estat.genera_fills()
+        if self.__ordenacio:
+            fills = self.__ordenacio.ordena(
+                fills, iter, estat.accions_previes, accio=lambda f: f.accions_previes[-1]
+            )
 
         for fill in fills:
             punt_fill = self.cerca(fill, alpha, beta, not torn_max, iter + 1)
@@ -35,8 +69,14 @@ class Agent(agent.Agent):
             puntuacio_fills.append(punt_fill)
 
             if alpha >= beta:
+                if self.__ordenacio:
+                    self.__ordenacio.tall(fill.accions_previes[-1], iter, len(fills))
                 break
 
+        if self.estadistiques is not None:
+            self.estadistiques.node(
+                len(puntuacio_fills), alpha >= beta, len(puntuacio_fills) == 1
+            )
 
         idx = Agent.arg_max(puntuacio_fills, not torn_max)
 
@@ -76,9 +116,38 @@ class Agent(agent.Agent):
         pass
 
     def actua(self, percepcio):
-        estat_inicial = Estat(percepcio["taulell"], percepcio["torn"])
+        if self.__amenaces:
+            estat = EstatBits.des_de_percepcio(percepcio)
+            accio = amenaces.CercaAmenaces(estat.mida, estat.dificultat).guanya(estat)
+            if accio is not None:
+                return "P", accio
+
+        if self.__nucli is not None:
+            _, accio = self.__nucli.resol(EstatBits.des_de_percepcio(percepcio))
+
+            return "E" if accio is None else ("P", accio)
+
+        if self.__bitboard:
+            estat_inicial = EstatBits.des_de_percepcio(percepcio)
+        else:
+            estat_inicial = Estat(
+                percepcio["taulell"], percepcio["torn"], dificultat=percepcio.get("dificultat", 3)
+            )
+
+        mida = (len(percepcio["taulell"]), len(percepcio["taulell"][0]))
+        if self.__ordenacio is None or self.__mida != mida:
+            self.__ordenacio = ordenacio.Ordenacio(mida, self.__esquemes)
+            self.__mida = mida
+        self.__ordenacio.nova_cerca()
+
+        if self.__instrumentacio:
+            self.estadistiques = ordenacio.Estadistiques()
+
         res = self.cerca(estat_inicial, alpha=-float('inf'), beta=float('inf'))
 
+        if self.__instrumentacio:
+            print(f"Agent {self.nom}: {self.estadistiques}")
+
         if isinstance(res, tuple) and res[0].accions_previes is not None and len(res[0].accions_previes) > 0:
             solucio, _ = res
             cami = [solucio.accions_previes[i] for i in range(len(solucio.accions_previes)) if (i % 2 == 0)]
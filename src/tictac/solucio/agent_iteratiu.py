@@ -0,0 +1,408 @@
+""" Agent Minimax amb aprofundiment iteratiu i límit de temps.
+
+Mòdul en el qual es desenvolupa un agent Minimax amb poda alfa-beta per a taulells grans (per
+exemple el de 8x8 amb dificultat 4 que empra ``tictac.joc.Taulell`` per defecte). En lloc de
+cercar fins als estats terminals, l'agent cerca a profunditat 1, 2, 3... fins que s'esgota el
+temps per moviment. Als nodes on s'arriba al límit de profunditat s'empra una heurística que
+compta les línies obertes de cada jugador.
+
+Quan s'esgota el temps, l'agent retorna la millor acció de la darrera iteració completada.
+
+Els moviments s'ordenen amb els esquemes de ``tictac.solucio.ordenacio``; la variació principal de
+cada iteració es recupera de la taula de transposició i s'explora primer a la següent.
+
+Abans de l'aprofundiment, l'agent cerca una victòria forçada amb
+``tictac.solucio.amenaces`` (fins a una quarta part del temps); si en troba una, la juga
+directament.
+
+Amb ``avaluacio_lot=True``, els nodes a un moviment de la frontera avaluen tots els fills alhora
+amb ``tictac.solucio.avaluacio.Avaluador`` (NumPy) en lloc de fer una crida a ``avalua`` per fill.
+El resultat de la cerca és el mateix.
+
+Amb ``taules_finals=True``, als taulells de 4x4 les fulles amb prou fitxes es consulten a les
+taules de ``tictac.solucio.taula_4x4`` en lloc de cercar-les.
+
+Amb ``radi=k`` només es consideren les caselles buides a distància ``k`` o menys d'alguna fitxa
+(vegeu ``EstatBits``), cosa que redueix molt el factor de ramificació als taulells grans.
+"""
+import time
+
+from iaLib import agent
+
+from tictac import victoria
+from tictac.solucio import amenaces, avaluacio, ordenacio, taula_4x4, transposicio
+from tictac.solucio.estat_bits import EstatBits
+
+GUANY = 1_000_000
+LIMIT_GUANY = GUANY - 1_000
+# Les puntuacions heurístiques es limiten per davall de ``LIMIT_GUANY``: amb dificultats altes, la
+# suma de ``PESOS`` de les línies obertes el podria superar i semblaria una victòria.
+MAXIM_HEURISTICA = LIMIT_GUANY - 1
+
+PESOS = [0] + [10 ** k for k in range(1, 32)]
+
+
+class TempsEsgotat(Exception):
+    pass
+
+
+def _limita(valor):
+    return max(-MAXIM_HEURISTICA, min(MAXIM_HEURISTICA, valor))
+
+
+class Agent(agent.Agent):
+    def __init__(
+            self,
+            temps_maxim=1.0,
+            profunditat_maxima=None,
+            capacitat_taula=1 << 20,
+            ordenacio=ordenacio.ESQUEMES,
+            instrumentacio=False,
+            radi=None,
+            amenaces=True,
+            taules_finals=False,
+            min_pedres_taula=0,
+            avaluacio_lot=False,
+    ):
+        super(Agent, self).__init__(long_memoria=1)
+        self.temps_maxim = temps_maxim
+        self.profunditat_maxima = profunditat_maxima
+        self.radi = radi
+        self.__amenaces = amenaces
+        self.__cerca_amenaces = None
+
+        self.__taules_finals = taules_finals
+        self.min_pedres_taula = min_pedres_taula
+        self.__finals = {}
+        self.__final = None
+
+        self.__avaluacio_lot = avaluacio_lot
+        self.__avaluador = None
+
+        self.__esquemes = tuple(ordenacio)
+        self.__ordenacio = None
+        self.__instrumentacio = instrumentacio
+        self.estadistiques = None
+
+        self.__taula = transposicio.TaulaTransposicio(capacitat_taula)
+        self.__pedres_anteriors = None
+        self.__limit = None
+        self.__jugador = None
+
+        self.nodes = 0
+        self.profunditat_assolida = 0
+
+    def avalua(self, estat: EstatBits):
+        """ Heurística de línies obertes des del punt de vista del jugador MAX.
+
+        Una línia està oberta per a un jugador si no conté cap fitxa del rival. Cada línia oberta
+        suma (o resta, si és del rival) 10 elevat al nombre de fitxes que ja hi ha. El resultat es
+        limita a ``±MAXIM_HEURISTICA``.
+
+        Args:
+            estat: Estat a avaluar.
+
+        Returns:
+            Enter, com més gran millor per a MAX.
+        """
+        propies = estat.bits[self.__jugador]
+        rivals = estat.bits[self.__jugador ^ 1]
+
+        valor = 0
+        for mascara in victoria.linies(estat.mida, estat.dificultat).linies:
+            meves = (propies & mascara).bit_count()
+            seves = (rivals & mascara).bit_count()
+            if seves == 0:
+                valor += PESOS[meves]
+            elif meves == 0:
+                valor -= PESOS[seves]
+
+        return _limita(valor)
+
+    def __avalua_fulles(self, estat: EstatBits, accions, torn_max, iter):
+        """ Valors dels fills de ``estat`` com a fulles, avaluant els no terminals en un sol lot.
+
+        Equival a cridar ``cerca`` amb profunditat 0 per a cada fill.
+        """
+        if time.perf_counter() > self.__limit:
+            raise TempsEsgotat()
+        self.nodes += len(accions)
+        if self.estadistiques is not None:
+            self.estadistiques.fulla(iter + 1, len(accions))
+
+        columnes = estat.mida[1]
+        jugador = estat.torn
+        bits = estat.bits
+        ocupades = bits[0] | bits[1]
+        linies = victoria.linies(estat.mida, estat.dificultat)
+        ple = (1 << (estat.mida[0] * columnes)) - 1
+        guany = GUANY - iter - 1 if torn_max else -(GUANY - iter - 1)
+
+        valors = [0] * len(accions)
+        pendents, propies, rivals = [], [], []
+        for i, (pos_x, pos_y) in enumerate(accions):
+            idx = pos_x * columnes + pos_y
+            fill = list(bits)
+            fill[jugador] |= 1 << idx
+            if linies.guanya(fill[jugador], idx):
+                valors[i] = guany
+            elif ocupades | (1 << idx) != ple:
+                pendents.append(i)
+                propies.append(fill[self.__jugador])
+                rivals.append(fill[self.__jugador ^ 1])
+
+        if pendents:
+            for i, valor in zip(pendents, self.__avaluador.avalua(propies, rivals).tolist()):
+                valors[i] = _limita(valor)
+
+        return valors
+
+    @staticmethod
+    def __a_taula(valor, iter):
+        """ Les victòries es guarden com a distància des del node, no des de l'arrel. """
+        if valor >= LIMIT_GUANY:
+            return valor + iter
+        if valor <= -LIMIT_GUANY:
+            return valor - iter
+        return valor
+
+    @staticmethod
+    def __de_taula(valor, iter):
+        if valor >= LIMIT_GUANY:
+            return valor - iter
+        if valor <= -LIMIT_GUANY:
+            return valor + iter
+        return valor
+
+    def cerca(self, estat: EstatBits, profunditat, alpha, beta, torn_max=True, iter=0):
+        self.nodes += 1
+        if self.nodes & 255 == 0 and time.perf_counter() > self.__limit:
+            raise TempsEsgotat()
+
+        if self.__final is not None and iter > 0:
+            pedres = estat.ocupades.bit_count()
+            if pedres >= self.min_pedres_taula:
+                valor = taula_4x4.consulta(self.__final, estat.bits[0], estat.bits[1])
+                if valor is not None:
+                    if self.estadistiques is not None:
+                        self.estadistiques.fulla(iter)
+                    # La taula no diu en quants moviments es guanya: com a molt, les buides.
+                    valor *= GUANY - iter - (taula_4x4.CASELLES - pedres)
+                    return valor if torn_max else -valor
+
+        if estat.es_meta() or profunditat == 0:
+            if self.estadistiques is not None:
+                self.estadistiques.fulla(iter)
+            if estat.guanyador():
+                return -(GUANY - iter) if torn_max else GUANY - iter
+            if estat.es_ple():
+                return 0
+            return self.avalua(estat)
+
+        alpha_inicial, beta_inicial = alpha, beta
+        signe = 1 if torn_max else -1
+        accions = self.__ordenacio.ordena(estat.accions_possibles(), iter, estat.accions_previes)
+
+        entrada = self.__taula.consulta(estat.clau)
+        if entrada is not None:
+            if entrada.profunditat >= profunditat:
+                valor = Agent.__de_taula(signe * entrada.valor, iter)
+                tipus = entrada.tipus
+                if tipus != transposicio.EXACTE and not torn_max:
+                    tipus = transposicio.INFERIOR + transposicio.SUPERIOR - tipus
+
+                if tipus == transposicio.EXACTE:
+                    return valor
+                if tipus == transposicio.INFERIOR:
+                    alpha = max(alpha, valor)
+                else:
+                    beta = min(beta, valor)
+                if alpha >= beta:
+                    return valor
+
+            accions.sort(key=lambda acc: acc != entrada.millor_accio)
+
+        valors_fulles = None
+        if profunditat == 1 and self.__avaluador is not None and self.__final is None:
+            valors_fulles = self.__avalua_fulles(estat, accions, torn_max, iter)
+
+        millor_valor = -float("inf") if torn_max else float("inf")
+        millor_accio = None
+        explorats = 0
+        for acc in accions:
+            if valors_fulles is not None:
+                valor = valors_fulles[explorats]
+            else:
+                estat.mou(acc)
+                valor = self.cerca(estat, profunditat - 1, alpha, beta, not torn_max, iter + 1)
+                estat.desfes()
+            explorats += 1
+
+            if torn_max:
+                if valor > millor_valor:
+                    millor_valor, millor_accio = valor, acc
+                alpha = max(alpha, valor)
+            else:
+                if valor < millor_valor:
+                    millor_valor, millor_accio = valor, acc
+                beta = min(beta, valor)
+
+            if alpha >= beta:
+                self.__ordenacio.tall(acc, iter, profunditat)
+                break
+
+        if self.estadistiques is not None:
+            self.estadistiques.node(explorats, alpha >= beta, explorats == 1)
+
+        if millor_valor <= alpha_inicial:
+            tipus = transposicio.SUPERIOR
+        elif millor_valor >= beta_inicial:
+            tipus = transposicio.INFERIOR
+        else:
+            tipus = transposicio.EXACTE
+        if tipus != transposicio.EXACTE and not torn_max:
+            tipus = transposicio.INFERIOR + transposicio.SUPERIOR - tipus
+
+        self.__taula.guarda(
+            estat.clau,
+            profunditat,
+            signe * Agent.__a_taula(millor_valor, iter),
+            tipus,
+            millor_accio,
+        )
+
+        return millor_valor
+
+    def cerca_arrel(self, estat: EstatBits, profunditat, millor_previ=None):
+        """ Una iteració de l'aprofundiment: cerca a l'arrel amb la profunditat donada.
+
+        Args:
+            estat: Estat arrel, on mou el jugador MAX.
+            profunditat: Profunditat màxima de la iteració.
+            millor_previ: Millor acció de la iteració anterior, que s'explora primer.
+
+        Returns:
+            Tupla (valor, millor acció).
+        """
+        accions = self.__ordenacio.ordena(estat.accions_possibles(), 0)
+        if millor_previ is not None:
+            accions.sort(key=lambda acc: acc != millor_previ)
+
+        alpha = -float("inf")
+        millor_valor, millor_accio = -float("inf"), accions[0]
+        for acc in accions:
+            estat.mou(acc)
+            valor = self.cerca(estat, profunditat - 1, alpha, float("inf"), False, 1)
+            estat.desfes()
+
+            if valor > millor_valor:
+                millor_valor, millor_accio = valor, acc
+            alpha = max(alpha, valor)
+
+        return millor_valor, millor_accio
+
+    def variacio_principal(self, estat: EstatBits, profunditat):
+        """ Recupera la variació principal seguint les millors accions de la taula de transposició.
+
+        Args:
+            estat: Estat arrel.
+            profunditat: Nombre màxim de moviments a recuperar.
+
+        Returns:
+            Llista de moviments des de l'arrel.
+        """
+        variacio = []
+        while len(variacio) < profunditat and not estat.es_meta():
+            entrada = self.__taula.consulta(estat.clau)
+            if entrada is None or entrada.millor_accio is None:
+                break
+            variacio.append(entrada.millor_accio)
+            estat.mou(entrada.millor_accio)
+
+        for _ in variacio:
+            estat.desfes()
+
+        return variacio
+
+    def actua(self, percepcio):
+        estat = EstatBits.des_de_percepcio(percepcio, radi=self.radi)
+        if estat.es_meta():
+            return "E"
+
+        pedres = estat.ocupades.bit_count()
+        if self.__pedres_anteriors is not None and pedres < self.__pedres_anteriors:
+            self.__taula.buida()
+        self.__pedres_anteriors = pedres
+        self.__taula.nova_cerca()
+
+        self.__limit = time.perf_counter() + self.temps_maxim
+        self.__jugador = estat.torn
+        self.nodes = 0
+        self.profunditat_assolida = 0
+
+        if self.__ordenacio is None or self.__ordenacio.mida != estat.mida:
+            self.__ordenacio = ordenacio.Ordenacio(estat.mida, self.__esquemes)
+        self.__ordenacio.nova_cerca()
+        self.__ordenacio.pv = []
+
+        if self.__instrumentacio:
+            self.estadistiques = ordenacio.Estadistiques()
+
+        self.__avaluador = None
+        if self.__avaluacio_lot:
+            self.__avaluador = avaluacio.avaluador(estat.mida, estat.dificultat)
+
+        self.__final = None
+        if (
+                self.__taules_finals
+                and estat.mida == taula_4x4.MIDA
+                and estat.dificultat in taula_4x4.DIFICULTATS
+                and estat.torn == pedres % 2  # La taula suposa que "0" ha començat.
+        ):
+            if estat.dificultat not in self.__finals:
+                self.__finals[estat.dificultat] = taula_4x4.carrega(estat.dificultat)
+            self.__final = self.__finals[estat.dificultat]
+
+        if self.__amenaces:
+            cerca = self.__cerca_amenaces
+            if cerca is None or (cerca.mida, cerca.dificultat) != (estat.mida, estat.dificultat):
+                cerca = amenaces.CercaAmenaces(estat.mida, estat.dificultat)
+                self.__cerca_amenaces = cerca
+
+            accio = cerca.guanya(estat, temps_maxim=self.temps_maxim / 4)
+            if accio is not None:
+                return "P", accio
+
+        # Acció de reserva per si no s'acaba ni la primera iteració: la casella més centrada.
+        files, columnes = estat.mida
+        accions = estat.accions_possibles()
+        millor = min(
+            accions, key=lambda pos: abs(2 * pos[0] - files + 1) + abs(2 * pos[1] - columnes + 1)
+        )
+
+        profunditat_maxima = files * columnes - pedres
+        if self.profunditat_maxima is not None:
+            profunditat_maxima = min(profunditat_maxima, self.profunditat_maxima)
+
+        for profunditat in range(1, profunditat_maxima + 1):
+            try:
+                valor, millor = self.cerca_arrel(estat, profunditat, millor)
+            except TempsEsgotat:
+                break
+
+            self.profunditat_assolida = profunditat
+            self.__ordenacio.pv = [millor] + self.variacio_principal(
+                estat.transicio(millor), profunditat - 1
+            )
+            if abs(valor) >= LIMIT_GUANY:
+                break
+            # Si tots els fills són a la taula, la primera iteració ja és exacta.
+            if self.__final is not None and pedres + 1 >= self.min_pedres_taula:
+                break
+
+        if self.__instrumentacio:
+            print(
+                f"Agent {self.nom}: profunditat {self.profunditat_assolida} | {self.estadistiques}"
+            )
+
+        return "P", millor
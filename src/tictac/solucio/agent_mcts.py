@@ -0,0 +1,268 @@
+""" Agent de cerca en arbre de Monte Carlo (MCTS) amb UCT.
+
+Per a taulells grans (8x8 amb quatre en línia) la cerca Minimax exhaustiva no és viable. Aquest
+agent construeix un arbre de manera incremental: selecciona un camí amb la fórmula UCT, expandeix
+un fill nou i l'avalua amb simulacions aleatòries fins al final de la partida.
+
+Les simulacions es fan en lots amb NumPy. Una simulació aleatòria equival a assignar a cada
+casella buida l'instant en què s'hi juga (una permutació aleatòria); el propietari de la casella
+depèn de la paritat de l'instant. Una línia de ``tictac.victoria`` la guanya el jugador que en té
+totes les caselles, en l'instant en què s'ocupa la darrera, i la partida la guanya qui completa la
+primera línia. Així, un lot sencer de simulacions es resol amb unes quantes operacions sobre
+arrays, sense cap bucle de Python per moviment.
+
+L'arbre es reutilitza entre moviments: si el rival ha jugat un moviment que ja era a l'arbre, el
+subarbre corresponent passa a ser la nova arrel. Amb ``radi=k`` l'arbre només inclou moviments a
+distància ``k`` o menys d'alguna fitxa; les simulacions continuen jugant a tot el taulell.
+
+Amb ``heuristica=True``, quan un node s'expandeix per primera vegada tots els seus fills s'avaluen
+en un sol lot amb ``tictac.solucio.avaluacio`` i s'expandeixen de millor a pitjor, en lloc d'en
+ordre aleatori.
+"""
+import math
+import time
+
+import numpy as np
+from iaLib import agent
+
+from tictac import victoria
+from tictac.solucio import avaluacio
+from tictac.solucio.estat_bits import EstatBits
+
+
+class Node:
+    """ Node de l'arbre de MCTS.
+
+    ``guanys`` s'acumula des del punt de vista del jugador que ha fet el moviment que porta al
+    node, que és el que decideix si el tria o no en seleccionar des del pare.
+    """
+
+    __slots__ = ("accio", "fills", "no_explorades", "visites", "guanys", "terminal")
+
+    def __init__(self, accio=None):
+        self.accio = accio
+        self.fills = {}
+        self.no_explorades = None
+        self.visites = 0
+        self.guanys = 0.0
+        self.terminal = None
+
+    def uct(self, log_visites_pare, exploracio):
+        return self.guanys / self.visites + exploracio * math.sqrt(
+            log_visites_pare / self.visites
+        )
+
+
+class Simulador:
+    """ Resol lots de simulacions aleatòries amb NumPy per a una mida i dificultat donades. """
+
+    def __init__(self, mida, dificultat, llavor=None):
+        self.caselles = mida[0] * mida[1]
+        self.linies = np.array(victoria.linies(mida, dificultat).caselles, dtype=np.intp)
+        self.rng = np.random.default_rng(llavor)
+
+    def simula(self, bits, torn, n):
+        """ Juga ``n`` partides aleatòries des de la posició donada.
+
+        Args:
+            bits: Llista [fitxes de "0", fitxes de "X"].
+            torn: Índex del jugador que ha de moure.
+            n: Nombre de simulacions del lot.
+
+        Returns:
+            Suma de les recompenses per al jugador que ha de moure (1 guanya, 0.5 empat, 0 perd).
+        """
+        ocupades = bits[0] | bits[1]
+        buides = np.array(
+            [idx for idx in range(self.caselles) if not (ocupades >> idx) & 1], dtype=np.intp
+        )
+
+        # Instant en què s'ocupa cada casella: -1 per a les ja ocupades.
+        instant = np.full((n, self.caselles), -1, dtype=np.int16)
+        propietari = np.zeros((n, self.caselles), dtype=np.int8)
+        for jugador in (0, 1):
+            for idx in range(self.caselles):
+                if (bits[jugador] >> idx) & 1:
+                    propietari[:, idx] = jugador
+
+        ordre = np.argsort(self.rng.random((n, len(buides))), axis=1).astype(np.int16)
+        instant[:, buides] = ordre
+        propietari[:, buides] = torn ^ (ordre & 1)
+
+        prop_linies = propietari[:, self.linies]
+        completa = instant[:, self.linies].max(axis=2)
+        sense_limit = np.iinfo(np.int16).max
+
+        primera = []
+        for jugador in (0, 1):
+            seva = (prop_linies == jugador).all(axis=2)
+            primera.append(np.where(seva, completa, sense_limit).min(axis=1))
+
+        guanya = primera[torn] < primera[torn ^ 1]
+        empat = primera[torn] == primera[torn ^ 1]
+
+        return float(guanya.sum()) + 0.5 * float(empat.sum())
+
+
+class Agent(agent.Agent):
+    def __init__(
+            self,
+            iteracions=None,
+            temps_maxim=1.0,
+            simulacions=32,
+            exploracio=math.sqrt(2),
+            reutilitza=True,
+            llavor=None,
+            radi=None,
+            heuristica=False,
+    ):
+        """ Agent MCTS.
+
+        Args:
+            iteracions: Nombre màxim d'iteracions (selecció, expansió, simulació) per moviment.
+            temps_maxim: Segons per moviment. Si és None, només compta ``iteracions``.
+            simulacions: Simulacions aleatòries del lot que avalua cada node nou.
+            exploracio: Constant d'exploració de la fórmula UCT.
+            reutilitza: Booleà indicant si l'arbre es conserva entre moviments.
+            llavor: Llavor del generador aleatori, per fer les partides reproduïbles.
+            radi: Si no és None, distància màxima a les fitxes dels moviments de l'arbre.
+            heuristica: Booleà indicant si els fills s'expandeixen segons l'avaluació heurística.
+        """
+        super(Agent, self).__init__(long_memoria=1)
+        if iteracions is None and temps_maxim is None:
+            raise ValueError("Cal un límit d'iteracions o de temps")
+
+        self.iteracions = iteracions
+        self.temps_maxim = temps_maxim
+        self.simulacions = simulacions
+        self.exploracio = exploracio
+        self.reutilitza = reutilitza
+        self.radi = radi
+        self.heuristica = heuristica
+        self.__llavor = llavor
+
+        self.__simulador = None
+        self.__joc = None
+        self.__arrel = None
+        self.__bits_arrel = None
+
+        self.iteracions_fetes = 0
+
+    def __nou_simulador(self, estat: EstatBits):
+        if self.__simulador is None or self.__joc != (estat.mida, estat.dificultat):
+            self.__simulador = Simulador(estat.mida, estat.dificultat, self.__llavor)
+            self.__joc = (estat.mida, estat.dificultat)
+            self.__arrel = None
+
+    def __arrel_reutilitzada(self, estat: EstatBits):
+        """ Busca a l'arbre anterior el node que correspon a la posició actual. """
+        if not self.reutilitza or self.__arrel is None:
+            return Node()
+
+        anteriors = self.__bits_arrel
+        nous = [estat.bits[j] & ~anteriors[j] for j in (0, 1)]
+        if any(anteriors[j] & ~estat.bits[j] for j in (0, 1)):
+            return Node()
+
+        # Des de la darrera arrel només hi pot haver una fitxa nova, la del rival.
+        if nous[estat.torn] or nous[estat.torn ^ 1].bit_count() != 1:
+            return Node()
+
+        idx = nous[estat.torn ^ 1].bit_length() - 1
+        fill = self.__arrel.fills.get(estat.posicions[idx])
+
+        return fill if fill is not None else Node()
+
+    @staticmethod
+    def __ordena_heuristica(estat: EstatBits, accions):
+        """ Ordena les accions de pitjor a millor per al jugador que mou (es treuen amb ``pop``). """
+        jugador = estat.torn
+        columnes = estat.mida[1]
+        propies = [estat.bits[jugador] | 1 << (x * columnes + y) for x, y in accions]
+        rivals = [estat.bits[jugador ^ 1]] * len(accions)
+        valors = avaluacio.avaluador(estat.mida, estat.dificultat).avalua(propies, rivals)
+
+        return [accions[i] for i in valors.argsort(kind="stable")]
+
+    def itera(self, estat: EstatBits, arrel: Node):
+        """ Una iteració de MCTS: selecció, expansió, simulació i propagació.
+
+        Args:
+            estat: Estat de l'arrel. Es modifica amb ``mou`` i es restaura abans de retornar.
+            arrel: Node arrel.
+        """
+        cami = [arrel]
+        node = arrel
+        while True:
+            if node.terminal is None:
+                node.terminal = estat.es_meta()
+            if node.terminal:
+                break
+
+            if node.no_explorades is None:
+                node.no_explorades = estat.accions_possibles()
+                self.__simulador.rng.shuffle(node.no_explorades)
+                if self.heuristica:
+                    node.no_explorades = self.__ordena_heuristica(estat, node.no_explorades)
+
+            if node.no_explorades:
+                accio = node.no_explorades.pop()
+                fill = Node(accio)
+                node.fills[accio] = fill
+                estat.mou(accio)
+                cami.append(fill)
+                node = fill
+                node.terminal = estat.es_meta()
+                break
+
+            log_visites = math.log(node.visites)
+            node = max(
+                node.fills.values(), key=lambda f: f.uct(log_visites, self.exploracio)
+            )
+            estat.mou(node.accio)
+            cami.append(node)
+
+        # Recompensa per al jugador que ha fet el darrer moviment, és a dir, el del node.
+        n = self.simulacions
+        if node.terminal:
+            recompensa = n if estat.guanyador() else 0.5 * n
+        else:
+            recompensa = n - self.__simulador.simula(estat.bits, estat.torn, n)
+
+        for node in reversed(cami):
+            node.visites += n
+            node.guanys += recompensa
+            recompensa = n - recompensa
+
+        for _ in range(len(cami) - 1):
+            estat.desfes()
+
+    def actua(self, percepcio):
+        estat = EstatBits.des_de_percepcio(percepcio, radi=self.radi)
+        if estat.es_meta():
+            return "E"
+
+        self.__nou_simulador(estat)
+        arrel = self.__arrel_reutilitzada(estat)
+
+        limit = None
+        if self.temps_maxim is not None:
+            limit = time.perf_counter() + self.temps_maxim
+
+        self.iteracions_fetes = 0
+        while True:
+            self.itera(estat, arrel)
+            self.iteracions_fetes += 1
+
+            if self.iteracions is not None and self.iteracions_fetes >= self.iteracions:
+                break
+            if limit is not None and time.perf_counter() > limit:
+                break
+
+        millor = max(arrel.fills.values(), key=lambda f: f.visites)
+
+        self.__arrel = millor
+        estat.mou(millor.accio)
+        self.__bits_arrel = list(estat.bits)
+
+        return "P", millor.accio
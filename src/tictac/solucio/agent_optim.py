@@ -1,22 +1,39 @@
 """ Agent Minimax.
 
-Mòdul en el qual es desenvolupa un agent Minimax amb poda alfa-beta i una llista de visitats per resoldre el problema
-del Tic Tac Toe.
+Mòdul en el qual es desenvolupa un agent Minimax amb poda alfa-beta i una taula de transposició per resoldre el
+problema del Tic Tac Toe. La taula es conserva entre moviments d'una mateixa partida.
 
 Creat per: Miquel Miró Nicolau (UIB), 2025
 """
 from iaLib import agent
+from tictac import victoria
 from tictac.solucio.estat import Estat
+from tictac.solucio import transposicio
+from tictac.solucio.estat_bits import EstatBits
 
 
 
 class Agent(agent.Agent):
-    def __init__(self, poda = False):
+    def __init__(self, poda = False, bitboard = False, capacitat_taula = 1 << 20, simetria = False):
         super(Agent, self).__init__(long_memoria=1)
-        self.__tancats = None
+        self.__bitboard = bitboard or simetria
+        self.__simetria = simetria
+        self.__tancats = transposicio.TaulaTransposicio(capacitat_taula)
+        self.__pedres_anteriors = None
         self.__cami_exit = None
         self.__poda = poda
 
+    @property
+    def taula(self) -> transposicio.TaulaTransposicio:
+        return self.__tancats
+
+    def __clau(self, estat):
+        """ Clau de l'estat a la taula i simetria que porta a la forma canònica (si s'empra). """
+        if self.__simetria:
+            return estat.clau_canonica
+
+        return estat.clau, None
+
     def cerca(self, estat: Estat, alpha, beta, torn_max=True, iter=0):
         if estat.es_meta():
             res = 0
@@ -24,27 +41,74 @@ class Agent(agent.Agent):
                 res = (1 if not torn_max else -1)
             return estat, res
 
-        puntuacio_fills = []
+        alpha_inicial, beta_inicial = alpha, beta
+        # La cerca arriba fins al final de la partida: la profunditat restant és el nombre de
+        # moviments que queden com a molt.
+        profunditat = estat.caselles_buides()
+
+        # Els valors de la taula són des del punt de vista del jugador que mou: els passam a MAX.
+        # Els fills només es generen si la taula no resol la posició.
+        signe = 1 if torn_max else -1
+        clau, sim = self.__clau(estat)
+        entrada = self.__tancats.consulta(clau)
+        if entrada is not None:
+            if iter > 0 and entrada.profunditat >= profunditat:
+                valor = signe * entrada.valor
+                tipus = entrada.tipus
+                if tipus != transposicio.EXACTE and not torn_max:
+                    tipus = transposicio.INFERIOR + transposicio.SUPERIOR - tipus
+
+                if tipus == transposicio.EXACTE:
+                    return estat, valor
+                if tipus == transposicio.INFERIOR:
+                    alpha = max(alpha, valor)
+                else:
+                    beta = min(beta, valor)
+                if alpha >= beta:
+                    return estat, valor
+
+            # La millor acció de la taula s'explora primer.
+            millor_accio = entrada.millor_accio
+            if sim is not None:
+                millor_accio = estat.simetries.des_de_canonica(millor_accio, sim)
+            fills = estat.genera_fills()
+            fills.sort(key=lambda f: f.accions_previes[-1] != millor_accio)
+        else:
+            fills = estat.genera_fills()
 
-        for fill in estat.genera_fills():
-            if fill not in self.__tancats:
-                punt_fill = self.cerca(fill, alpha, beta, not torn_max, iter + 1)
+        puntuacio_fills = []
 
-                self.__tancats[fill] = punt_fill[1]
-            punt_fill = self.__tancats[fill]
+        for fill in fills:
+            punt_fill = self.cerca(fill, alpha, beta, not torn_max, iter + 1)
 
             if self.__poda:
                 if torn_max:
-                    alpha = max(alpha, punt_fill)
+                    alpha = max(alpha, punt_fill[1])
                 else:
-                    beta = min(beta, punt_fill)
+                    beta = min(beta, punt_fill[1])
 
-            puntuacio_fills.append((fill, punt_fill))
+            puntuacio_fills.append(punt_fill)
 
             if alpha >= beta:
                 break
 
         idx = Agent.arg_max(puntuacio_fills, not torn_max)
+        valor = puntuacio_fills[idx][1]
+
+        if valor <= alpha_inicial:
+            tipus = transposicio.SUPERIOR
+        elif valor >= beta_inicial:
+            tipus = transposicio.INFERIOR
+        else:
+            tipus = transposicio.EXACTE
+        if tipus != transposicio.EXACTE and not torn_max:
+            tipus = transposicio.INFERIOR + transposicio.SUPERIOR - tipus
+
+        millor_accio = fills[idx].accions_previes[-1]
+        if sim is not None:
+            millor_accio = estat.simetries.a_canonica(millor_accio, sim)
+
+        self.__tancats.guarda(clau, profunditat, signe * valor, tipus, millor_accio)
 
         return puntuacio_fills[idx]
 
@@ -79,8 +143,20 @@ class Agent(agent.Agent):
 
 
     def actua(self, percepcio):
-        self.__tancats = dict()
-        estat_inicial = Estat(percepcio["taulell"], percepcio["torn"])
+        if self.__bitboard:
+            estat_inicial = EstatBits.des_de_percepcio(percepcio, simetric=self.__simetria)
+        else:
+            estat_inicial = Estat(
+                percepcio["taulell"], percepcio["torn"], dificultat=percepcio.get("dificultat", 3)
+            )
+
+        # Si hi ha manco fitxes que al torn anterior, és una partida nova.
+        pedres = sum(bits.bit_count() for bits in victoria.a_bits(percepcio["taulell"]))
+        if self.__pedres_anteriors is not None and pedres < self.__pedres_anteriors:
+            self.__tancats.buida()
+        self.__pedres_anteriors = pedres
+        self.__tancats.nova_cerca()
+
         res = self.cerca(estat_inicial, alpha=-float('inf'), beta=float('inf'))
 
         if isinstance(res, tuple) and res[0].accions_previes is not None and len(res[0].accions_previes) > 0:
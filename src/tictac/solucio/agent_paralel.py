@@ -0,0 +1,281 @@
+""" Agent Minimax amb poda alfa-beta que reparteix la cerca entre diversos processos.
+
+La cerca es divideix als dos primers nivells amb l'esquema "young brothers wait": a l'arrel i a
+cada fill de l'arrel, el primer fill es cerca abans que els germans, que després es cerquen tots
+alhora. Les tasques dels processos són els néts de l'arrel, que es cerquen dins un
+``ProcessPoolExecutor``:
+
+    1. El primer nét del primer fill, sol.
+    2. La resta de néts del primer fill, amb la millor puntuació dels néts acabats com a beta.
+    3. Un cop se sap el valor del primer fill, el primer nét de cada altre fill, i quan un d'aquests
+       no talla, la resta de néts del seu fill.
+
+Així, als taulells grans hi ha fins a tantes tasques alhora com néts té l'arrel, en lloc de tants
+com fills. Cada cop que un fill acaba, la cota alfa compartida s'actualitza i els processos que
+encara cerquen la llegeixen per podar més; les tasques d'un fill que ja no pot superar la cota es
+cancel·len.
+
+El resultat és idèntic al de ``agent_alfa_beta.Agent``: es tria el primer fill (en el mateix ordre)
+amb la puntuació màxima. Per resoldre els empats igual, la cota compartida guarda el millor valor i
+l'índex del fill que l'ha obtingut. Un fill posterior l'ha de superar, i per tant empra el valor
+com a alfa; un fill anterior guanya l'empat, i empra el valor menys una unitat (les puntuacions
+són enteres). Així, un fill que no supera la seva alfa és pitjor que un de ja trobat, i un que la
+supera té el valor exacte. El valor d'un fill és el mínim dels seus néts: si supera la cota, cap
+nét ha fallat per sota i el mínim és exacte.
+
+``cancel`` no atura les tasques que ja s'executen. Per això cada cerca té un número de generació
+compartit: en acabar, l'agent l'incrementa i els treballadors que el llegeixen diferent del de la
+seva tasca s'aturen, i l'agent espera que totes les tasques hagin acabat abans de retornar. Així
+una cerca no deixa processos ocupats ni llegint la cota de la següent.
+"""
+import concurrent.futures
+import multiprocessing
+import os
+
+from iaLib import agent
+
+from tictac.solucio.estat_bits import EstatBits
+
+_alpha_compartida = None
+_generacio_compartida = None
+_generacio_tasca = None
+
+BITS_INDEX = 16
+SENSE_COTA = -2  # Menor que qualsevol puntuació: equival a alfa = -inf.
+
+
+class CercaAturada(Exception):
+    pass
+
+
+def _inicialitza(alpha_compartida, generacio_compartida):
+    global _alpha_compartida, _generacio_compartida
+    _alpha_compartida = alpha_compartida
+    _generacio_compartida = generacio_compartida
+
+
+def _codifica(valor, idx):
+    """ Empaqueta (valor, índex) en un sol enter que creix amb el valor i decreix amb l'índex. """
+    return (valor << BITS_INDEX) + ((1 << BITS_INDEX) - 1 - idx)
+
+
+def _descodifica(codi):
+    return codi >> BITS_INDEX, (1 << BITS_INDEX) - 1 - (codi & ((1 << BITS_INDEX) - 1))
+
+
+def _cota(idx, alpha_compartida=None):
+    """ Alfa que ha d'emprar el fill ``idx`` segons el millor fill trobat fins ara. """
+    if alpha_compartida is None:
+        alpha_compartida = _alpha_compartida
+    valor, millor_idx = _descodifica(alpha_compartida.value)
+
+    return valor if idx > millor_idx else valor - 1
+
+
+def alfa_beta(estat: EstatBits, alpha, beta, torn_max=True, comptador=None, idx=None):
+    """ Minimax amb poda alfa-beta amb la mateixa semàntica que ``agent_alfa_beta.Agent.cerca``.
+
+    Fa i desfà els moviments sobre un únic estat. Si es cerca un descendent del fill ``idx`` de
+    l'arrel dins un treballador, cada 64 nodes es llegeix la cota compartida i, si és més alta, s'empra com a alfa;
+    si la cerca de l'agent ja ha acabat, es llança ``CercaAturada``.
+
+    Args:
+        estat: Estat a cercar.
+        alpha: Cota inferior.
+        beta: Cota superior.
+        torn_max: Booleà indicant si és el torn del jugador MAX.
+        comptador: Llista d'un element amb el nombre de nodes visitats.
+        idx: Índex del fill de l'arrel que es cerca, o None fora dels treballadors.
+
+    Returns:
+        Puntuació de l'estat des del punt de vista de MAX.
+    """
+    if comptador is None:
+        comptador = [0]
+    comptador[0] += 1
+
+    if estat.es_meta():
+        return (1 if not torn_max else -1) if estat.guanyador() else 0
+
+    if idx is not None and comptador[0] & 63 == 0:
+        if _generacio_compartida.value != _generacio_tasca:
+            raise CercaAturada()
+        alpha = max(alpha, _cota(idx))
+
+    millor = -float("inf") if torn_max else float("inf")
+    for acc in estat.accions_possibles():
+        estat.mou(acc)
+        punt = alfa_beta(estat, alpha, beta, not torn_max, comptador, idx)
+        estat.desfes()
+
+        if torn_max:
+            millor = max(millor, punt)
+            alpha = max(alpha, punt)
+        else:
+            millor = min(millor, punt)
+            beta = min(beta, punt)
+
+        if alpha >= beta:
+            break
+
+    return millor
+
+
+def _cerca_net(mida, dificultat, bits, fitxa, accions, idx, beta, generacio):
+    """ Tasca d'un treballador: cerca el nét de l'arrel que s'obté amb les dues ``accions``.
+
+    ``idx`` és l'índex del fill de l'arrel per on passa, ``beta`` el millor valor dels néts del
+    mateix fill que ja han acabat i ``generacio`` el número de la cerca de l'agent.
+    """
+    global _generacio_tasca
+    _generacio_tasca = generacio
+    estat = EstatBits(mida, fitxa, dificultat, bits)
+    for accio in accions:
+        estat.mou(accio)
+
+    return alfa_beta(estat, _cota(idx), beta, torn_max=True, idx=idx)
+
+
+class Agent(agent.Agent):
+    def __init__(self, treballadors=None):
+        super(Agent, self).__init__(long_memoria=1)
+        self.treballadors = treballadors or os.cpu_count()
+
+        self.__alpha = multiprocessing.RawValue("q", 0)
+        self.__generacio = multiprocessing.RawValue("q", 0)
+        self.__pool = None
+
+    def __del__(self):
+        self.tanca()
+
+    def tanca(self):
+        """ Atura els processos treballadors. """
+        if self.__pool is not None:
+            self.__pool.shutdown(cancel_futures=True)
+            self.__pool = None
+
+    def __executor(self):
+        if self.__pool is None:
+            self.__pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.treballadors,
+                initializer=_inicialitza,
+                initargs=(self.__alpha, self.__generacio),
+            )
+
+        return self.__pool
+
+    def cerca(self, estat: EstatBits):
+        """ Cerca l'arrel repartint els néts entre els processos.
+
+        Args:
+            estat: Estat arrel, on mou el jugador MAX.
+
+        Returns:
+            Tupla (millor acció, puntuació).
+        """
+        accions = estat.accions_possibles()
+        executor = self.__executor()
+        bits = tuple(estat.bits)
+
+        # Per a cada fill: accions dels néts, valor mínim dels néts acabats i tasques pendents.
+        nets = []
+        minims = []
+        for acc in accions:
+            estat.mou(acc)
+            if estat.es_meta():
+                nets.append([])
+                minims.append(alfa_beta(estat, -float("inf"), float("inf"), torn_max=False))
+            else:
+                nets.append(estat.accions_possibles())
+                minims.append(float("inf"))
+            estat.desfes()
+        pendents = [set() for _ in accions]
+        acabats = [not fills for fills in nets]
+
+        self.__alpha.value = _codifica(SENSE_COTA, (1 << BITS_INDEX) - 1)
+        generacio = self.__generacio.value
+        millor = None
+        futurs = {}
+        enviats = []
+
+        def envia(i, js):
+            beta = minims[i]
+            for j in js:
+                futur = executor.submit(
+                    _cerca_net,
+                    estat.mida,
+                    estat.dificultat,
+                    bits,
+                    estat.fitxa,
+                    (accions[i], nets[i][j]),
+                    i,
+                    beta,
+                    generacio,
+                )
+                enviats.append(futur)
+                futurs[futur] = (i, j)
+                pendents[i].add(futur)
+
+        def tanca_fill(i):
+            """ Dona per acabat el fill ``i`` i cancel·la les seves tasques pendents. """
+            nonlocal millor
+            acabats[i] = True
+            for futur in pendents[i]:
+                futur.cancel()
+                futurs.pop(futur, None)
+            pendents[i].clear()
+
+            # Un valor que millora (valor, -índex) ha superat la seva alfa: és exacte.
+            if millor is None or (minims[i], -i) > (millor[0], -millor[1]):
+                millor = (minims[i], i)
+                self.__alpha.value = _codifica(*millor)
+
+        def comenca_germans():
+            for i in range(1, len(accions)):
+                if acabats[i]:
+                    tanca_fill(i)
+                else:
+                    envia(i, [0])
+
+        if acabats[0]:
+            tanca_fill(0)
+            comenca_germans()
+        else:
+            envia(0, [0])
+
+        while futurs:
+            fet, _ = concurrent.futures.wait(
+                futurs, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for futur in fet:
+                if futur not in futurs:
+                    continue
+                i, j = futurs.pop(futur)
+                pendents[i].discard(futur)
+                minims[i] = min(minims[i], futur.result())
+
+                if minims[i] <= _cota(i, self.__alpha):
+                    # El fill ja no pot superar el millor: es descarta sense acabar.
+                    tanca_fill(i)
+                elif j == 0:
+                    envia(i, range(1, len(nets[i])))
+
+                if not acabats[i] and not pendents[i]:
+                    tanca_fill(i)
+                    if i == 0:
+                        comenca_germans()
+
+        # Atura les tasques que encara s'executen i espera que acabin.
+        self.__generacio.value = generacio + 1
+        concurrent.futures.wait(enviats)
+
+        return accions[millor[1]], millor[0]
+
+    def actua(self, percepcio):
+        estat = EstatBits.des_de_percepcio(percepcio)
+        if estat.es_meta():
+            return "E"
+
+        accio, _ = self.cerca(estat)
+
+        return "P", accio
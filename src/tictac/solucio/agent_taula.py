@@ -0,0 +1,37 @@
+""" Agent del Tic-Tac-Toe de 3x3 que consulta una taula de posicions resoltes.
+
+En lloc de fer una cerca Minimax a cada torn, l'agent projecta a memòria la taula de
+``tictac.solucio.taula_3x3`` quan es crea i respon cada jugada amb una sola consulta. Si el
+taulell no és de 3x3 amb dificultat 3, o la posició no és a la taula, recorre a la cerca de
+``agent.Agent``.
+"""
+from tictac import victoria
+from tictac.solucio import agent as agent_minimax
+from tictac.solucio import taula_3x3
+
+
+class Agent(agent_minimax.Agent):
+    def __init__(self, cami=taula_3x3.CAMI):
+        super(Agent, self).__init__(bitboard=True)
+        self.__taula = taula_3x3.carrega(cami)
+
+    def actua(self, percepcio):
+        taulell = percepcio["taulell"]
+        mida = (len(taulell), len(taulell[0]))
+
+        if mida == taula_3x3.MIDA and percepcio.get("dificultat", 3) == taula_3x3.DIFICULTAT:
+            bits_0, bits_x = victoria.a_bits(taulell)
+
+            # La taula només conté posicions on "0" ha començat la partida.
+            torn = "0" if bits_0.bit_count() == bits_x.bit_count() else "X"
+            resultat = None
+            if torn == percepcio["torn"]:
+                resultat = taula_3x3.consulta(self.__taula, bits_0, bits_x)
+
+            if resultat is not None:
+                _, accio = resultat
+                if accio is None:
+                    return "E"
+                return "P", accio
+
+        return super(Agent, self).actua(percepcio)
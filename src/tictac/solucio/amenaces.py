@@ -0,0 +1,236 @@
+""" Cerca en l'espai d'amenaces per al joc de n en línia.
+
+Als taulells grans amb dificultat 4 o 5, una victòria forçada sol ser una seqüència llarga de
+jugades on l'atacant amenaça guanyar a cada torn i el defensor només pot tapar. Aquesta cerca
+només mira aquestes seqüències, de manera que troba (o descarta) victòries forçades molt més
+profundes que una cerca alfa-beta de tot el taulell.
+
+Anomenam "quatre" una línia de ``tictac.victoria`` amb ``dificultat - 1`` fitxes d'un jugador i cap
+del rival: la casella buida que hi queda és una casella guanyadora. Un "tres" és una línia amb
+``dificultat - 2`` fitxes i cap del rival.
+
+    - ``vcf`` (victòria per quatres continus): l'atacant només juga moviments que fan un quatre.
+      Si en fa dos alhora guanya; si no, el defensor ha de tapar l'única casella guanyadora.
+    - ``vct`` (victòria per amenaces): a més dels quatres, l'atacant pot jugar moviments que fan un
+      tres i després dels quals tendria un ``vcf`` si tornàs a moure. Aquí el defensor pot
+      respondre a qualsevol casella buida, i l'atacant ha de guanyar contra totes les respostes.
+
+En tots dos casos, si el defensor té un quatre, l'atacant l'ha de tapar (i si en té dos, perd).
+Totes les victòries trobades són forçades. Quan la cerca supera el límit de nodes, cada node
+restant respon que no ha trobat res, de manera que el resultat continua essent correcte.
+"""
+import time
+
+from tictac import victoria
+from tictac.solucio.estat_bits import EstatBits
+
+
+class CercaAmenaces:
+    def __init__(self, mida, dificultat, max_nodes: int = 20_000):
+        """ Cerca d'amenaces per a una mida i dificultat.
+
+        Args:
+            mida: Tupla (files, columnes).
+            dificultat: Nombre de fitxes en línia necessàries per guanyar.
+            max_nodes: Nombre màxim de nodes de cada crida a ``guanya``.
+        """
+        self.mida = mida
+        self.dificultat = dificultat
+        self.max_nodes = max_nodes
+        self.nodes = 0
+        self.__limit = None
+
+        linies = victoria.linies(mida, dificultat)
+        self.__linies = linies.linies
+        self.__per_casella = linies.per_casella
+        self.__posicions = [
+            (idx // mida[1], idx % mida[1]) for idx in range(mida[0] * mida[1])
+        ]
+
+    def caselles_guanyadores(self, propies, rivals):
+        """ Màscara de les caselles on ``propies`` guanyaria amb un sol moviment. """
+        n = self.dificultat
+        caselles = 0
+        for mascara in self.__linies:
+            if not rivals & mascara and (propies & mascara).bit_count() == n - 1:
+                caselles |= mascara & ~propies
+
+        return caselles
+
+    def __fa_linia(self, propies, rivals, idx, fitxes):
+        """ Indica si jugar a ``idx`` deixa alguna línia amb ``fitxes`` fitxes pròpies i cap rival. """
+        propies |= 1 << idx
+        for mascara in self.__per_casella[idx]:
+            if not rivals & mascara and (propies & mascara).bit_count() == fitxes:
+                return True
+
+        return False
+
+    def __moviments(self, estat: EstatBits, fitxes):
+        """ Caselles buides que deixen alguna línia amb ``fitxes`` fitxes de l'atacant. """
+        propies, rivals = estat.bits[estat.torn], estat.bits[estat.torn ^ 1]
+        ocupades = propies | rivals
+
+        return [
+            idx
+            for idx in range(len(self.__posicions))
+            if not (ocupades >> idx) & 1 and self.__fa_linia(propies, rivals, idx, fitxes)
+        ]
+
+    def __node(self):
+        """ Compta un node i indica si encara es pot cercar. """
+        self.nodes += 1
+        if self.nodes > self.max_nodes:
+            return False
+        if self.__limit is not None and self.nodes & 7 == 0 and time.perf_counter() > self.__limit:
+            # A partir d'ara tots els nodes superen el límit.
+            self.nodes = self.max_nodes
+            return False
+
+        return True
+
+    def __obligada(self, estat: EstatBits):
+        """ Caselles guanyadores del defensor que l'atacant ha de tapar.
+
+        Returns:
+            Màscara de caselles (0 si no n'hi ha cap), o None si n'hi ha més d'una i l'atacant ja
+            no pot evitar perdre.
+        """
+        defensa = self.caselles_guanyadores(estat.bits[estat.torn ^ 1], estat.bits[estat.torn])
+        if defensa & (defensa - 1):
+            return None
+
+        return defensa
+
+    def vcf(self, estat: EstatBits, profunditat):
+        """ Cerca una victòria fent un quatre a cada moviment.
+
+        Args:
+            estat: Estat on mou l'atacant. Es restaura abans de retornar.
+            profunditat: Nombre màxim de quatres.
+
+        Returns:
+            Índex de la primera casella de la victòria, o None.
+        """
+        if not self.__node():
+            return None
+        atacant = estat.torn
+
+        guanyadores = self.caselles_guanyadores(estat.bits[atacant], estat.bits[atacant ^ 1])
+        if guanyadores:
+            return (guanyadores & -guanyadores).bit_length() - 1
+
+        obligada = self.__obligada(estat)
+        if obligada is None or profunditat == 0:
+            return None
+
+        for idx in self.__moviments(estat, self.dificultat - 1):
+            if obligada and not (obligada >> idx) & 1:
+                continue
+
+            estat.mou(self.__posicions[idx])
+            amenaces = self.caselles_guanyadores(estat.bits[atacant], estat.bits[atacant ^ 1])
+            guanya = bool(amenaces & (amenaces - 1))
+            if not guanya:
+                bloqueig = amenaces.bit_length() - 1
+                estat.mou(self.__posicions[bloqueig])
+                guanya = self.vcf(estat, profunditat - 1) is not None
+                estat.desfes()
+            estat.desfes()
+
+            if guanya:
+                return idx
+
+        return None
+
+    def vct(self, estat: EstatBits, profunditat, profunditat_vcf):
+        """ Cerca una victòria amb quatres i tresos.
+
+        Args:
+            estat: Estat on mou l'atacant. Es restaura abans de retornar.
+            profunditat: Nombre màxim de tresos de la seqüència.
+            profunditat_vcf: Nombre màxim de quatres de cada ``vcf``.
+
+        Returns:
+            Índex de la primera casella de la victòria, o None.
+        """
+        idx = self.vcf(estat, profunditat_vcf)
+        if idx is not None or profunditat == 0:
+            return idx
+
+        obligada = self.__obligada(estat)
+        if obligada is None:
+            return None
+
+        if not self.__node():
+            return None
+        for idx in self.__moviments(estat, self.dificultat - 2):
+            if obligada and not (obligada >> idx) & 1:
+                continue
+
+            estat.mou(self.__posicions[idx])
+
+            # Només és una amenaça si l'atacant guanyaria amb un vcf tornant a moure.
+            estat.passa()
+            amenaca = self.vcf(estat, profunditat_vcf) is not None
+            estat.desfes_passa()
+
+            guanya = amenaca and self.__refuta_defensor(estat, profunditat, profunditat_vcf)
+            estat.desfes()
+
+            if guanya:
+                return idx
+
+        return None
+
+    def __refuta_defensor(self, estat: EstatBits, profunditat, profunditat_vcf):
+        """ Comprova que l'atacant guanya contra totes les respostes del defensor. """
+        defensor = estat.torn
+        atacant = defensor ^ 1
+
+        if self.caselles_guanyadores(estat.bits[defensor], estat.bits[atacant]):
+            return False
+
+        # Primer les caselles de les línies de l'atacant, que són les que més probablement refuten.
+        ocupades = estat.ocupades
+        properes = 0
+        for mascara in self.__linies:
+            if not estat.bits[defensor] & mascara and estat.bits[atacant] & mascara:
+                properes |= mascara
+        respostes = [idx for idx in range(len(self.__posicions)) if not (ocupades >> idx) & 1]
+        if not respostes:
+            return False
+        respostes.sort(key=lambda idx: not (properes >> idx) & 1)
+
+        for idx in respostes:
+            estat.mou(self.__posicions[idx])
+            guanya = self.vct(estat, profunditat - 1, profunditat_vcf) is not None
+            estat.desfes()
+
+            if not guanya:
+                return False
+
+        return True
+
+    def guanya(self, estat: EstatBits, profunditat=1, profunditat_vcf=None, temps_maxim=None):
+        """ Cerca una victòria forçada per al jugador que mou.
+
+        Args:
+            estat: Estat on mou l'atacant. Es restaura abans de retornar.
+            profunditat: Nombre màxim de tresos (0 per fer només ``vcf``).
+            profunditat_vcf: Nombre màxim de quatres. Per defecte, les caselles buides.
+            temps_maxim: Segons màxims de cerca, a més del límit de nodes.
+
+        Returns:
+            Posició (x, y) del primer moviment de la victòria, o None si no se n'ha trobat cap.
+        """
+        if estat.es_meta():
+            return None
+        if profunditat_vcf is None:
+            profunditat_vcf = self.mida[0] * self.mida[1] - estat.ocupades.bit_count()
+
+        self.nodes = 0
+        self.__limit = None if temps_maxim is None else time.perf_counter() + temps_maxim
+        idx = self.vct(estat, profunditat, profunditat_vcf)
+
+        return None if idx is None else self.__posicions[idx]
@@ -0,0 +1,120 @@
+""" Avaluació heurística de lots de taulells amb NumPy.
+
+Compta, per a cada taulell d'un lot, les línies obertes de cada jugador segons quantes fitxes
+hi té (una línia és oberta per a un jugador si no conté cap fitxa del rival). Les línies són les
+finestres de ``dificultat`` caselles en les quatre direccions de ``tictac.victoria.DIRECCIONS``, i
+les fitxes de cada finestra s'obtenen sumant ``dificultat`` talls desplaçats del taulell, de
+manera que tot el lot es resol amb unes poques operacions sobre arrays.
+
+La puntuació és la mateixa que ``agent_iteratiu.Agent.avalua``: cada línia oberta amb ``k``
+fitxes suma ``10 ** k`` per al jugador i la resta per al rival.
+"""
+import functools
+
+import numpy as np
+
+from tictac.victoria import DIRECCIONS
+
+
+class Avaluador:
+    def __init__(self, mida, dificultat):
+        self.mida = mida
+        self.dificultat = dificultat
+        self.caselles = mida[0] * mida[1]
+        self.pesos = np.array([0] + [10 ** k for k in range(1, dificultat + 1)], dtype=np.int64)
+
+    def a_arrays(self, bits):
+        """ Converteix enters de bits a arrays de caselles.
+
+        Args:
+            bits: Seqüència d'enters (un per taulell) amb el bit ``x * columnes + y`` de cada
+                casella ocupada.
+
+        Returns:
+            Array de ``uint8`` de forma (taulells, files, columnes).
+        """
+        octets = (self.caselles + 7) // 8
+        dades = b"".join(b.to_bytes(octets, "little") for b in bits)
+        caselles = np.unpackbits(
+            np.frombuffer(dades, dtype=np.uint8).reshape(len(bits), octets),
+            axis=1,
+            count=self.caselles,
+            bitorder="little",
+        )
+
+        return caselles.reshape(len(bits), *self.mida)
+
+    def finestres(self, taulells):
+        """ Fitxes de cada finestra de ``dificultat`` caselles, en les quatre direccions.
+
+        Args:
+            taulells: Array (taulells, files, columnes) amb 1 a les caselles d'un jugador.
+
+        Returns:
+            Array (taulells, finestres) amb la suma de cada finestra.
+        """
+        n = self.dificultat
+        files, columnes = self.mida
+        sumes = []
+        for d_x, d_y in DIRECCIONS:
+            # Rang de les caselles inicials de les finestres que caben al taulell.
+            x_fi = files - (n - 1) * d_x
+            y_ini = (n - 1) if d_y < 0 else 0
+            y_fi = columnes - (n - 1) * max(d_y, 0)
+            if x_fi <= 0 or y_fi <= y_ini:
+                continue
+
+            suma = sum(
+                taulells[
+                    :,
+                    k * d_x: x_fi + k * d_x,
+                    y_ini + k * d_y: y_fi + k * d_y,
+                ].astype(np.int16)
+                for k in range(n)
+            )
+            sumes.append(suma.reshape(len(taulells), -1))
+
+        return np.concatenate(sumes, axis=1)
+
+    def recomptes(self, propies, rivals):
+        """ Línies obertes de cada jugador segons el nombre de fitxes.
+
+        Args:
+            propies: Array (taulells, files, columnes) amb les fitxes del jugador.
+            rivals: Array (taulells, files, columnes) amb les fitxes del rival.
+
+        Returns:
+            Array (taulells, 2, dificultat + 1): ``[:, 0, k]`` són les línies obertes del jugador
+            amb ``k`` fitxes i ``[:, 1, k]`` les del rival.
+        """
+        meves = self.finestres(propies)
+        seves = self.finestres(rivals)
+
+        recomptes = np.zeros((len(propies), 2, self.dificultat + 1), dtype=np.int64)
+        for k in range(self.dificultat + 1):
+            recomptes[:, 0, k] = ((meves == k) & (seves == 0)).sum(axis=1)
+            recomptes[:, 1, k] = ((seves == k) & (meves == 0)).sum(axis=1)
+
+        return recomptes
+
+    def avalua(self, propies, rivals):
+        """ Puntuació de línies obertes de cada taulell des del punt de vista del jugador.
+
+        Args:
+            propies: Seqüència d'enters de bits, o array (taulells, files, columnes).
+            rivals: El mateix per al rival.
+
+        Returns:
+            Array de ``int64`` amb una puntuació per taulell.
+        """
+        if not isinstance(propies, np.ndarray):
+            propies, rivals = self.a_arrays(propies), self.a_arrays(rivals)
+
+        recomptes = self.recomptes(propies, rivals)
+
+        return (recomptes[:, 0, :] - recomptes[:, 1, :]) @ self.pesos
+
+
+@functools.cache
+def avaluador(mida, dificultat) -> Avaluador:
+    return Avaluador(mida, dificultat)
@@ -0,0 +1,379 @@
+""" Comparació de rendiment de les representacions de l'estat del Tic-Tac-Toe.
+
+Executa un Minimax complet (sense poda) sobre unes quantes posicions fixes i mesura els nodes per
+segon de cada representació:
+
+    - ``llista``: ``Estat``, llista de llistes i ``copy.deepcopy`` a cada fill.
+    - ``bits``: ``EstatBits`` emprant ``genera_fills``, tal com ho fan els agents.
+    - ``bits mou/desfes``: ``EstatBits`` fent i desfent moviments sobre un únic estat.
+
+També compara els nodes que expandeix ``agent_optim.Agent`` amb i sense claus canòniques per
+simetria sobre taulells buits o gairebé buits, i la taxa de talls, els fills explorats per node i
+el factor de ramificació efectiu de cada esquema d'ordenació de moviments. ``compara_paralel``
+mesura l'acceleració de ``agent_paralel.Agent`` respecte de la cerca seqüencial amb diferents
+nombres de processos, sobre posicions de 4x4 i de 5x5 (``POSICIONS_PARALEL``).
+
+Ús:
+    PYTHONPATH=src python -m tictac.solucio.benchmark
+"""
+import contextlib
+import io
+import time
+
+from tictac.solucio import agent_alfa_beta, agent_iteratiu, agent_optim, agent_paralel, ordenacio
+from tictac.solucio.estat import Estat
+from tictac.solucio.estat_bits import EstatBits
+
+POSICIONS = [
+    (
+        "3x3, 1 fitxa",
+        [[" ", " ", " "], [" ", "0", " "], [" ", " ", " "]],
+        "X",
+        3,
+    ),
+    (
+        "3x3, 2 fitxes",
+        [["X", " ", " "], [" ", "0", " "], [" ", " ", " "]],
+        "0",
+        3,
+    ),
+    (
+        "4x4, 8 fitxes",
+        [
+            ["0", "X", " ", "X"],
+            ["X", " ", "0", " "],
+            [" ", "X", "0", " "],
+            ["0", " ", " ", " "],
+        ],
+        "0",
+        3,
+    ),
+]
+
+POSICIONS_SIMETRIA = [
+    ("3x3 buit", [[" "] * 3 for _ in range(3)], "0", 3),
+    ("3x3, 1 fitxa", [["0", " ", " "], [" ", " ", " "], [" ", " ", " "]], "X", 3),
+    ("4x4/3 buit", [[" "] * 4 for _ in range(4)], "0", 3),
+]
+
+ESQUEMES_ORDENACIO = [
+    (),
+    (ordenacio.ESTATICA,),
+    (ordenacio.KILLER,),
+    (ordenacio.HISTORIA,),
+    (ordenacio.PV,),
+    ordenacio.ESQUEMES,
+]
+
+POSICIONS_ORDENACIO = [
+    # (nom, classe d'agent, paràmetres de l'agent, taulell, fitxa, dificultat)
+    (
+        "4x4/3 alfa-beta",
+        agent_alfa_beta.Agent,
+        {"bitboard": True},
+        [["0", " ", " ", " "], [" ", "X", " ", " "], [" ", " ", " ", " "], [" ", " ", " ", " "]],
+        "0",
+        3,
+    ),
+    (
+        "8x8/4 iteratiu p3",
+        agent_iteratiu.Agent,
+        {"temps_maxim": float("inf"), "profunditat_maxima": 3, "amenaces": False},
+        [
+            [" "] * 8,
+            [" "] * 8,
+            [" ", " ", "X", " ", " ", " ", " ", " "],
+            [" ", " ", " ", "0", "0", " ", " ", " "],
+            [" ", " ", " ", " ", "X", " ", " ", " "],
+            [" "] * 8,
+            [" "] * 8,
+            [" "] * 8,
+        ],
+        "0",
+        4,
+    ),
+]
+
+POSICIONS_PARALEL = [
+    # (nom, taulell, fitxa, dificultat)
+    (
+        "4x4/3, 2 fitxes",
+        [["0", " ", " ", " "], [" ", "X", " ", " "], [" ", " ", " ", " "], [" ", " ", " ", " "]],
+        "0",
+        3,
+    ),
+    (
+        "5x5/4, 11 fitxes",
+        [
+            ["0", "0", "0", " ", " "],
+            [" ", " ", " ", " ", " "],
+            [" ", "X", "X", " ", "X"],
+            [" ", " ", "0", "X", " "],
+            [" ", "0", " ", "0", "X"],
+        ],
+        "X",
+        4,
+    ),
+]
+
+
+def amb_comptador(classe_agent):
+    """ Crea una subclasse de l'agent que compta les crides a ``cerca`` (nodes expandits). """
+
+    class AgentComptador(classe_agent):
+        nodes = 0
+
+        def cerca(self, *args, **kwargs):
+            self.nodes += 1
+            return super().cerca(*args, **kwargs)
+
+    return AgentComptador
+
+
+def minimax_fills(estat, torn_max=True):
+    """ Minimax sense poda que genera els fills amb ``genera_fills``.
+
+    Args:
+        estat: Estat inicial (``Estat`` o ``EstatBits``).
+        torn_max: Booleà indicant si és el torn del jugador MAX.
+
+    Returns:
+        Tupla (puntuació, nodes expandits).
+    """
+    if estat.es_meta():
+        return (-1 if torn_max else 1) if estat.guanyador() else 0, 1
+
+    nodes = 1
+    puntuacions = []
+    for fill in estat.genera_fills():
+        punt, nodes_fill = minimax_fills(fill, not torn_max)
+        puntuacions.append(punt)
+        nodes += nodes_fill
+
+    return (max(puntuacions) if torn_max else min(puntuacions)), nodes
+
+
+def minimax_mou(estat: EstatBits, torn_max=True):
+    """ Minimax sense poda que fa i desfà els moviments sobre un únic ``EstatBits``.
+
+    Args:
+        estat: Estat inicial.
+        torn_max: Booleà indicant si és el torn del jugador MAX.
+
+    Returns:
+        Tupla (puntuació, nodes expandits).
+    """
+    if estat.es_meta():
+        return (-1 if torn_max else 1) if estat.guanyador() else 0, 1
+
+    nodes = 1
+    puntuacions = []
+    for acc in estat.accions_possibles():
+        estat.mou(acc)
+        punt, nodes_fill = minimax_mou(estat, not torn_max)
+        estat.desfes()
+        puntuacions.append(punt)
+        nodes += nodes_fill
+
+    return (max(puntuacions) if torn_max else min(puntuacions)), nodes
+
+
+def mesura(funcio, estat):
+    inici = time.perf_counter()
+    punt, nodes = funcio(estat)
+    temps = time.perf_counter() - inici
+
+    return punt, nodes, temps
+
+
+def compara_representacions(posicions=None):
+    """ Mesura els nodes per segon de cada representació sobre les posicions donades.
+
+    Args:
+        posicions: Llista de tuples (nom, taulell, fitxa, dificultat). Per defecte ``POSICIONS``.
+
+    Returns:
+        Llista de diccionaris amb els resultats de cada posició i representació.
+    """
+    if posicions is None:
+        posicions = POSICIONS
+
+    resultats = []
+    for nom, taulell, fitxa, dificultat in posicions:
+        representacions = [("llista", minimax_fills, Estat([list(f) for f in taulell], fitxa))]
+        for repr_nom, funcio in (("bits", minimax_fills), ("bits mou/desfes", minimax_mou)):
+            representacions.append(
+                (repr_nom, funcio, EstatBits.des_de_taulell(taulell, fitxa, dificultat))
+            )
+
+        for repr_nom, funcio, estat in representacions:
+            punt, nodes, temps = mesura(funcio, estat)
+            resultats.append({
+                "posicio": nom,
+                "representacio": repr_nom,
+                "puntuacio": punt,
+                "nodes": nodes,
+                "temps": temps,
+                "nodes_per_segon": nodes / temps,
+            })
+
+    return resultats
+
+
+def compara_simetries(posicions=None, poda=True):
+    """ Compta els nodes de ``agent_optim.Agent`` amb i sense claus canòniques per simetria.
+
+    Args:
+        posicions: Llista de tuples (nom, taulell, fitxa, dificultat). Per defecte
+            ``POSICIONS_SIMETRIA``.
+        poda: Booleà indicant si l'agent fa poda alfa-beta.
+
+    Returns:
+        Llista de diccionaris amb els resultats de cada posició.
+    """
+    if posicions is None:
+        posicions = POSICIONS_SIMETRIA
+
+    resultats = []
+    for nom, taulell, fitxa, dificultat in posicions:
+        res = {"posicio": nom}
+        for simetria in (False, True):
+            ag = amb_comptador(agent_optim.Agent)(poda=poda, bitboard=True, simetria=simetria)
+            estat = EstatBits.des_de_taulell(taulell, fitxa, dificultat, simetric=simetria)
+
+            inici = time.perf_counter()
+            _, punt = ag.cerca(estat, alpha=-float("inf"), beta=float("inf"))
+            clau = "simetria" if simetria else "sense_simetria"
+            res[clau] = {"nodes": ag.nodes, "temps": time.perf_counter() - inici, "puntuacio": punt}
+
+        res["reduccio"] = res["sense_simetria"]["nodes"] / res["simetria"]["nodes"]
+        resultats.append(res)
+
+    return resultats
+
+
+def compara_ordenacions(posicions=None, esquemes=None):
+    """ Mesura la taxa de talls, els fills per node i la ramificació efectiva de cada ordenació.
+
+    Args:
+        posicions: Llista de tuples (nom, classe d'agent, paràmetres, taulell, fitxa, dificultat).
+            Per defecte ``POSICIONS_ORDENACIO``.
+        esquemes: Llista de combinacions d'esquemes. Per defecte ``ESQUEMES_ORDENACIO``.
+
+    Returns:
+        Llista de diccionaris amb les estadístiques de cada posició i esquema.
+    """
+    if posicions is None:
+        posicions = POSICIONS_ORDENACIO
+    if esquemes is None:
+        esquemes = ESQUEMES_ORDENACIO
+
+    resultats = []
+    for nom, classe, parametres, taulell, fitxa, dificultat in posicions:
+        percepcio = {
+            "taulell": taulell,
+            "mida": (len(taulell), len(taulell[0])),
+            "torn": fitxa,
+            "dificultat": dificultat,
+        }
+        for esquema in esquemes:
+            ag = classe(ordenacio=esquema, instrumentacio=True, **parametres)
+
+            inici = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                ag.actua(percepcio)
+            temps = time.perf_counter() - inici
+
+            resultats.append({
+                "posicio": nom,
+                "ordenacio": "+".join(esquema) or "cap",
+                "temps": temps,
+                **ag.estadistiques.com_diccionari(),
+            })
+
+    return resultats
+
+
+def compara_paralel(posicions=None, treballadors=(1, 2, 4, 8)):
+    """ Compara el temps de ``agent_paralel.Agent`` amb el de la cerca alfa-beta seqüencial.
+
+    Args:
+        posicions: Llista de tuples (nom, taulell, fitxa, dificultat). Per defecte
+            ``POSICIONS_PARALEL``.
+        treballadors: Nombres de processos a provar.
+
+    Returns:
+        Llista de diccionaris amb el temps i l'acceleració de cada posició i configuració.
+    """
+    if posicions is None:
+        posicions = POSICIONS_PARALEL
+
+    resultats = []
+    for nom, taulell, fitxa, dificultat in posicions:
+        estat = EstatBits.des_de_taulell(taulell, fitxa, dificultat)
+        inici = time.perf_counter()
+        agent_paralel.alfa_beta(estat, -float("inf"), float("inf"))
+        temps_sequencial = time.perf_counter() - inici
+
+        resultats.append(
+            {"posicio": nom, "treballadors": 0, "temps": temps_sequencial, "acceleracio": 1.0}
+        )
+        for n in treballadors:
+            ag = agent_paralel.Agent(treballadors=n)
+            ag.cerca(EstatBits.des_de_taulell(taulell, fitxa, dificultat))  # Arrenca els processos.
+
+            inici = time.perf_counter()
+            ag.cerca(EstatBits.des_de_taulell(taulell, fitxa, dificultat))
+            temps = time.perf_counter() - inici
+            ag.tanca()
+
+            resultats.append({
+                "posicio": nom,
+                "treballadors": n,
+                "temps": temps,
+                "acceleracio": temps_sequencial / temps,
+            })
+
+    return resultats
+
+
+def main():
+    resultats = compara_representacions()
+
+    print(f"{'Posició':<16}{'Representació':<18}{'Nodes':>10}{'Temps (s)':>12}{'Nodes/s':>12}")
+    for res in resultats:
+        print(
+            f"{res['posicio']:<16}{res['representacio']:<18}{res['nodes']:>10}"
+            f"{res['temps']:>12.3f}{res['nodes_per_segon']:>12.0f}"
+        )
+
+    # Sense poda només es mesuren les posicions de 3x3: la de 4x4 és massa gran.
+    for poda, posicions in ((False, POSICIONS_SIMETRIA[:2]), (True, POSICIONS_SIMETRIA)):
+        print()
+        print(f"{'Posició':<16}{'Poda':<6}{'Nodes':>12}{'Nodes sim.':>12}{'Reducció':>10}")
+        for res in compara_simetries(posicions, poda):
+            print(
+                f"{res['posicio']:<16}{str(poda):<6}{res['sense_simetria']['nodes']:>12}"
+                f"{res['simetria']['nodes']:>12}{res['reduccio']:>9.1f}x"
+            )
+
+    print()
+    print(f"{'Posició':<20}{'Ordenació':<36}{'Nodes':>10}{'Talls':>8}{'1r fill':>9}{'Fills':>8}{'b*':>8}")
+    for res in compara_ordenacions():
+        print(
+            f"{res['posicio']:<20}{res['ordenacio']:<36}{res['nodes']:>10}"
+            f"{res['taxa_talls']:>8.1%}{res['taxa_talls_primer_fill']:>9.1%}"
+            f"{res['fills_per_node']:>8.2f}{res['factor_ramificacio_efectiu']:>8.2f}"
+        )
+
+    print()
+    print(f"{'Posició':<20}{'Processos':<12}{'Temps (s)':>12}{'Acceleració':>14}")
+    for res in compara_paralel():
+        nom = str(res["treballadors"]) if res["treballadors"] else "seqüencial"
+        print(
+            f"{res['posicio']:<20}{nom:<12}{res['temps']:>12.3f}{res['acceleracio']:>13.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
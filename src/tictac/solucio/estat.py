@@ -1,10 +1,18 @@
 import copy
 from tictac import victoria
+from tictac.solucio import transposicio
 
 class Estat:
 
-    def __init__(self, taulell, fitxa: str, accions_previes=None):
+    def __init__(
+            self, taulell, fitxa: str, accions_previes=None, dificultat: int = 3, clau=None
+    ):
+        # Els fills modifiquen el taulell: una vista només de lectura del joc s'ha de copiar.
+        if isinstance(taulell, victoria.VistaTaulell):
+            taulell = taulell.a_llista()
+
         self.taulell = taulell
+        self.dificultat = dificultat
 
         if accions_previes is None:
             accions_previes = []
@@ -12,6 +20,13 @@ class Estat:
         self.accions_previes = accions_previes
         self.fitxa = fitxa
 
+        # Clau de Zobrist; els fills la calculen a partir de la del pare.
+        if clau is None:
+            clau = transposicio.zobrist(self.mida).clau(
+                victoria.a_bits(self.taulell), victoria.FITXES.index(self.fitxa)
+            )
+        self.clau = clau
+
         self.__es_meta = None
 
     def __hash__(self):
@@ -20,6 +35,10 @@ class Estat:
     def __eq__(self, other):
         return hash(self) == hash(other)
 
+    @property
+    def mida(self):
+        return len(self.taulell), len(self.taulell[0])
+
     def __repr__(self):
         return str(self.taulell)
 
@@ -32,14 +51,13 @@ class Estat:
 
         return ocupats == len(self.taulell[0]) * len(self.taulell[1])
 
+    def caselles_buides(self) -> int:
+        """ Nombre de caselles buides, és a dir, de moviments que queden com a molt. """
+        return sum(fila.count(" ") for fila in self.taulell)
+
     def guanyador(self):
         if self.__es_meta is None:
-            for pos in [(0, 0), (1, 1), (2, 2)]:
-                meta = victoria.victoria(self.taulell, pos)
-                if meta:
-                    break
-
-            self.__es_meta = meta
+            self.__es_meta = victoria.hi_ha_guanyador(self.taulell, self.dificultat)
 
         return self.__es_meta
 
@@ -72,6 +90,11 @@ class Estat:
         x, y = pos
 
         nou_estat.taulell[x][y] = self.fitxa
+        zobrist = transposicio.zobrist(self.mida)
+        nou_estat.clau ^= (
+            zobrist.caselles[victoria.FITXES.index(self.fitxa)][x * len(self.taulell[0]) + y]
+            ^ zobrist.torn
+        )
         nou_estat.fitxa = self.fitxa_contrari
         nou_estat.accions_previes.append((x, y))
         nou_estat.__es_meta = None # Optimització
@@ -0,0 +1,320 @@
+""" Estat del Tic-Tac-Toe representat amb bitboards.
+
+Cada jugador té les seves fitxes en un enter de Python: el bit ``x * columnes + y`` està actiu si
+la casella ``(x, y)`` és seva. Els moviments es fan i es desfan amb operacions de bits
+(``mou``/``desfes``), de manera que una cerca no necessita copiar l'estat a cada node. Un moviment
+nul, que només passa el torn, es fa i es desfà amb ``passa``/``desfes_passa``.
+
+La classe manté la mateixa interfície que ``tictac.solucio.estat.Estat`` (``es_meta``,
+``guanyador``, ``genera_fills``, ``accions_previes``...) perquè els agents Minimax la puguin
+emprar sense canviar el seu mètode ``cerca``.
+
+La detecció de victòries empra les màscares de línia precalculades de ``tictac.victoria`` i l'estat
+manté de manera incremental la seva clau de Zobrist (``clau``). Si es construeix amb
+``simetric=True`` també manté la clau de cada simetria del taulell (``claus_simetria``), de
+manera que la clau canònica es pot obtenir sense transformar el taulell.
+
+Als taulells grans, gairebé totes les caselles buides són lluny de qualsevol fitxa. Amb
+``radi=k`` l'estat manté una màscara de candidats (les caselles buides a distància de Txebixov
+``k`` o menys d'alguna fitxa), que s'actualitza a ``mou``/``desfes``, i ``accions_possibles`` només
+retorna aquestes caselles. Si el taulell és buit, el candidat és la casella central.
+"""
+import functools
+
+from tictac import victoria
+from tictac.solucio import simetria, transposicio
+from tictac.victoria import FITXES
+
+
+@functools.cache
+def veinats(mida, radi: int):
+    """ Màscares de les caselles a distància de Txebixov ``radi`` o menys de cada casella.
+
+    Args:
+        mida: Tupla (files, columnes).
+        radi: Distància màxima.
+
+    Returns:
+        Llista amb la màscara de cada índex de casella (la casella mateixa inclosa).
+    """
+    files, columnes = mida
+
+    return [
+        sum(
+            1 << (vx * columnes + vy)
+            for vx in range(max(0, x - radi), min(files, x + radi + 1))
+            for vy in range(max(0, y - radi), min(columnes, y + radi + 1))
+        )
+        for x in range(files)
+        for y in range(columnes)
+    ]
+
+
+class EstatBits:
+    __posicions = {}
+
+    def __init__(
+            self,
+            mida,
+            fitxa: str,
+            dificultat: int = 3,
+            bits=(0, 0),
+            accions_previes=None,
+            clau=None,
+            simetric: bool = False,
+            claus_simetria=None,
+            radi=None,
+            candidats=None,
+    ):
+        if accions_previes is None:
+            accions_previes = []
+
+        self.mida = mida
+        self.dificultat = dificultat
+        self.bits = list(bits)
+        self.torn = FITXES.index(fitxa)
+        self.accions_previes = accions_previes
+
+        self.__ple = (1 << (mida[0] * mida[1])) - 1
+        self.__linies = victoria.linies(mida, dificultat)
+        self.__zobrist = transposicio.zobrist(mida)
+        self.clau = self.__zobrist.clau(self.bits, self.torn) if clau is None else clau
+        self.__guanyat = None
+        self.__historial = []
+
+        self.__simetries = None
+        self.claus_simetria = None
+        if simetric:
+            self.__simetries = simetria.simetries(mida)
+            if claus_simetria is None:
+                claus_simetria = self.__simetries.claus(self.bits, self.torn)
+            self.claus_simetria = list(claus_simetria)
+
+        self.radi = radi
+        self.candidats = None
+        self.__historial_candidats = []
+        if radi is not None:
+            if radi < 1:
+                raise ValueError(f"El radi de les jugades candidates ha de ser almenys 1: {radi}")
+            self.__veinats = veinats(mida, radi)
+            if candidats is None:
+                candidats = 0
+                ocupades = self.ocupades
+                for idx in range(mida[0] * mida[1]):
+                    if (ocupades >> idx) & 1:
+                        candidats |= self.__veinats[idx]
+                candidats &= ~ocupades
+            self.candidats = candidats
+
+    @classmethod
+    def des_de_taulell(
+            cls, taulell, fitxa: str, dificultat: int = 3, simetric: bool = False, radi=None
+    ):
+        """ Construeix l'estat a partir d'una llista de llistes de caràcters.
+
+        Args:
+            taulell: Llista de llistes amb " ", "0" o "X".
+            fitxa: Fitxa del jugador que ha de moure.
+            dificultat: Nombre de fitxes en línia necessàries per guanyar.
+            simetric: Booleà indicant si s'han de mantenir les claus de les simetries.
+            radi: Si no és None, només es generen moviments a aquesta distància de les fitxes.
+
+        Returns:
+            EstatBits equivalent al taulell.
+        """
+        mida = (len(taulell), len(taulell[0]))
+
+        return cls(
+            mida, fitxa, dificultat, victoria.a_bits(taulell), simetric=simetric, radi=radi
+        )
+
+    @classmethod
+    def des_de_percepcio(cls, percepcio: dict, simetric: bool = False, radi=None):
+        """ Construeix l'estat a partir de la percepció del joc.
+
+        Si la percepció porta els enters de bits del taulell (``"bits"``), s'empren directament
+        sense recórrer les caselles.
+        """
+        if "bits" in percepcio:
+            return cls(
+                tuple(percepcio["mida"]),
+                percepcio["torn"],
+                percepcio.get("dificultat", 3),
+                percepcio["bits"],
+                simetric=simetric,
+                radi=radi,
+            )
+
+        return cls.des_de_taulell(
+            percepcio["taulell"], percepcio["torn"], percepcio.get("dificultat", 3), simetric, radi
+        )
+
+    def __hash__(self):
+        return self.clau
+
+    def __eq__(self, other):
+        return (
+                self.bits[0] == other.bits[0]
+                and self.bits[1] == other.bits[1]
+                and self.torn == other.torn
+        )
+
+    def __repr__(self):
+        return str(self.taulell)
+
+    @property
+    def taulell(self):
+        """ Llista de llistes de caràcters equivalent, útil per depurar i per pintar. """
+        files, columnes = self.mida
+        taulell = [[" "] * columnes for _ in range(files)]
+
+        for jugador, fitxa in enumerate(FITXES):
+            for idx in range(files * columnes):
+                if (self.bits[jugador] >> idx) & 1:
+                    taulell[idx // columnes][idx % columnes] = fitxa
+
+        return taulell
+
+    @property
+    def simetries(self):
+        return self.__simetries
+
+    @property
+    def clau_canonica(self):
+        """ Tupla (clau canònica, índex de la simetria que hi porta). Requereix ``simetric``. """
+        return simetria.canonica(self.claus_simetria)
+
+    @property
+    def fitxa(self):
+        return FITXES[self.torn]
+
+    @property
+    def fitxa_contrari(self):
+        return FITXES[self.torn ^ 1]
+
+    @property
+    def ocupades(self):
+        return self.bits[0] | self.bits[1]
+
+    @property
+    def posicions(self):
+        """ Llista que tradueix l'índex de cada bit a la seva posició (x, y). """
+        posicions = EstatBits.__posicions.get(self.mida)
+        if posicions is None:
+            files, columnes = self.mida
+            posicions = [(idx // columnes, idx % columnes) for idx in range(files * columnes)]
+            EstatBits.__posicions[self.mida] = posicions
+
+        return posicions
+
+    def es_ple(self):
+        return self.ocupades == self.__ple
+
+    def caselles_buides(self) -> int:
+        """ Nombre de caselles buides, és a dir, de moviments que queden com a molt. """
+        return (self.__ple & ~self.ocupades).bit_count()
+
+    def guanyador(self):
+        if self.__guanyat is None:
+            self.__guanyat = any(self.__linies.te_linia(bits) for bits in self.bits)
+
+        return self.__guanyat
+
+    def es_meta(self) -> bool:
+        return self.guanyador() or self.es_ple()
+
+    def accions_possibles(self):
+        ocupades = self.ocupades
+
+        if self.candidats is not None:
+            if not ocupades:
+                files, columnes = self.mida
+                return [(files // 2, columnes // 2)]
+
+            candidats = self.candidats
+            posicions = self.posicions
+            accions = []
+            while candidats:
+                bit = candidats & -candidats
+                accions.append(posicions[bit.bit_length() - 1])
+                candidats ^= bit
+
+            return accions
+
+        return [
+            pos for idx, pos in enumerate(self.posicions) if not (ocupades >> idx) & 1
+        ]
+
+    def mou(self, pos):
+        """ Col·loca la fitxa del jugador actual a ``pos`` i passa el torn.
+
+        Args:
+            pos: Tupla (x, y) d'una casella buida.
+        """
+        idx = pos[0] * self.mida[1] + pos[1]
+
+        self.bits[self.torn] |= 1 << idx
+        self.clau ^= self.__zobrist.caselles[self.torn][idx] ^ self.__zobrist.torn
+        if self.__simetries is not None:
+            self.__actualitza_simetries(idx)
+        if self.candidats is not None:
+            self.__historial_candidats.append(self.candidats)
+            self.candidats = (self.candidats | self.__veinats[idx]) & ~self.ocupades
+        self.accions_previes.append(pos)
+        self.__historial.append(self.__guanyat)
+        self.__guanyat = self.__guanyat is True or self.__linies.guanya(
+            self.bits[self.torn], idx
+        )
+        self.torn ^= 1
+
+    def __actualitza_simetries(self, idx):
+        torn = self.__zobrist.torn
+        for s, taula in enumerate(self.__simetries.zobrist):
+            self.claus_simetria[s] ^= taula[self.torn][idx] ^ torn
+
+    def desfes(self):
+        """ Desfà el darrer moviment fet amb ``mou``. """
+        pos_x, pos_y = self.accions_previes.pop()
+        self.torn ^= 1
+        idx = pos_x * self.mida[1] + pos_y
+        self.bits[self.torn] &= ~(1 << idx)
+        self.clau ^= self.__zobrist.caselles[self.torn][idx] ^ self.__zobrist.torn
+        if self.__simetries is not None:
+            self.__actualitza_simetries(idx)
+        self.__guanyat = self.__historial.pop()
+        if self.candidats is not None:
+            self.candidats = self.__historial_candidats.pop()
+
+    def passa(self):
+        """ Passa el torn sense moure (moviment nul). Es desfà amb ``desfes_passa``. """
+        self.torn ^= 1
+        self.clau ^= self.__zobrist.torn
+        if self.__simetries is not None:
+            for s in range(len(self.claus_simetria)):
+                self.claus_simetria[s] ^= self.__zobrist.torn
+
+    def desfes_passa(self):
+        """ Desfà el darrer moviment nul fet amb ``passa``. """
+        # Passar el torn és la seva pròpia inversa.
+        self.passa()
+
+    def transicio(self, pos):
+        nou_estat = EstatBits(
+            self.mida,
+            self.fitxa,
+            self.dificultat,
+            self.bits,
+            list(self.accions_previes),
+            self.clau,
+            self.__simetries is not None,
+            self.claus_simetria,
+            self.radi,
+            self.candidats,
+        )
+        nou_estat.__guanyat = self.__guanyat
+        nou_estat.mou(pos)
+
+        return nou_estat
+
+    def genera_fills(self):
+        return [self.transicio(acc) for acc in self.accions_possibles()]
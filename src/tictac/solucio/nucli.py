@@ -0,0 +1,109 @@
+""" Nucli de cerca Minimax que no arrossega camins.
+
+Els agents Minimax originals retornen, des de cada fulla, l'estat sencer amb la llista
+``accions_previes``, i ``actua`` en recupera el primer moviment. Això obliga a copiar el camí a
+cada node. Aquest nucli, en canvi, fa i desfà els moviments sobre un únic ``EstatBits``, retorna
+només la puntuació i guarda la variació principal en una taula triangular de mida fixa: la fila
+``i`` conté la millor continuació trobada des del nivell ``i`` i, quan un fill millora el millor
+valor, la seva fila (``i + 1``) es copia a la fila ``i`` darrere el moviment. La taula es reserva
+una sola vegada, de manera que la memòria per node és constant.
+
+La semàntica és la mateixa que la de ``agent.Agent.cerca`` i ``agent_alfa_beta.Agent.cerca``
+(sense ordenació): les puntuacions són 1, 0 o -1 des del punt de vista de MAX i, en cas d'empat,
+es queda el primer fill en ordre de files.
+"""
+from tictac.solucio.estat_bits import EstatBits
+
+
+class Nucli:
+    def __init__(self, poda: bool = True, max_nivells: int = 64):
+        """ Nucli de cerca.
+
+        Args:
+            poda: Booleà indicant si es fa poda alfa-beta.
+            max_nivells: Profunditat màxima de la taula de variació principal. Es fa créixer si
+                un taulell té més caselles.
+        """
+        self.poda = poda
+        self.nodes = 0
+
+        self.__max_nivells = 0
+        self.__pv = []
+        self.__llargada = []
+        self.__reserva(max_nivells)
+
+    def __reserva(self, max_nivells):
+        self.__max_nivells = max_nivells
+        self.__pv = [[None] * (max_nivells - i) for i in range(max_nivells)]
+        self.__llargada = [0] * (max_nivells + 1)
+
+    @property
+    def variacio_principal(self):
+        """ Llista de moviments de la variació principal de la darrera cerca. """
+        return self.__pv[0][:self.__llargada[0]]
+
+    def cerca(self, estat: EstatBits, alpha, beta, torn_max=True, iter=0):
+        """ Minimax (amb poda alfa-beta si ``poda``) sobre l'estat, fent i desfent moviments.
+
+        Args:
+            estat: Estat a cercar. Es restaura abans de retornar.
+            alpha: Cota inferior.
+            beta: Cota superior.
+            torn_max: Booleà indicant si és el torn del jugador MAX.
+            iter: Nivell del node (0 a l'arrel).
+
+        Returns:
+            Puntuació de l'estat des del punt de vista de MAX.
+        """
+        self.nodes += 1
+        self.__llargada[iter] = 0
+
+        if estat.es_meta():
+            if estat.guanyador():
+                return 1 if not torn_max else -1
+            return 0
+
+        fila = self.__pv[iter]
+        seguent = self.__pv[iter + 1] if iter + 1 < self.__max_nivells else None
+        millor = None
+        for acc in estat.accions_possibles():
+            estat.mou(acc)
+            punt = self.cerca(estat, alpha, beta, not torn_max, iter + 1)
+            estat.desfes()
+
+            if millor is None or (punt > millor if torn_max else punt < millor):
+                millor = punt
+                fila[0] = acc
+                llargada = self.__llargada[iter + 1]
+                for k in range(llargada):
+                    fila[k + 1] = seguent[k]
+                self.__llargada[iter] = llargada + 1
+
+            if self.poda:
+                if torn_max:
+                    alpha = max(alpha, punt)
+                else:
+                    beta = min(beta, punt)
+                if alpha >= beta:
+                    break
+
+        return millor
+
+    def resol(self, estat: EstatBits):
+        """ Cerca des de l'arrel, on mou el jugador MAX.
+
+        Args:
+            estat: Estat arrel.
+
+        Returns:
+            Tupla (puntuació, millor acció). La millor acció és None si l'estat és terminal.
+        """
+        caselles = estat.mida[0] * estat.mida[1]
+        if caselles + 1 > self.__max_nivells:
+            self.__reserva(caselles + 1)
+
+        self.nodes = 0
+        punt = self.cerca(estat, -float("inf"), float("inf"))
+        millor = self.__pv[0][0] if self.__llargada[0] else None
+
+        return punt, millor
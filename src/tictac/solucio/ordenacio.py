@@ -0,0 +1,197 @@
+""" Ordenació de moviments per a la poda alfa-beta.
+
+La poda alfa-beta talla més branques com abans s'exploren els millors moviments. Aquest mòdul
+permet combinar diversos esquemes d'ordenació:
+
+    - ``ESTATICA``: primer les caselles més properes al centre del taulell.
+    - ``KILLER``: primer els moviments que han provocat un tall en un germà del mateix nivell.
+    - ``HISTORIA``: primer els moviments que, en tota la cerca, han provocat més talls.
+    - ``PV``: primer el moviment de la variació principal de la iteració anterior (només té sentit
+      amb aprofundiment iteratiu).
+
+També conté ``Estadistiques``, que compta els talls, la mitjana de fills explorats per node i el
+factor de ramificació efectiu per poder comparar els esquemes.
+"""
+import collections
+
+ESTATICA = "estatica"
+KILLER = "killer"
+HISTORIA = "historia"
+PV = "pv"
+
+ESQUEMES = (ESTATICA, KILLER, HISTORIA, PV)
+
+
+class Ordenacio:
+    def __init__(self, mida, esquemes=(), max_killers: int = 2):
+        for esquema in esquemes:
+            if esquema not in ESQUEMES:
+                raise ValueError(f"Esquema d'ordenació no existent: {esquema}")
+
+        self.mida = mida
+        self.esquemes = set(esquemes)
+        self.max_killers = max_killers
+
+        self.killers = collections.defaultdict(list)
+        self.historia = collections.defaultdict(int)
+        self.pv = []
+
+        files, columnes = mida
+        self.__centre = {
+            (x, y): abs(2 * x - files + 1) + abs(2 * y - columnes + 1)
+            for x in range(files)
+            for y in range(columnes)
+        }
+
+    def __bool__(self):
+        return bool(self.esquemes)
+
+    def nova_cerca(self):
+        """ Els killers depenen de la posició arrel; la història es conserva però s'atenua. """
+        self.killers.clear()
+        for accio in self.historia:
+            self.historia[accio] //= 2
+
+    def ordena(self, elements, iter, cami=None, accio=None):
+        """ Ordena els moviments (o els fills) d'un node.
+
+        L'ordenació és estable: si cap esquema distingeix dos moviments, conserven l'ordre original.
+
+        Args:
+            elements: Llista de moviments o d'estats fills.
+            iter: Nivell del node dins la cerca (0 a l'arrel).
+            cami: Accions des de l'arrel fins al node, per saber si és a la variació principal.
+            accio: Funció que retorna el moviment d'un element. Per defecte, l'element mateix.
+
+        Returns:
+            Nova llista ordenada.
+        """
+        if not self.esquemes:
+            return elements
+
+        if accio is None:
+            accio = lambda element: element
+
+        pv = None
+        if PV in self.esquemes and iter < len(self.pv):
+            if cami is None or iter == 0 or list(cami[-iter:]) == self.pv[:iter]:
+                pv = self.pv[iter]
+
+        killers = self.killers[iter] if KILLER in self.esquemes else []
+        historia = self.historia if HISTORIA in self.esquemes else {}
+        centre = self.__centre if ESTATICA in self.esquemes else {}
+
+        def clau(element):
+            mov = accio(element)
+            killer = killers.index(mov) if mov in killers else len(killers)
+
+            return mov != pv, killer, -historia.get(mov, 0), centre.get(mov, 0)
+
+        return sorted(elements, key=clau)
+
+    def tall(self, accio, iter, profunditat):
+        """ Registra que ``accio`` ha provocat un tall.
+
+        Args:
+            accio: Moviment que ha provocat el tall.
+            iter: Nivell del node.
+            profunditat: Profunditat restant del node; els talls prop de l'arrel valen més.
+        """
+        if KILLER in self.esquemes:
+            killers = self.killers[iter]
+            if accio in killers:
+                killers.remove(accio)
+            killers.insert(0, accio)
+            del killers[self.max_killers:]
+
+        if HISTORIA in self.esquemes:
+            self.historia[accio] += profunditat * profunditat
+
+
+class Estadistiques:
+    """ Comptadors d'una cerca alfa-beta per mesurar la qualitat de l'ordenació. """
+
+    def __init__(self):
+        self.interiors = 0
+        self.fulles = 0
+        self.profunditat = 0
+        self.fills_explorats = 0
+        self.talls = 0
+        self.talls_primer_fill = 0
+
+    def node(self, fills_explorats, tall, primer):
+        self.interiors += 1
+        self.fills_explorats += fills_explorats
+        if tall:
+            self.talls += 1
+            self.talls_primer_fill += int(primer)
+
+    def fulla(self, iter, nombre=1):
+        """ Compta ``nombre`` fulles a profunditat ``iter`` de l'arrel. """
+        self.fulles += nombre
+        self.profunditat = max(self.profunditat, iter)
+
+    @property
+    def nodes(self):
+        return self.interiors + self.fulles
+
+    @property
+    def taxa_talls(self):
+        """ Fracció de nodes interiors on s'ha produït un tall. """
+        return self.talls / self.interiors if self.interiors else 0.0
+
+    @property
+    def taxa_talls_primer_fill(self):
+        """ Fracció dels talls que s'han produït amb el primer fill explorat. """
+        return self.talls_primer_fill / self.talls if self.talls else 0.0
+
+    @property
+    def fills_per_node(self):
+        """ Mitjana de fills explorats per node interior. """
+        return self.fills_explorats / self.interiors if self.interiors else 0.0
+
+    @property
+    def factor_ramificacio_efectiu(self):
+        """ Factor de ramificació efectiu ``b*``.
+
+        És el factor d'un arbre uniforme de profunditat ``d`` (la de la fulla més profunda) amb
+        els mateixos nodes sense comptar l'arrel: ``N = b* + b*^2 + ... + b*^d``. Es resol per
+        bisecció, perquè la suma creix amb ``b*``.
+        """
+        nodes, profunditat = self.nodes - 1, self.profunditat
+        if nodes <= 0 or profunditat == 0:
+            return 0.0
+
+        def suma(b):
+            return sum(b ** i for i in range(1, profunditat + 1))
+
+        baix, alt = 0.0, max(1.0, float(nodes))
+        for _ in range(100):
+            mig = (baix + alt) / 2
+            if suma(mig) < nodes:
+                baix = mig
+            else:
+                alt = mig
+
+        return (baix + alt) / 2
+
+    def com_diccionari(self):
+        return {
+            "nodes": self.nodes,
+            "interiors": self.interiors,
+            "fulles": self.fulles,
+            "talls": self.talls,
+            "taxa_talls": self.taxa_talls,
+            "taxa_talls_primer_fill": self.taxa_talls_primer_fill,
+            "fills_per_node": self.fills_per_node,
+            "profunditat": self.profunditat,
+            "factor_ramificacio_efectiu": self.factor_ramificacio_efectiu,
+        }
+
+    def __str__(self):
+        return (
+            f"Nodes: {self.nodes} | Talls: {self.taxa_talls:.1%} "
+            f"(primer fill {self.taxa_talls_primer_fill:.1%}) | "
+            f"Fills per node: {self.fills_per_node:.2f} | "
+            f"Ramificació efectiva: {self.factor_ramificacio_efectiu:.2f}"
+        )
@@ -0,0 +1,133 @@
+""" Simetries del taulell del Tic-Tac-Toe.
+
+Un taulell quadrat té 8 simetries (les rotacions i reflexions del quadrat) i un de rectangular
+en té 4. Dues posicions simètriques tenen el mateix valor, de manera que la cerca només n'ha
+d'explorar una: la forma canònica, que és la transformació amb la clau de Zobrist més petita.
+
+Cada simetria és una permutació dels índexs de les caselles (``x * columnes + y``). Per no haver
+de transformar el taulell a cada node, per a cada simetria ``s`` es precalcula la taula de
+Zobrist permutada; així la clau de la posició transformada per ``s`` es pot mantenir de manera
+incremental igual que la clau normal.
+"""
+import functools
+
+from tictac.solucio import transposicio
+
+
+def transformacions(mida):
+    """ Retorna les funcions (x, y) -> (x', y') de les simetries vàlides per a la mida donada.
+
+    Args:
+        mida: Tupla (files, columnes).
+
+    Returns:
+        Llista de funcions. La primera sempre és la identitat.
+    """
+    files, columnes = mida
+    f, c = files - 1, columnes - 1
+
+    transf = [
+        lambda x, y: (x, y),
+        lambda x, y: (f - x, y),
+        lambda x, y: (x, c - y),
+        lambda x, y: (f - x, c - y),
+    ]
+    if files == columnes:
+        transf += [
+            lambda x, y: (y, x),
+            lambda x, y: (c - y, f - x),
+            lambda x, y: (y, f - x),
+            lambda x, y: (c - y, x),
+        ]
+
+    return transf
+
+
+class Simetries:
+    """ Permutacions de caselles i taules de Zobrist permutades per a una mida de taulell. """
+
+    def __init__(self, mida):
+        self.mida = mida
+        files, columnes = mida
+
+        self.permutacions = []
+        self.inverses = []
+        for transf in transformacions(mida):
+            perm = [0] * (files * columnes)
+            for x in range(files):
+                for y in range(columnes):
+                    t_x, t_y = transf(x, y)
+                    perm[x * columnes + y] = t_x * columnes + t_y
+
+            inversa = [0] * len(perm)
+            for idx, idx_t in enumerate(perm):
+                inversa[idx_t] = idx
+
+            self.permutacions.append(perm)
+            self.inverses.append(inversa)
+
+        zobrist = transposicio.zobrist(mida)
+        self.torn = zobrist.torn
+        self.zobrist = [
+            [[zobrist.caselles[jugador][perm[idx]] for idx in range(len(perm))] for jugador in (0, 1)]
+            for perm in self.permutacions
+        ]
+
+    def __len__(self):
+        return len(self.permutacions)
+
+    def claus(self, bits, torn):
+        """ Calcula des de zero la clau de cada transformació de la posició.
+
+        Args:
+            bits: Llista [bits de "0", bits de "X"].
+            torn: Índex del jugador que ha de moure.
+
+        Returns:
+            Llista amb una clau de Zobrist per simetria.
+        """
+        claus = []
+        for taula in self.zobrist:
+            clau = self.torn if torn else 0
+            for jugador in (0, 1):
+                fitxes = bits[jugador]
+                while fitxes:
+                    menor = fitxes & -fitxes
+                    clau ^= taula[jugador][menor.bit_length() - 1]
+                    fitxes ^= menor
+            claus.append(clau)
+
+        return claus
+
+    def a_canonica(self, pos, simetria: int):
+        """ Transforma una acció de la posició original a la forma canònica. """
+        columnes = self.mida[1]
+        idx = self.permutacions[simetria][pos[0] * columnes + pos[1]]
+
+        return idx // columnes, idx % columnes
+
+    def des_de_canonica(self, pos, simetria: int):
+        """ Transforma una acció de la forma canònica a la posició original. """
+        columnes = self.mida[1]
+        idx = self.inverses[simetria][pos[0] * columnes + pos[1]]
+
+        return idx // columnes, idx % columnes
+
+
+@functools.cache
+def simetries(mida) -> Simetries:
+    return Simetries(tuple(mida))
+
+
+def canonica(claus):
+    """ Tria la forma canònica entre les claus de totes les simetries.
+
+    Args:
+        claus: Llista amb una clau per simetria.
+
+    Returns:
+        Tupla (clau canònica, índex de la simetria que hi porta).
+    """
+    clau = min(claus)
+
+    return clau, claus.index(clau)
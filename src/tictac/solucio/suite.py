@@ -0,0 +1,200 @@
+""" Bateria de rendiment dels agents Minimax del Tic-Tac-Toe.
+
+Executa ``agent.Agent``, ``agent_alfa_beta.Agent`` i ``agent_optim.Agent`` (amb les seves variants
+de representació) sense interfície gràfica sobre un conjunt fix de posicions generades amb una
+llavor. Per a cada combinació de taulell, posició i agent mesura:
+
+    - ``nodes``: nodes expandits (crides a ``cerca`` o nodes del nucli de cerca).
+    - ``temps``: segons que tarda ``actua``, és a dir, temps per moviment.
+    - ``nodes_per_segon``.
+    - ``memoria_maxima``: bytes màxims reservats durant ``actua`` segons ``tracemalloc``. Es mesura
+      en una segona execució, ja que ``tracemalloc`` alenteix la cerca.
+
+Els resultats s'escriuen en JSON per poder comparar-los entre commits.
+
+Ús:
+    PYTHONPATH=src python -m tictac.solucio.suite [resultats.json]
+"""
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from tictac.solucio import agent, agent_alfa_beta, agent_optim
+from tictac.solucio.benchmark import amb_comptador
+from tictac.solucio.estat_bits import EstatBits
+
+LLAVOR = 2025
+POSICIONS_PER_TAULELL = 3
+
+# (mida, dificultat, fitxes ja col·locades). Les fitxes fan que el Minimax sense poda acabi.
+TAULELLS = [
+    ((3, 3), 3, 2),
+    ((4, 4), 3, 9),
+    ((4, 4), 4, 9),
+    ((5, 5), 4, 17),
+]
+
+AGENTS = [
+    # (nom, classe d'agent, paràmetres de l'agent)
+    ("minimax", agent.Agent, {}),
+    ("minimax bits", agent.Agent, {"bitboard": True}),
+    ("alfa-beta", agent_alfa_beta.Agent, {}),
+    ("alfa-beta bits", agent_alfa_beta.Agent, {"bitboard": True}),
+    ("optim", agent_optim.Agent, {"poda": True, "bitboard": True}),
+    ("optim simetria", agent_optim.Agent, {"poda": True, "simetria": True}),
+]
+
+
+def genera_posicions(mida, dificultat, fitxes, n=POSICIONS_PER_TAULELL, llavor=LLAVOR):
+    """ Genera posicions no terminals jugant moviments aleatoris des del taulell buit.
+
+    Args:
+        mida: Tupla (files, columnes).
+        dificultat: Nombre de fitxes en línia necessàries per guanyar.
+        fitxes: Nombre de fitxes de cada posició.
+        n: Nombre de posicions.
+        llavor: Llavor del generador aleatori.
+
+    Returns:
+        Llista de percepcions (diccionaris com els de ``tictac.joc.Taulell.percepcio``).
+    """
+    generador = random.Random(f"{llavor}-{mida}-{dificultat}-{fitxes}")
+    posicions = []
+    while len(posicions) < n:
+        estat = EstatBits(mida, "0", dificultat)
+        for _ in range(fitxes):
+            if estat.es_meta():
+                break
+            estat.mou(generador.choice(estat.accions_possibles()))
+
+        if not estat.es_meta() and estat.ocupades.bit_count() == fitxes:
+            posicions.append({
+                "taulell": estat.taulell,
+                "mida": mida,
+                "torn": estat.fitxa,
+                "dificultat": dificultat,
+            })
+
+    return posicions
+
+
+def nodes(ag):
+    """ Nodes expandits per un agent creat amb ``amb_comptador``, inclosos els del nucli. """
+    total = ag.nodes
+    nucli = getattr(ag, "nucli", None)
+    if nucli is not None:
+        total += nucli.nodes
+
+    return total
+
+
+def mesura(classe, parametres, percepcio):
+    """ Executa un moviment amb un agent nou i en mesura el rendiment.
+
+    Args:
+        classe: Classe de l'agent.
+        parametres: Paràmetres del constructor.
+        percepcio: Percepció de la posició.
+
+    Returns:
+        Diccionari amb l'acció, els nodes, el temps i la memòria màxima.
+    """
+    ag = amb_comptador(classe)(**parametres)
+    inici = time.perf_counter()
+    accio = ag.actua(percepcio)
+    temps = time.perf_counter() - inici
+    nodes_expandits = nodes(ag)
+
+    ag = amb_comptador(classe)(**parametres)
+    tracemalloc.start()
+    try:
+        ag.actua(percepcio)
+        _, memoria = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "accio": accio,
+        "nodes": nodes_expandits,
+        "temps": temps,
+        "nodes_per_segon": nodes_expandits / temps if temps else 0.0,
+        "memoria_maxima": memoria,
+    }
+
+
+def executa(taulells=None, agents=None, llavor=LLAVOR):
+    """ Executa la bateria completa.
+
+    Args:
+        taulells: Llista de tuples (mida, dificultat, fitxes). Per defecte ``TAULELLS``.
+        agents: Llista de tuples (nom, classe, paràmetres). Per defecte ``AGENTS``.
+        llavor: Llavor de les posicions.
+
+    Returns:
+        Diccionari serialitzable amb els resultats de cada mesura i un resum per taulell i agent.
+    """
+    if taulells is None:
+        taulells = TAULELLS
+    if agents is None:
+        agents = AGENTS
+
+    resultats = []
+    resum = []
+    for mida, dificultat, fitxes in taulells:
+        taulell = f"{mida[0]}x{mida[1]}/{dificultat}"
+        posicions = genera_posicions(mida, dificultat, fitxes, llavor=llavor)
+
+        for nom, classe, parametres in agents:
+            mesures = []
+            for i, percepcio in enumerate(posicions):
+                res = mesura(classe, parametres, percepcio)
+                res.update({"taulell": taulell, "posicio": i, "agent": nom})
+                mesures.append(res)
+
+            resultats.extend(mesures)
+
+            nodes_totals = sum(res["nodes"] for res in mesures)
+            temps_total = sum(res["temps"] for res in mesures)
+            resum.append({
+                "taulell": taulell,
+                "agent": nom,
+                "nodes": nodes_totals,
+                "temps_per_moviment": statistics.mean(res["temps"] for res in mesures),
+                "nodes_per_segon": nodes_totals / temps_total if temps_total else 0.0,
+                "memoria_maxima": max(res["memoria_maxima"] for res in mesures),
+            })
+
+    return {
+        "llavor": llavor,
+        "python": platform.python_version(),
+        "resultats": resultats,
+        "resum": resum,
+    }
+
+
+def main():
+    informe = executa()
+
+    print(
+        f"{'Taulell':<10}{'Agent':<18}{'Nodes':>10}{'Temps/mov. (s)':>16}{'Nodes/s':>12}"
+        f"{'Memòria (KiB)':>15}"
+    )
+    for res in informe["resum"]:
+        print(
+            f"{res['taulell']:<10}{res['agent']:<18}{res['nodes']:>10}"
+            f"{res['temps_per_moviment']:>16.4f}{res['nodes_per_segon']:>12.0f}"
+            f"{res['memoria_maxima'] / 1024:>15.1f}"
+        )
+
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "w", encoding="utf-8") as fitxer:
+            json.dump(informe, fitxer, indent=2)
+        print(f"\nResultats escrits a {sys.argv[1]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+""" Taula amb totes les posicions del Tic-Tac-Toe de 3x3 resoltes.
+
+El 3x3 només té uns quants milers de posicions abastables, de manera que es poden resoldre totes
+una vegada i guardar-les en un fitxer binari. Cada posició ocupa un byte a l'índex que li dona el
+seu rang en base 3 (casella ``i`` buida = 0, "0" = 1, "X" = 2, multiplicat per ``3 ** i``):
+
+    - bits 0-1: valor per al jugador que mou (0 no abastable, 1 perd, 2 empat, 3 guanya).
+    - bits 2-5: índex (``x * 3 + y``) de la millor acció, o 15 si la posició és terminal.
+
+El fitxer es carrega amb ``mmap``, de manera que consultar una posició no requereix cap cerca.
+No es guarda al repositori: es genera la primera vegada que es carrega, o amb:
+
+    PYTHONPATH=src python -m tictac.solucio.taula_3x3
+"""
+import mmap
+from pathlib import Path
+
+from tictac import victoria
+
+MIDA = (3, 3)
+DIFICULTAT = 3
+CASELLES = MIDA[0] * MIDA[1]
+
+CAMI = Path(__file__).resolve().parent / "taula_3x3.bin"
+
+PERD, EMPAT, GUANYA = 1, 2, 3
+SENSE_ACCIO = 15
+
+# RANG_BITS[m] és el rang en base 3 d'un taulell amb un 1 a cada casella de la màscara m.
+RANG_BITS = [sum(3 ** i for i in range(CASELLES) if (m >> i) & 1) for m in range(1 << CASELLES)]
+
+
+def rang(bits_0: int, bits_x: int) -> int:
+    """ Rang en base 3 d'una posició.
+
+    Args:
+        bits_0: Fitxes de "0".
+        bits_x: Fitxes de "X".
+
+    Returns:
+        Enter entre 0 i 3 ** 9 - 1.
+    """
+    return RANG_BITS[bits_0] + 2 * RANG_BITS[bits_x]
+
+
+def resol() -> bytearray:
+    """ Resol totes les posicions abastables des del taulell buit (comença "0").
+
+    Returns:
+        bytearray de ``3 ** 9`` bytes amb el format descrit al mòdul.
+    """
+    linies = victoria.linies(MIDA, DIFICULTAT)
+    ple = (1 << CASELLES) - 1
+    taula = bytearray(3 ** CASELLES)
+
+    def valor(bits, torn):
+        """ Valor per al jugador que mou: -1 perd, 0 empat, 1 guanya. """
+        idx = rang(bits[0], bits[1])
+        if taula[idx]:
+            return (taula[idx] & 3) - EMPAT
+
+        if linies.te_linia(bits[torn ^ 1]):
+            res, millor = -1, SENSE_ACCIO
+        elif bits[0] | bits[1] == ple:
+            res, millor = 0, SENSE_ACCIO
+        else:
+            res, millor = -2, SENSE_ACCIO
+            for casella in range(CASELLES):
+                if (bits[0] | bits[1]) >> casella & 1:
+                    continue
+
+                bits[torn] |= 1 << casella
+                punt = -valor(bits, torn ^ 1)
+                bits[torn] &= ~(1 << casella)
+
+                if punt > res:
+                    res, millor = punt, casella
+
+        taula[idx] = (millor << 2) | (res + EMPAT)
+
+        return res
+
+    valor([0, 0], 0)
+
+    return taula
+
+
+def genera(cami: Path = CAMI):
+    """ Resol el 3x3 i escriu la taula a disc. """
+    cami.write_bytes(resol())
+
+
+def carrega(cami: Path = CAMI):
+    """ Projecta la taula a memòria, generant-la primer si el fitxer no existeix.
+
+    Args:
+        cami: Ruta del fitxer.
+
+    Returns:
+        Objecte ``mmap`` només de lectura.
+    """
+    if not cami.exists():
+        genera(cami)
+
+    with open(cami, "rb") as fitxer:
+        return mmap.mmap(fitxer.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def consulta(taula, bits_0: int, bits_x: int):
+    """ Consulta una posició.
+
+    Args:
+        taula: Taula carregada amb ``carrega`` (o qualsevol objecte indexable de bytes).
+        bits_0: Fitxes de "0".
+        bits_x: Fitxes de "X".
+
+    Returns:
+        Tupla (valor per al jugador que mou, millor acció (x, y) o None), o None si la posició no
+        és abastable.
+    """
+    entrada = taula[rang(bits_0, bits_x)]
+    if not entrada:
+        return None
+
+    valor, millor = (entrada & 3) - EMPAT, entrada >> 2
+    if millor == SENSE_ACCIO:
+        return valor, None
+
+    return valor, divmod(millor, MIDA[1])
+
+
+if __name__ == "__main__":
+    genera()
+    print(f"Taula generada a {CAMI}")
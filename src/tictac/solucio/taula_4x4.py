@@ -0,0 +1,197 @@
+""" Taules de finals del Tic-Tac-Toe de 4x4 amb dificultat 3 i 4.
+
+Resol totes les posicions de 4x4 per anàlisi retrògrada: es comença pels taulells plens (16
+fitxes) i, nivell a nivell, el valor d'una posició amb ``k`` fitxes s'obté dels valors ja
+calculats de les posicions amb ``k + 1``. Cada nivell es calcula sencer amb NumPy.
+
+Una posició s'identifica pel seu rang en base 3 (casella ``i`` buida = 0, "0" = 1, "X" = 2,
+multiplicat per ``3 ** i``) i el seu valor ocupa 2 bits (0 no abastable, 1 perd, 2 empat, 3
+guanya, sempre per al jugador que mou), de manera que cada taula ocupa ``3 ** 16 / 4`` bytes
+(uns 10 MB). Els fitxers no es guarden al repositori: es generen la primera vegada que es
+carreguen, o amb:
+
+    PYTHONPATH=src python -m tictac.solucio.taula_4x4
+"""
+import functools
+import itertools
+from pathlib import Path
+
+import numpy as np
+
+from tictac import victoria
+
+MIDA = (4, 4)
+DIFICULTATS = (3, 4)
+CASELLES = MIDA[0] * MIDA[1]
+POSICIONS = 3 ** CASELLES
+
+PERD, EMPAT, GUANYA = 1, 2, 3
+
+POTENCIES = 3 ** np.arange(CASELLES, dtype=np.int64)
+
+
+def cami(dificultat: int) -> Path:
+    return Path(__file__).resolve().parent / f"taula_4x4_d{dificultat}.bin"
+
+
+@functools.cache
+def rang_bits():
+    """ Rang en base 3 d'un taulell amb un 1 a cada casella de cada màscara de 16 bits. """
+    mascares = np.arange(1 << CASELLES, dtype=np.int64)
+    bits = (mascares[:, None] >> np.arange(CASELLES)) & 1
+
+    return (bits @ POTENCIES).tolist()
+
+
+def rang(bits_0: int, bits_x: int) -> int:
+    """ Rang en base 3 d'una posició.
+
+    Args:
+        bits_0: Fitxes de "0".
+        bits_x: Fitxes de "X".
+
+    Returns:
+        Enter entre 0 i 3 ** 16 - 1.
+    """
+    rangs = rang_bits()
+
+    return rangs[bits_0] + 2 * rangs[bits_x]
+
+
+def _posicions_nivell(fitxes):
+    """ Totes les posicions amb ``fitxes`` fitxes en què "0" ha començat.
+
+    Returns:
+        Tupla d'arrays (bits de "0", bits de "X").
+    """
+    fitxes_0 = (fitxes + 1) // 2
+
+    mascares = np.arange(1 << CASELLES, dtype=np.int64)
+    recompte = ((mascares[:, None] >> np.arange(CASELLES)) & 1).sum(axis=1)
+    ocupades = mascares[recompte == fitxes]
+
+    # Índexs dels bits actius de cada màscara d'ocupades, en ordre creixent.
+    bits = (ocupades[:, None] >> np.arange(CASELLES)) & 1
+    indexs = np.nonzero(bits)[1].reshape(len(ocupades), fitxes)
+    valors_bits = np.left_shift(np.int64(1), indexs)
+
+    # Cada combinació tria quines de les caselles ocupades són de "0".
+    combinacions = np.array(
+        [
+            [int(j in comb) for j in range(fitxes)]
+            for comb in itertools.combinations(range(fitxes), fitxes_0)
+        ],
+        dtype=np.int64,
+    )
+    bits_0 = (combinacions @ valors_bits.T).ravel()
+    bits_x = np.tile(ocupades, len(combinacions)) - bits_0
+
+    return bits_0, bits_x
+
+
+def resol(dificultat: int):
+    """ Resol totes les posicions de 4x4 per anàlisi retrògrada.
+
+    Args:
+        dificultat: Nombre de fitxes en línia necessàries per guanyar.
+
+    Returns:
+        Array de ``uint8`` amb el valor (0-3) de cada rang.
+    """
+    linies = np.array(victoria.linies(MIDA, dificultat).linies, dtype=np.int64)
+    rangs = np.array(rang_bits(), dtype=np.int64)
+    taula = np.zeros(POSICIONS, dtype=np.uint8)
+
+    for fitxes in range(CASELLES, -1, -1):
+        bits_0, bits_x = _posicions_nivell(fitxes)
+        torn = fitxes % 2
+        propies, rivals = (bits_0, bits_x) if torn == 0 else (bits_x, bits_0)
+
+        # El rival acaba de moure: si té línia, el jugador que mou ha perdut.
+        perdut = ((rivals[:, None] & linies) == linies).any(axis=1)
+        impossible = ((propies[:, None] & linies) == linies).any(axis=1)
+
+        rang_pos = rangs[bits_0] + 2 * rangs[bits_x]
+        valors = np.zeros(len(rang_pos), dtype=np.uint8)
+
+        if fitxes < CASELLES:
+            ocupades = bits_0 | bits_x
+            for casella in range(CASELLES):
+                buida = ((ocupades >> casella) & 1) == 0
+                fills = rang_pos[buida] + (torn + 1) * POTENCIES[casella]
+                # Un fill perdut per al rival és guanyat per a nosaltres, i a l'inrevés.
+                valor_fills = taula[fills]
+                propi = np.where(valor_fills > 0, 4 - valor_fills, 0).astype(np.uint8)
+                valors[buida] = np.maximum(valors[buida], propi)
+        else:
+            valors[:] = EMPAT
+
+        valors[perdut] = PERD
+        valors[impossible] = 0
+        taula[rang_pos] = valors
+
+    return taula
+
+
+def empaqueta(valors):
+    """ Empaqueta valors de 2 bits, quatre per byte (el primer als bits baixos). """
+    relleu = (-len(valors)) % 4
+    valors = np.concatenate([valors, np.zeros(relleu, dtype=np.uint8)]).reshape(-1, 4)
+
+    return (valors[:, 0] | (valors[:, 1] << 2) | (valors[:, 2] << 4) | (valors[:, 3] << 6)).astype(
+        np.uint8
+    )
+
+
+def genera(dificultat: int, cami_taula: Path = None):
+    """ Resol el 4x4 i escriu la taula empaquetada a disc. """
+    if cami_taula is None:
+        cami_taula = cami(dificultat)
+
+    empaqueta(resol(dificultat)).tofile(cami_taula)
+
+
+def carrega(dificultat: int, cami_taula: Path = None):
+    """ Projecta la taula a memòria, generant-la primer si el fitxer no existeix.
+
+    Args:
+        dificultat: 3 o 4.
+        cami_taula: Ruta del fitxer. Per defecte, ``cami(dificultat)``.
+
+    Returns:
+        ``np.memmap`` de bytes només de lectura.
+    """
+    if dificultat not in DIFICULTATS:
+        raise ValueError(f"No hi ha taula de 4x4 per a la dificultat {dificultat}")
+    if cami_taula is None:
+        cami_taula = cami(dificultat)
+    if not cami_taula.exists():
+        genera(dificultat, cami_taula)
+
+    return np.memmap(cami_taula, dtype=np.uint8, mode="r")
+
+
+def consulta(taula, bits_0: int, bits_x: int):
+    """ Consulta una posició.
+
+    Args:
+        taula: Taula carregada amb ``carrega``.
+        bits_0: Fitxes de "0".
+        bits_x: Fitxes de "X".
+
+    Returns:
+        Valor per al jugador que mou (-1 perd, 0 empat, 1 guanya), o None si la posició no és
+        abastable.
+    """
+    r = rang(bits_0, bits_x)
+    valor = (int(taula[r >> 2]) >> ((r & 3) * 2)) & 3
+    if not valor:
+        return None
+
+    return valor - EMPAT
+
+
+if __name__ == "__main__":
+    for dificultat in DIFICULTATS:
+        genera(dificultat)
+        print(f"Taula generada a {cami(dificultat)}")
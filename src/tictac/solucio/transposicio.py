@@ -0,0 +1,127 @@
+""" Taula de transposició amb claus de Zobrist.
+
+Mòdul que conté les claus de Zobrist per als taulells del Tic-Tac-Toe i una taula de transposició
+de mida fixa. Cada entrada guarda la clau completa, la profunditat restant amb què s'ha calculat
+el valor, el tipus de cota (exacte, inferior o superior) i la millor acció trobada.
+
+Els valors es guarden des del punt de vista del jugador que ha de moure en aquella posició, de
+manera que la taula es pot compartir entre torns i entre jugadors.
+"""
+import collections
+import functools
+import random
+
+EXACTE = 0
+INFERIOR = 1
+SUPERIOR = 2
+
+Entrada = collections.namedtuple(
+    "Entrada", ["clau", "profunditat", "valor", "tipus", "millor_accio", "generacio"]
+)
+
+
+class Zobrist:
+    """ Nombres aleatoris de 64 bits per a cada casella, jugador i torn. """
+
+    def __init__(self, mida, llavor: int = 2025):
+        generador = random.Random(llavor)
+        caselles = mida[0] * mida[1]
+
+        self.caselles = [[generador.getrandbits(64) for _ in range(caselles)] for _ in range(2)]
+        self.torn = generador.getrandbits(64)
+
+    def clau(self, bits, torn: int) -> int:
+        """ Calcula la clau d'una posició des de zero.
+
+        Args:
+            bits: Llista [bits de "0", bits de "X"].
+            torn: Índex del jugador que ha de moure.
+
+        Returns:
+            Enter de 64 bits.
+        """
+        clau = self.torn if torn else 0
+
+        for jugador in (0, 1):
+            fitxes = bits[jugador]
+            while fitxes:
+                menor = fitxes & -fitxes
+                clau ^= self.caselles[jugador][menor.bit_length() - 1]
+                fitxes ^= menor
+
+        return clau
+
+
+@functools.cache
+def zobrist(mida) -> Zobrist:
+    return Zobrist(tuple(mida))
+
+
+class TaulaTransposicio:
+    """ Taula de transposició de mida fixa.
+
+    Cada clau va a una única posició (``clau % capacitat``). Quan dues posicions hi col·lideixen,
+    es reemplaça l'entrada si és d'una cerca anterior o si la nova s'ha calculat amb una
+    profunditat igual o major.
+    """
+
+    def __init__(self, capacitat: int = 1 << 20):
+        self.capacitat = capacitat
+        self.generacio = 0
+
+        self.consultes = 0
+        self.encerts = 0
+
+        self.__entrades = [None] * capacitat
+
+    def nova_cerca(self):
+        """ Marca l'inici d'una nova cerca perquè les entrades antigues es puguin reemplaçar. """
+        self.generacio += 1
+
+    def buida(self):
+        self.__entrades = [None] * self.capacitat
+        self.generacio = 0
+
+    def consulta(self, clau: int):
+        """ Cerca l'entrada d'una posició.
+
+        Args:
+            clau: Clau de Zobrist de la posició.
+
+        Returns:
+            ``Entrada`` o None si la posició no hi és.
+        """
+        self.consultes += 1
+        entrada = self.__entrades[clau % self.capacitat]
+
+        if entrada is not None and entrada.clau == clau:
+            self.encerts += 1
+            return entrada
+
+        return None
+
+    def guarda(self, clau: int, profunditat: int, valor, tipus: int, millor_accio=None):
+        """ Guarda el resultat de cercar una posició.
+
+        Args:
+            clau: Clau de Zobrist de la posició.
+            profunditat: Profunditat restant amb què s'ha calculat el valor.
+            valor: Valor des del punt de vista del jugador que ha de moure.
+            tipus: ``EXACTE``, ``INFERIOR`` o ``SUPERIOR``.
+            millor_accio: Millor acció trobada, si n'hi ha.
+        """
+        slot = clau % self.capacitat
+        actual = self.__entrades[slot]
+
+        if (
+                actual is None
+                or actual.clau == clau
+                or actual.generacio != self.generacio
+                or profunditat >= actual.profunditat
+        ):
+            self.__entrades[slot] = Entrada(
+                clau, profunditat, valor, tipus, millor_accio, self.generacio
+            )
+
+    def __len__(self):
+        return sum(entrada is not None for entrada in self.__entrades)
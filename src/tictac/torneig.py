@@ -0,0 +1,353 @@
+""" Torneig d'agents del Tic-Tac-Toe sense interfície gràfica.
+
+``joc.Taulell`` obre una finestra de pygame per a cada partida. Aquest mòdul juga les partides
+directament, aplicant les accions amb les mateixes regles que ``Taulell._aplica`` (accions "P" i
+"E", límits del taulell, caselles ocupades i victòria amb les línies de ``tictac.victoria``), i
+les reparteix entre diversos processos.
+
+Cada partida comença amb unes quantes jugades aleatòries (l'obertura) generades amb una llavor,
+de manera que un torneig sempre juga les mateixes partides. Es juguen totes les parelles
+ordenades d'agents, és a dir, cada agent juga amb "0" i amb "X" contra cada rival.
+
+El resultat és una matriu de victòries, empats i derrotes i els percentils de la latència de
+``actua`` de cada agent.
+
+Ús:
+    PYTHONPATH=src python -m tictac.torneig
+"""
+import concurrent.futures
+import dataclasses
+import math
+import os
+import random
+import time
+
+from iaLib import agent
+
+from tictac import victoria
+from tictac.victoria import FITXES
+
+PERCENTILS = (50, 90, 99)
+
+
+class AgentAleatori(agent.Agent):
+    """ Agent de referència que juga a una casella buida qualsevol.
+
+    Empra el generador global de ``random``, que el torneig inicialitza amb la llavor de cada
+    partida.
+    """
+
+    def __init__(self):
+        super(AgentAleatori, self).__init__(long_memoria=0)
+
+    def actua(self, percepcio):
+        buides = [
+            (x, y)
+            for x, fila in enumerate(percepcio["taulell"])
+            for y, casella in enumerate(fila)
+            if casella == " "
+        ]
+        if not buides:
+            return "E"
+
+        return "P", random.choice(buides)
+
+
+class Partida:
+    """ Partida sense interfície gràfica amb les regles de ``joc.Taulell``. """
+
+    def __init__(self, mida=(3, 3), dificultat=3):
+        self.mida = mida
+        self.dificultat = dificultat
+        self.bits = [0, 0]
+        self.torn = 0
+        self.acabat = False
+        self.guanyador = None
+
+        self.__linies = victoria.linies(mida, dificultat)
+        self.__ple = (1 << (mida[0] * mida[1])) - 1
+
+    @property
+    def taulell(self):
+        return victoria.VistaTaulell(self.mida, self.bits)
+
+    def percepcio(self) -> dict:
+        bits = tuple(self.bits)
+
+        return {
+            "taulell": victoria.VistaTaulell(self.mida, bits),
+            "bits": bits,
+            "mida": self.mida,
+            "torn": FITXES[self.torn % 2],
+            "dificultat": self.dificultat,
+        }
+
+    def aplica(self, accio, params=None):
+        """ Aplica l'acció del jugador que té el torn.
+
+        Args:
+            accio: "P" per posar una fitxa o "E" per no fer res.
+            params: Tupla (x, y) de la casella on es posa la fitxa.
+
+        Raises:
+            ValueError: si l'acció o els paràmetres no són vàlids.
+            agent.Trampes: si la casella ja està ocupada.
+        """
+        if self.acabat:
+            return
+
+        if accio not in ("E", "P"):
+            raise ValueError(f"Acció no existent en aquest joc: {accio}")
+
+        if accio != "E" and not isinstance(params, tuple):
+            raise ValueError(f"Paràmetres {params} per acció {accio} són incorrectes")
+
+        if accio == "P":
+            pos_x, pos_y = params
+            if not (0 <= pos_x < self.mida[0] and 0 <= pos_y < self.mida[1]):
+                raise ValueError(f"Posició {params} fora dels límits")
+            idx = pos_x * self.mida[1] + pos_y
+            if ((self.bits[0] | self.bits[1]) >> idx) & 1:
+                raise agent.Trampes("Has fet trampes: aquesta casella ja està ocupada")
+
+            jugador = self.torn % 2
+            self.bits[jugador] |= 1 << idx
+            if self.__linies.guanya(self.bits[jugador], idx):
+                self.acabat = True
+                self.guanyador = jugador
+
+        if self.bits[0] | self.bits[1] == self.__ple:
+            self.acabat = True
+        self.torn += 1
+
+
+@dataclasses.dataclass
+class Resultat:
+    """ Resultat d'un torneig.
+
+    ``matriu[a][b]`` és la tupla (victòries, empats, derrotes) de l'agent ``a`` contra ``b``,
+    sumant les partides amb totes dues fitxes. ``latencies`` conté, per a cada agent, els segons
+    de cada crida a ``actua``.
+    """
+
+    noms: list
+    matriu: dict
+    latencies: dict
+    partides: int = 0
+    trampes: int = 0
+
+    def percentils(self, nom, percentils=PERCENTILS):
+        """ Percentils (pel mètode del rang més proper) de la latència d'un agent, en segons. """
+        mostres = sorted(self.latencies[nom])
+        if not mostres:
+            return {p: 0.0 for p in percentils}
+
+        return {
+            p: mostres[max(0, math.ceil(p / 100 * len(mostres)) - 1)] for p in percentils
+        }
+
+    def __str__(self):
+        amplada = max(len(nom) for nom in self.noms) + 2
+        linies = [
+            "V/E/D de la fila contra la columna",
+            " " * amplada + "".join(f"{nom:>{amplada + 4}}" for nom in self.noms),
+        ]
+        for a in self.noms:
+            columnes = []
+            for b in self.noms:
+                if a == b:
+                    columnes.append(f"{'-':>{amplada + 4}}")
+                else:
+                    columnes.append(f"{'/'.join(map(str, self.matriu[a][b])):>{amplada + 4}}")
+            linies.append(f"{a:<{amplada}}" + "".join(columnes))
+
+        linies.append("")
+        linies.append(
+            f"{'Latència (ms)':<{amplada}}"
+            + "".join(f"{f'p{p}':>10}" for p in PERCENTILS)
+            + f"{'màx.':>10}"
+        )
+        for nom in self.noms:
+            valors = self.percentils(nom)
+            maxim = max(self.latencies[nom], default=0.0)
+            linies.append(
+                f"{nom:<{amplada}}"
+                + "".join(f"{valors[p] * 1000:>10.2f}" for p in PERCENTILS)
+                + f"{maxim * 1000:>10.2f}"
+            )
+
+        return "\n".join(linies)
+
+
+def obertura(mida, dificultat, moviments, llavor):
+    """ Jugades aleatòries inicials d'una partida, sense cap victòria.
+
+    Args:
+        mida: Tupla (files, columnes).
+        dificultat: Nombre de fitxes en línia necessàries per guanyar.
+        moviments: Nombre de jugades.
+        llavor: Llavor de la partida.
+
+    Returns:
+        Llista de posicions (x, y).
+    """
+    generador = random.Random(llavor)
+    linies = victoria.linies(mida, dificultat)
+    caselles = [(x, y) for x in range(mida[0]) for y in range(mida[1])]
+    generador.shuffle(caselles)
+
+    partida = Partida(mida, dificultat)
+    jugades = []
+    for pos_x, pos_y in caselles:
+        if len(jugades) == moviments:
+            break
+
+        # Una obertura no pot acabar la partida: es salta qualsevol jugada que guanyi.
+        idx = pos_x * mida[1] + pos_y
+        if linies.guanya(partida.bits[partida.torn % 2] | 1 << idx, idx):
+            continue
+
+        partida.aplica("P", (pos_x, pos_y))
+        jugades.append((pos_x, pos_y))
+
+    return jugades
+
+
+def juga(agents, mida=(3, 3), dificultat=3, jugades_obertura=(), llavor=None):
+    """ Juga una partida entre dos agents.
+
+    Args:
+        agents: Tupla (agent amb "0", agent amb "X").
+        mida: Tupla (files, columnes).
+        dificultat: Nombre de fitxes en línia necessàries per guanyar.
+        jugades_obertura: Jugades inicials, alternant "0" i "X".
+        llavor: Llavor del generador global de ``random`` durant la partida.
+
+    Returns:
+        Tupla (índex del guanyador o None, llista de latències de cada agent, índex de l'agent que
+        ha fet trampes o None). Qui fa trampes perd la partida.
+    """
+    if llavor is not None:
+        random.seed(llavor)
+
+    partida = Partida(mida, dificultat)
+    for pos in jugades_obertura:
+        partida.aplica("P", pos)
+
+    latencies = ([], [])
+    passades = 0
+    while not partida.acabat and passades < 2:
+        jugador = partida.torn % 2
+        inici = time.perf_counter()
+        res = agents[jugador].actua(partida.percepcio())
+        latencies[jugador].append(time.perf_counter() - inici)
+
+        accio, params = (res, None) if isinstance(res, str) else res
+        try:
+            partida.aplica(accio, params)
+        except (ValueError, agent.Trampes):
+            return jugador ^ 1, latencies, jugador
+
+        # Si cap dels dos agents no mou, la partida no pot avançar.
+        passades = passades + 1 if accio == "E" else 0
+
+    return partida.guanyador, latencies, None
+
+
+def _juga_tasca(especificacions, mida, dificultat, jugades_obertura, llavor):
+    """ Tasca d'un treballador: crea els agents i juga una partida. """
+    agents = tuple(classe(**parametres) for _, classe, parametres in especificacions)
+
+    return juga(agents, mida, dificultat, jugades_obertura, llavor)
+
+
+def torneig(
+        agents,
+        partides=100,
+        mida=(3, 3),
+        dificultat=3,
+        jugades_obertura=2,
+        llavor=2025,
+        treballadors=None,
+):
+    """ Juga totes les parelles ordenades d'agents en paral·lel.
+
+    Els agents es creen de nou a cada partida, dins el procés que la juga.
+
+    Args:
+        agents: Llista de tuples (nom, classe d'agent, paràmetres del constructor).
+        partides: Partides de cada parella ordenada (mateixes obertures per a totes).
+        mida: Tupla (files, columnes).
+        dificultat: Nombre de fitxes en línia necessàries per guanyar.
+        jugades_obertura: Jugades aleatòries inicials de cada partida.
+        llavor: Llavor del torneig.
+        treballadors: Nombre de processos. Per defecte, el nombre de CPU.
+
+    Returns:
+        Resultat amb la matriu de V/E/D i les latències.
+    """
+    noms = [nom for nom, _, _ in agents]
+    if len(set(noms)) != len(noms):
+        raise ValueError("Els noms dels agents han de ser únics")
+
+    llavors = [f"{llavor}-{i}" for i in range(partides)]
+    obertures = [
+        (obertura(mida, dificultat, jugades_obertura, llavor_partida), llavor_partida)
+        for llavor_partida in llavors
+    ]
+    resultat = Resultat(
+        noms=noms,
+        matriu={a: {b: [0, 0, 0] for b in noms if b != a} for a in noms},
+        latencies={nom: [] for nom in noms},
+    )
+
+    tasques = {}
+    with concurrent.futures.ProcessPoolExecutor(max_workers=treballadors or os.cpu_count()) as ex:
+        for a, esp_a in enumerate(agents):
+            for b, esp_b in enumerate(agents):
+                if a == b:
+                    continue
+                for jugades, llavor_partida in obertures:
+                    futur = ex.submit(
+                        _juga_tasca, (esp_a, esp_b), mida, dificultat, jugades, llavor_partida
+                    )
+                    tasques[futur] = (noms[a], noms[b])
+
+        for futur in concurrent.futures.as_completed(tasques):
+            parella = tasques[futur]
+            guanyador, latencies, trampes = futur.result()
+
+            resultat.partides += 1
+            resultat.trampes += trampes is not None
+            for nom, lats in zip(parella, latencies):
+                resultat.latencies[nom].extend(lats)
+
+            for jugador, (nom, rival) in enumerate((parella, parella[::-1])):
+                if guanyador is None:
+                    resultat.matriu[nom][rival][1] += 1
+                elif guanyador == jugador:
+                    resultat.matriu[nom][rival][0] += 1
+                else:
+                    resultat.matriu[nom][rival][2] += 1
+
+    resultat.matriu = {
+        a: {b: tuple(vde) for b, vde in fila.items()} for a, fila in resultat.matriu.items()
+    }
+
+    return resultat
+
+
+def main():
+    from tictac.solucio import agent_alfa_beta, agent_mcts, agent_taula
+
+    agents = [
+        ("aleatori", AgentAleatori, {}),
+        ("taula", agent_taula.Agent, {}),
+        ("alfa-beta", agent_alfa_beta.Agent, {"bitboard": True}),
+        ("mcts", agent_mcts.Agent, {"iteracions": 200, "temps_maxim": None, "llavor": 1}),
+    ]
+    print(torneig(agents, partides=50))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,12 @@
 
 Creat per: Miquel Miró Nicolau (UIB), 2025
 """
+import functools
+
+FITXES = ("0", "X")
+
+DIRECCIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
 
 def victoria(taulell, posicio, dificultat=3):
     """ Determina si hi ha una victòria en el taulell donada una posició i dificultat.
@@ -122,3 +128,180 @@ def __linear_check(taulell, posicio, dificultat, vertical=False):
         best_lineal = count
 
     return best_lineal >= dificultat
+
+
+class Linies:
+    """ Totes les línies guanyadores d'un taulell precalculades com a màscares de bits.
+
+    La casella ``(x, y)`` correspon al bit ``x * columnes + y``. Per a cada casella es guarden
+    també les línies que hi passen, de manera que comprovar si un moviment guanya només requereix
+    unes quantes operacions AND. ``caselles`` conté, per a cada línia, els índexs de les seves
+    caselles (per exemple, per indexar arrays de NumPy).
+    """
+
+    def __init__(self, mida, dificultat):
+        self.mida = mida
+        self.dificultat = dificultat
+
+        files, columnes = mida
+        self.linies = []
+        self.caselles = []
+        self.per_casella = [[] for _ in range(files * columnes)]
+
+        for x in range(files):
+            for y in range(columnes):
+                for d_x, d_y in DIRECCIONS:
+                    fi_x, fi_y = x + (dificultat - 1) * d_x, y + (dificultat - 1) * d_y
+                    if not (0 <= fi_x < files and 0 <= fi_y < columnes):
+                        continue
+
+                    caselles = [
+                        (x + k * d_x) * columnes + (y + k * d_y) for k in range(dificultat)
+                    ]
+                    mascara = sum(1 << idx for idx in caselles)
+
+                    self.linies.append(mascara)
+                    self.caselles.append(caselles)
+                    for idx in caselles:
+                        self.per_casella[idx].append(mascara)
+
+    def guanya(self, bits, idx) -> bool:
+        """ Comprova si les fitxes ``bits`` completen alguna línia que passa per ``idx``.
+
+        Args:
+            bits: Enter amb les fitxes d'un jugador.
+            idx: Índex del bit de la casella on s'ha jugat.
+
+        Returns:
+            Boolean: True si hi ha una línia completa, False en cas contrari.
+        """
+        for mascara in self.per_casella[idx]:
+            if bits & mascara == mascara:
+                return True
+
+        return False
+
+    def te_linia(self, bits) -> bool:
+        """ Comprova si les fitxes ``bits`` completen alguna línia del taulell. """
+        for mascara in self.linies:
+            if bits & mascara == mascara:
+                return True
+
+        return False
+
+
+class VistaTaulell:
+    """ Vista només de lectura d'un taulell guardat com a parell d'enters de bits.
+
+    S'indexa com una llista de llistes de caràcters (``vista[x][y]`` és " ", "0" o "X"), però no
+    guarda cap casella: cada consulta es calcula a partir de ``bits``, que és una tupla
+    immutable. Així el joc pot donar el taulell als agents sense copiar-lo.
+    """
+
+    __slots__ = ("mida", "bits")
+
+    def __init__(self, mida, bits):
+        self.mida = tuple(mida)
+        self.bits = tuple(bits)
+
+    def casella(self, x, y) -> str:
+        idx = x * self.mida[1] + y
+        for jugador, fitxa in enumerate(FITXES):
+            if (self.bits[jugador] >> idx) & 1:
+                return fitxa
+
+        return " "
+
+    def __len__(self):
+        return self.mida[0]
+
+    def __getitem__(self, x):
+        if not -self.mida[0] <= x < self.mida[0]:
+            raise IndexError("Fila fora del taulell")
+
+        return _FilaVista(self, x % self.mida[0])
+
+    def __iter__(self):
+        for x in range(self.mida[0]):
+            yield _FilaVista(self, x)
+
+    def a_llista(self):
+        """ Còpia del taulell com a llista de llistes de caràcters, que es pot modificar. """
+        return [list(fila) for fila in self]
+
+    def __repr__(self):
+        return str(self.a_llista())
+
+
+class _FilaVista:
+    __slots__ = ("vista", "x")
+
+    def __init__(self, vista, x):
+        self.vista = vista
+        self.x = x
+
+    def __len__(self):
+        return self.vista.mida[1]
+
+    def __getitem__(self, y):
+        columnes = self.vista.mida[1]
+        if not -columnes <= y < columnes:
+            raise IndexError("Columna fora del taulell")
+
+        return self.vista.casella(self.x, y % columnes)
+
+    def __iter__(self):
+        for y in range(self.vista.mida[1]):
+            yield self.vista.casella(self.x, y)
+
+
+@functools.cache
+def linies(mida, dificultat=3) -> Linies:
+    """ Retorna les línies guanyadores d'un taulell, calculades només el primer pic.
+
+    Args:
+        mida: Tupla (files, columnes) del taulell.
+        dificultat: Enter representant la dificultat (nombre de fitxes en línia necessàries per guanyar).
+
+    Returns:
+        Instància de ``Linies``.
+    """
+    return Linies(tuple(mida), dificultat)
+
+
+def a_bits(taulell):
+    """ Converteix una llista de llistes de caràcters en un enter de bits per a cada jugador.
+
+    Args:
+        taulell: Llista de llistes representant el taulell, o ``VistaTaulell``.
+
+    Returns:
+        Llista [bits de "0", bits de "X"].
+    """
+    if isinstance(taulell, VistaTaulell):
+        return list(taulell.bits)
+
+    columnes = len(taulell[0])
+    bits = [0, 0]
+
+    for x, fila in enumerate(taulell):
+        for y, casella in enumerate(fila):
+            if casella in FITXES:
+                bits[FITXES.index(casella)] |= 1 << (x * columnes + y)
+
+    return bits
+
+
+def hi_ha_guanyador(taulell, dificultat=3):
+    """ Determina si algun jugador té una línia completa en tot el taulell.
+
+    Args:
+        taulell: Llista de llistes representant el taulell.
+        dificultat: Enter representant la dificultat (nombre de fitxes en línia necessàries per guanyar).
+
+    Returns:
+        Boolean: True si hi ha una victòria, False en cas contrari.
+    """
+    linies_taulell = linies((len(taulell), len(taulell[0])), dificultat)
+
+    return any(linies_taulell.te_linia(bits) for bits in a_bits(taulell))
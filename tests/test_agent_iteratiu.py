@@ -0,0 +1,35 @@
+""" Proves de ``tictac.solucio.agent_iteratiu``. """
+import pytest
+
+pytest.importorskip("iaLib")
+
+from tictac.solucio import agent_iteratiu  # noqa: E402
+
+
+def _taulell_linies_llargues():
+    """ 8x8 amb dificultat 7: "0" té quatre files amb cinc fitxes obertes, però no cap amenaça
+    immediata, i la suma de les línies obertes supera ``LIMIT_GUANY``.
+    """
+    taulell = [[" "] * 8 for _ in range(8)]
+    for x in (0, 2, 4, 6):
+        for y in range(1, 6):
+            taulell[x][y] = "0"
+    for x in (1, 3, 5, 7):
+        for y in (0, 2, 4, 6, 7):
+            taulell[x][y] = "X"
+
+    return taulell
+
+
+@pytest.mark.parametrize("avaluacio_lot", [False, True])
+def test_heuristica_no_arriba_a_limit_guany(avaluacio_lot):
+    agent = agent_iteratiu.Agent(
+        temps_maxim=60, profunditat_maxima=3, amenaces=False, avaluacio_lot=avaluacio_lot
+    )
+    agent.actua(
+        {"taulell": _taulell_linies_llargues(), "torn": "X", "mida": (8, 8), "dificultat": 7}
+    )
+
+    # Sense victòria forçada, l'aprofundiment no s'ha d'aturar abans de la profunditat màxima.
+    assert agent.profunditat_assolida == 3
+
@@ -0,0 +1,32 @@
+""" Proves dels algorismes de ``cerca`` sobre el problema de les quiques. """
+import pytest
+
+from cerca import algorismes
+from quiques.problema import ProblemaQuiques
+
+CERQUES = (
+    algorismes.amplada,
+    algorismes.bidireccional,
+    algorismes.a_estrella,
+    algorismes.profunditat_iterativa,
+    algorismes.ida_estrella,
+    algorismes.rbfs,
+    algorismes.sma_estrella,
+)
+
+
+@pytest.mark.parametrize("cerca", CERQUES, ids=lambda cerca: cerca.__name__)
+def test_resol_quiques(cerca):
+    resultat = cerca(ProblemaQuiques(3, 2))
+
+    assert resultat.trobat
+    assert resultat.cost == 11
+
+
+@pytest.mark.parametrize("cerca", CERQUES, ids=lambda cerca: cerca.__name__)
+@pytest.mark.parametrize("animals, capacitat", [(4, 2), (6, 3)])
+def test_instancia_sense_solucio(cerca, animals, capacitat):
+    resultat = cerca(ProblemaQuiques(animals, capacitat))
+
+    assert not resultat.trobat
+    assert resultat.cost is None
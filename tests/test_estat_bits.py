@@ -0,0 +1,99 @@
+""" Proves de ``EstatBits``: moviments, moviments nuls, claus i jugades candidates. """
+import random
+
+import pytest
+
+from tictac import victoria
+from tictac.solucio.estat_bits import EstatBits
+
+
+def _instantania(estat):
+    return (
+        list(estat.bits),
+        estat.torn,
+        estat.clau,
+        list(estat.claus_simetria),
+        estat.candidats,
+        list(estat.accions_previes),
+        estat.guanyador(),
+    )
+
+
+def _partida_aleatoria(estat, moviments, generador):
+    for _ in range(moviments):
+        if estat.es_meta():
+            break
+        estat.mou(generador.choice(estat.accions_possibles()))
+
+
+@pytest.mark.parametrize("mida, dificultat", [((3, 3), 3), ((4, 4), 3), ((6, 6), 4)])
+def test_mou_i_desfes_restauren_l_estat(mida, dificultat):
+    generador = random.Random(1)
+    for _ in range(20):
+        estat = EstatBits(mida, "0", dificultat, simetric=True, radi=1)
+        _partida_aleatoria(estat, generador.randint(0, 5), generador)
+        abans = _instantania(estat)
+        if estat.es_meta():
+            continue
+
+        fets = 0
+        while not estat.es_meta() and fets < 4:
+            estat.mou(generador.choice(estat.accions_possibles()))
+            fets += 1
+        for _ in range(fets):
+            estat.desfes()
+
+        assert _instantania(estat) == abans
+
+
+def test_claus_incrementals_coincideixen_amb_les_calculades():
+    generador = random.Random(2)
+    estat = EstatBits((4, 4), "0", 3, simetric=True, radi=1)
+    _partida_aleatoria(estat, 6, generador)
+    nou = EstatBits((4, 4), estat.fitxa, 3, estat.bits, simetric=True, radi=1)
+
+    assert estat.clau == nou.clau
+    assert estat.claus_simetria == nou.claus_simetria
+    assert estat.candidats == nou.candidats
+
+
+def test_passa_i_desfes_passa():
+    generador = random.Random(3)
+    estat = EstatBits((4, 4), "0", 3, simetric=True, radi=1)
+    _partida_aleatoria(estat, 5, generador)
+    abans = _instantania(estat)
+
+    estat.passa()
+    nou = EstatBits((4, 4), estat.fitxa, 3, estat.bits, simetric=True, radi=1)
+    assert estat.torn != abans[1]
+    assert estat.clau == nou.clau
+    assert estat.claus_simetria == nou.claus_simetria
+
+    estat.desfes_passa()
+    assert _instantania(estat) == abans
+
+
+def test_des_de_taulell_coincideix_amb_des_de_percepcio():
+    taulell = [
+        ["0", "X", " ", " "],
+        [" ", "0", " ", " "],
+        [" ", " ", "X", " "],
+        [" ", " ", " ", " "],
+    ]
+    bits = victoria.a_bits(taulell)
+    de_taulell = EstatBits.des_de_taulell(taulell, "X", 3, simetric=True)
+
+    for percepcio in (
+        {"taulell": taulell, "torn": "X", "mida": (4, 4), "dificultat": 3},
+        {"taulell": taulell, "torn": "X", "mida": (4, 4), "dificultat": 3, "bits": bits},
+    ):
+        de_percepcio = EstatBits.des_de_percepcio(percepcio, simetric=True)
+        assert de_percepcio == de_taulell
+        assert de_percepcio.clau == de_taulell.clau
+        assert de_percepcio.claus_simetria == de_taulell.claus_simetria
+        assert de_percepcio.accions_possibles() == de_taulell.accions_possibles()
+
+
+def test_radi_zero_no_es_valid():
+    with pytest.raises(ValueError):
+        EstatBits((4, 4), "0", 3, radi=0)
@@ -0,0 +1,93 @@
+""" Proves de ``ProblemaMonedes`` i de la base de patrons de ``monedes.solucio.pdb``. """
+import itertools
+
+import pytest
+
+from cerca import algorismes
+from monedes.solucio import pdb
+from monedes.solucio.estat import Estat
+from monedes.solucio.problema import COSTOS, ProblemaMonedes
+
+SOLUCIONS = (" XXXC", "XCX CXC", "CXCX XCXC", "XCXCXC XCXCXC", "CCCCCCCCCCCCCCC ")
+
+
+def _configuracions(solucio):
+    """ Totes les fileres de la mateixa longitud que ``solucio``, amb un sol blanc. """
+    mida = len(solucio)
+    for blanc in range(mida):
+        for cares in itertools.product("CX", repeat=mida - 1):
+            monedes = list(cares)
+            monedes.insert(blanc, " ")
+            yield "".join(monedes)
+
+
+@pytest.mark.parametrize("solucio", SOLUCIONS, ids=len)
+def test_codifica_i_descodifica(solucio):
+    problema = ProblemaMonedes(solucio, solucio)
+    for monedes in (solucio, solucio[::-1], " " + "X" * (len(solucio) - 1)):
+        estat = problema.codifica(monedes)
+
+        assert problema.descodifica(estat) == monedes
+        assert estat & problema.mascara_blanc == monedes.index(" ")
+
+
+@pytest.mark.parametrize("solucio", (" XXXC", "XCX CXC"), ids=len)
+def test_successors_com_estat(solucio):
+    problema = ProblemaMonedes(solucio, solucio)
+    for monedes in _configuracions(solucio):
+        successors = [
+            (accio, problema.descodifica(fill))
+            for accio, fill in problema.successors(problema.codifica(monedes))
+        ]
+        estat = Estat(list(monedes), 0, solucio=solucio)
+        transicions = [(accio, *estat.transicio(accio)) for accio in estat.accions_possibles]
+
+        assert successors == [(accio, "".join(fill.info)) for accio, fill, _ in transicions]
+        for accio, _, pes in transicions:
+            assert problema.cost(None, accio, None) == pes
+
+
+@pytest.mark.parametrize("solucio", (" XXXC", "XCX CXC"), ids=len)
+def test_predecessors_inverteixen_successors(solucio):
+    problema = ProblemaMonedes(solucio, solucio)
+    for monedes in _configuracions(solucio):
+        estat = problema.codifica(monedes)
+        for accio, pare in problema.predecessors(estat):
+            assert (accio, estat) in set(problema.successors(pare))
+        for _, fill in problema.successors(estat):
+            assert estat in {pare for _, pare in problema.predecessors(fill)}
+
+
+def test_filera_sense_blanc():
+    with pytest.raises(ValueError):
+        ProblemaMonedes("XXXC", "XXXC")
+    with pytest.raises(ValueError):
+        ProblemaMonedes("XX C", " XXXC")
+
+
+@pytest.mark.parametrize("solucio, mida_patro", [(" XXXC", 2), ("XCX CX", 3), ("CX XCXC", 3)])
+def test_patrons_admissibles_i_consistents(solucio, mida_patro):
+    patrons = pdb.base_patrons(solucio, mida_patro)
+    problema = ProblemaMonedes(solucio, solucio, patrons)
+    costos = algorismes.costos_meta(problema)
+
+    for monedes in _configuracions(solucio):
+        estat = problema.codifica(monedes)
+        heuristica = problema.heuristica(estat)
+
+        assert patrons.valor(estat) <= costos[estat][0]
+        assert heuristica <= costos[estat][0]
+        for (tipus, _), fill in problema.successors(estat):
+            assert heuristica <= COSTOS[tipus] + problema.heuristica(fill)
+
+
+@pytest.mark.parametrize("solucio, mida_patro", [(" XXXC", 2), ("XCX CX", 3), ("CXCX XCX", 4)])
+def test_a_estrella_amb_patrons_es_optima(solucio, mida_patro):
+    patrons = pdb.base_patrons(solucio, mida_patro)
+    costos = algorismes.costos_meta(ProblemaMonedes(solucio, solucio))
+
+    for monedes in _configuracions(solucio):
+        problema = ProblemaMonedes(monedes, solucio, patrons)
+        resultat = algorismes.a_estrella(problema)
+
+        assert resultat.cost == costos[problema.estat_inicial()][0]
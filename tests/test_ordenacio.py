@@ -0,0 +1,20 @@
+""" Proves de ``tictac.solucio.ordenacio.Estadistiques``. """
+import pytest
+
+from tictac.solucio.ordenacio import Estadistiques
+
+
+@pytest.mark.parametrize("ramificacio, profunditat", [(2, 5), (3, 3), (7, 2)])
+def test_factor_ramificacio_efectiu_d_un_arbre_uniforme(ramificacio, profunditat):
+    estadistiques = Estadistiques()
+    for nivell in range(profunditat):
+        for _ in range(ramificacio ** nivell):
+            estadistiques.node(ramificacio, False, False)
+    estadistiques.fulla(profunditat, ramificacio ** profunditat)
+
+    assert estadistiques.factor_ramificacio_efectiu == pytest.approx(ramificacio)
+    assert estadistiques.fills_per_node == pytest.approx(ramificacio)
+
+
+def test_factor_ramificacio_efectiu_sense_nodes():
+    assert Estadistiques().factor_ramificacio_efectiu == 0.0